@@ -0,0 +1,68 @@
+import argparse
+import time
+
+from src.constants import PulseShape, DEFAULT_FS, DEFAULT_SPAN, DEFAULT_SYM_RATE
+from src.modules.batch_render import build_render_jobs, run_batch, export_batch_index
+from src.modules.wav_io import SAMPLE_FORMATS
+from src.modules.render_cache import RenderCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE
+
+# ===========================================================
+#   Batch Render (No-Head)
+#   Payload Files x Pulse x Span x Roll-Off x Scheme x Mapper x Carrier x Symbol Rate
+# ===========================================================
+
+DEFAULT_SCHEMES = ["2-ASK"]
+DEFAULT_MAPPERS = ["Gray"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADTx Headless Batch Renderer (WAV + JSON metadata)")
+    parser.add_argument('payloads', nargs='+', help='Payload files: bit text (.bin) or any text / binary file.')
+    parser.add_argument('--pulses', nargs='+', default=[PulseShape.RECTANGLE], choices=list(PulseShape),
+                        help='Pulse shapes.')
+    parser.add_argument('--spans', nargs='+', type=int, default=[DEFAULT_SPAN], help='Pulse spans in symbols.')
+    parser.add_argument('--roll-offs', nargs='+', type=float, default=[0.5], help='Roll-off factors (Raised Cosine).')
+    parser.add_argument('--schemes', nargs='+', default=DEFAULT_SCHEMES, help='Modulation schemes, e.g. 2-ASK 4-PSK.')
+    parser.add_argument('--mappers', nargs='+', default=DEFAULT_MAPPERS, help='Bit mappers: Gray Binary Random.')
+    parser.add_argument('--carriers', nargs='+', type=int, default=[4400], help='Carrier frequencies in Hz.')
+    parser.add_argument('--sym-rates', nargs='+', type=int, default=[DEFAULT_SYM_RATE], help='Symbol rates in Bd.')
+    parser.add_argument('--fs', type=int, default=DEFAULT_FS, help='Sample rate.')
+    parser.add_argument('--sample-format', default='int16', choices=list(SAMPLE_FORMATS), help='WAV sample format.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores).')
+    parser.add_argument('--output', default='export/batch', help='Output directory.')
+    parser.add_argument('--cache-dir', nargs='?', const=str(DEFAULT_CACHE_DIR), default=None,
+                        help=f'Reuse rendered signals from a render cache (off by default; without DIR: {DEFAULT_CACHE_DIR}). '
+                             'Entries hold float32 audio + complex64 baseband: ~580 kB per second of audio at 48 kHz, '
+                             'bounded by --cache-size.')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE // 1024 ** 2, help='Render cache bound in MB.')
+    args = parser.parse_args()
+
+    jobs = build_render_jobs(args.payloads, args.pulses, args.spans, args.roll_offs, args.schemes,
+                             args.mappers, args.carriers, args.sym_rates, fs=args.fs)
+    print(f"Rendering {len(jobs)} files --> {args.output}")
+
+    def print_result(result):
+        source = "cache" if result.cached else "render"
+        print(f"{result.audio_seconds:8.1f} s audio in {result.render_seconds:6.2f} s ({source}) | {result.path}")
+
+    cache_dir = args.cache_dir
+
+    t_start = time.perf_counter()
+    results = run_batch(jobs, args.output, sample_format=args.sample_format,
+                        workers=args.workers, progress_callback=print_result,
+                        cache_dir=cache_dir, cache_size=args.cache_size * 1024 ** 2)
+    elapsed = time.perf_counter() - t_start
+
+    export_batch_index(results, f"{args.output}/index.json")
+
+    audio_seconds = sum(result.audio_seconds for result in results)
+    print(f"{len(results)} files, {audio_seconds:.1f} s audio in {elapsed:.1f} s "
+          f"--> {audio_seconds / elapsed:.1f} s audio / s")
+
+    if cache_dir is not None:
+        cache = RenderCache(cache_dir, max_bytes=args.cache_size * 1024 ** 2)
+        print(f"Render cache {cache_dir}: {cache.size / 1024 ** 2:.1f} of {args.cache_size} MB used")
+
+
+if __name__ == '__main__':
+    main()
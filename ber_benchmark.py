@@ -0,0 +1,54 @@
+import argparse
+import time
+import numpy as np
+
+from src.modules.ber_simulation import run_ber_sweep, export_ber_results
+
+# ===========================================================
+#   BER / SER Benchmark (No-Head)
+#   Sweeps Modulation Scheme x Bit Mapper x Eb/N0
+# ===========================================================
+
+DEFAULT_SCHEMES = ["2-ASK", "4-ASK", "8-ASK", "2-PSK", "4-PSK", "8-PSK"]
+DEFAULT_MAPPERS = ["Gray", "Binary", "Random"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADTx Monte Carlo BER/SER Benchmark")
+    parser.add_argument('--schemes', nargs='+', default=DEFAULT_SCHEMES, help='Modulation schemes, e.g. 2-ASK 4-PSK.')
+    parser.add_argument('--mappers', nargs='+', default=DEFAULT_MAPPERS, help='Bit mappers: Gray Binary Random.')
+    parser.add_argument('--ebn0', nargs=3, type=float, default=[0.0, 12.0, 1.0], metavar=('START', 'STOP', 'STEP'),
+                        help='Eb/N0 range in dB (stop included).')
+    parser.add_argument('--min-errors', type=int, default=200, help='Stop a point after this many bit errors.')
+    parser.add_argument('--max-bits', type=int, default=10_000_000, help='Bit budget per point.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores).')
+    parser.add_argument('--seed', type=int, default=0, help='Base seed for reproducible runs.')
+    parser.add_argument('--output', default='ber_results.csv', help='Result file (.csv or .json).')
+    args = parser.parse_args()
+
+    start, stop, step = args.ebn0
+    ebn0_range = np.round(np.arange(start, stop + step / 2, step), 6)
+
+    def print_point(point):
+        print(f"{point.mod_scheme:>6} {point.mapper:>7} {point.ebn0_db:6.2f} dB | "
+              f"BER {point.ber:.3e}  SER {point.ser:.3e}  ({point.bit_errors} errors / {point.bits} bits)")
+
+    t_start = time.perf_counter()
+    results = run_ber_sweep(
+        args.schemes, args.mappers, ebn0_range,
+        min_errors=args.min_errors,
+        max_bits=args.max_bits,
+        workers=args.workers,
+        seed=args.seed,
+        progress_callback=print_point
+    )
+    elapsed = time.perf_counter() - t_start
+
+    export_ber_results(results, args.output)
+
+    total_bits = sum(point.bits for point in results)
+    print(f"{len(results)} points, {total_bits / 1e6:.1f} Mbit in {elapsed:.1f} s --> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,8 @@ from PySide6.QtCore import Slot
 from src.ui.intro_dialog import IntroDialog
 from src.core.AppState import AppState
 from src.constants import DEFAULT_FS, DEFAULT_SYM_RATE, DEFAULT_SPAN
+from src.modules.audio_backend import AUDIO_BACKENDS
+from src.modules.render_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE
 
 # Application Logic (Processing)
 from src.dataclasses.dataclass_models import ModSchemeLUT, PulseSignal, BasebandSignal, BandpassSignal
@@ -15,7 +17,7 @@ from src.ui.widgets import ControlWidget, MatrixWidget, MetaDataWidget, FooterWi
 from src.ui.plot_strategies import (
     PlotManager, PulsePlotStrategy, ConstellationPlotStrategy,
     BasebandPlotStrategy, BandpassPlotStrategy, FFTPlotStrategy,
-    PeriodogrammPlotStrategy, SpectogramPlotStrategy,FrequencyResponse)
+    PeriodogrammPlotStrategy, SpectogramPlotStrategy,FrequencyResponse, EyeDiagramPlotStrategy)
 
 from src.ui.style.color_pallete import LIGHT_THEME_HEX
 
@@ -68,6 +70,9 @@ class MainGUILogic(QMainWindow):
         self.bb_fft_plotter = PlotManager(self.matrix_widget.bb_spectrum_container.plot_fft)
         self.bb_fft_plotter.set_strategy(FFTPlotStrategy())
 
+        self.bb_eye_plotter = PlotManager(self.matrix_widget.bb_spectrum_container.plot_eye)
+        self.bb_eye_plotter.set_strategy(EyeDiagramPlotStrategy())
+
         # ---- Init Time Bandpass Plotter ----
         self.bandpass_plotter = PlotManager(self.matrix_widget.plot_bandpass)
         self.bandpass_plotter.set_strategy(BandpassPlotStrategy())
@@ -86,6 +91,13 @@ class MainGUILogic(QMainWindow):
         # --- 3. Initialize AppState (which may emit signals) ---
         self.app_state = AppState(initial_values)
 
+        # Plot computations run on the DSP scheduler's workers
+        for plotter in (self.pulse_time_plotter, self.pulse_fft_plotter, self.const_plotter,
+                        self.baseband_plotter, self.bb_spectrogram_plotter, self.bb_fft_plotter,
+                        self.bb_eye_plotter, self.bandpass_plotter, self.bp_spectrogram_plotter,
+                        self.bp_fft_plotter):
+            plotter.set_scheduler(self.app_state.scheduler)
+
         self._setup_connections()
 
         # --- 5. Manually trigger initial UI updates ---
@@ -123,12 +135,14 @@ class MainGUILogic(QMainWindow):
         self.ctrl_widget.sig_mod_changed.connect(self.app_state.on_mod_update)
         self.ctrl_widget.sig_bit_stream_changed.connect(self.app_state.on_bitseq_update)
         self.ctrl_widget.sig_carrier_freq_changed.connect(self.app_state.on_carrier_freq_update)
+        self.ctrl_widget.sig_channel_code_changed.connect(self.app_state.on_channel_code_update)
         self.ctrl_widget.sig_clear_plots.connect(self._clear_bitstream_plot)
         self.ctrl_widget.sig_export_pulse_path.connect(self.app_state.on_export_pulse)
 
         # ---- Connect Media Player widget signals to app_state slots ----
 
         self.ctrl_widget.sig_play_button_pressed.connect(self.app_state.on_play_btn_pressed)
+        self.ctrl_widget.sig_queue_button_pressed.connect(self.app_state.on_queue_btn_pressed)
         self.ctrl_widget.sig_stop_button_pressed.connect(self.app_state.on_stop_signal_pressed)
         self.ctrl_widget.sig_export_wav_path.connect(self.app_state.on_export_path_changed)
 
@@ -140,6 +154,11 @@ class MainGUILogic(QMainWindow):
 
         # # ---- Footer ----
         self.footer.btn_restart.clicked.connect(self.restart_application)
+        self.footer.sig_save_session_path.connect(self.app_state.on_save_session)
+        self.footer.sig_load_session_path.connect(self.app_state.on_load_session)
+        self.app_state.scheduler.job_progress.connect(self.footer.on_job_progress)
+        self.app_state.scheduler.busy_changed.connect(self.footer.on_busy_changed)
+        self.app_state.scheduler.job_failed.connect(self._on_job_failed)
 
     @Slot(PulseSignal)
     def _on_pulse_update(self, pulse_container):
@@ -157,6 +176,7 @@ class MainGUILogic(QMainWindow):
         self.baseband_plotter.update_plot(baseband_container)
         self.bb_fft_plotter.update_plot(baseband_container)
         self.bb_spectrogram_plotter.update_plot(baseband_container)
+        self.bb_eye_plotter.update_plot(baseband_container)
         #self.bb_periodogram_plotter.update_plot(baseband_container)
         # elapsed = (time.perf_counter() - start) * 1000
         # print(f"🎨 Baseband plots: {elapsed:.2f}ms")
@@ -169,8 +189,20 @@ class MainGUILogic(QMainWindow):
         # elapsed = (time.perf_counter() - start) * 1000
         # print(f"🎨 Bandpass plots: {elapsed:.2f}ms")
 
+    @Slot(str, str)
+    def _on_job_failed(self, stage, message):
+        print(f"Background job '{stage}' failed:\n{message}")
+
+    def closeEvent(self, event):
+        # Close the persistent audio stream
+        self.app_state.audio_handler.shutdown()
+        self.app_state.scheduler.shutdown()
+        super().closeEvent(event)
+
     @Slot()
     def restart_application(self):
+        self.app_state.audio_handler.shutdown()
+        self.app_state.scheduler.shutdown()
         QApplication.instance().quit()
         # Add the --no-intro flag to the arguments when restarting
         # We can remove the explicit --no-intro flag now, as argparse handles it
@@ -183,6 +215,7 @@ class MainGUILogic(QMainWindow):
         self.bb_spectrogram_plotter.clear_plot()
         #self.bb_periodogram_plotter.clear_plot()
         self.bb_fft_plotter.clear_plot()
+        self.bb_eye_plotter.clear_plot()
         self.bandpass_plotter.clear_plot()
         self.bp_spectrogram_plotter.clear_plot()
         #self.bp_periodogram_plotter.clear_plot()
@@ -230,11 +263,20 @@ def main():
     parser = argparse.ArgumentParser(description="ADTx Laboratory")
     parser.add_argument('--no-intro', action='store_true', help='Skip the intro dialog and use default values.')
     parser.add_argument('--sym-rate', type=int, default=DEFAULT_SYM_RATE, help='Set the symbol rate in sps.')
+    parser.add_argument('--audio-backend', choices=list(AUDIO_BACKENDS), default=None,
+                        help='Audio output (default: sounddevice if available, else null).')
+    parser.add_argument('--render-cache', nargs='?', const=str(DEFAULT_CACHE_DIR), default=None, metavar='DIR',
+                        help=f'Keep rendered transmit signals on disk and reuse them on Modulate (off by default; '
+                             f'without DIR: {DEFAULT_CACHE_DIR}). Entries hold float32 audio + complex64 baseband: '
+                             f'~580 kB per second of audio at 48 kHz, bounded by --render-cache-size.')
+    parser.add_argument('--render-cache-size', type=int, default=DEFAULT_CACHE_SIZE // 1024 ** 2, metavar='MB',
+                        help='Render cache bound in MB.')
     args = parser.parse_args()
 
     app = QApplication(sys.argv)
 
-    initial_values = {"sym_rate": args.sym_rate}
+    initial_values = {"sym_rate": args.sym_rate, "audio_backend": args.audio_backend,
+                      "render_cache_dir": args.render_cache, "render_cache_size": args.render_cache_size * 1024 ** 2}
 
     # Load and apply the stylesheet with the color palette
     qss_path = get_resource_path("src/ui/style/style.qss")
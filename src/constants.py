@@ -14,10 +14,14 @@
          - PHASE_SHIFT_KEYING: Represents phase shift keying (PSK).
          - ASK: Alias for AMPLITUDE_SHIFT_KEYING.
          - PSK: Alias for PHASE_SHIFT_KEYING
+     InnerCode (Enum): Defines the available bit-level channel codes (FEC).
+         - NONE: Uncoded transmission.
+         - CONVOLUTIONAL: Rate 1/2, K = 7 convolutional code.
  Constants:
      PULSE_SHAPE_MAP (dict): Maps PulseShape enum values to their string representations for UI purposes.
          - RECTANGLE: "Rectangle"
          - COSINE_SQUARED: "Cosine"
+     INNER_CODE_MAP (dict): Maps InnerCode enum values to their UI names.
      DEFAULT_FS (int): The default sampling frequency (in Hz) used in the application.
      DEFAULT_SYM_RATE (int): The default symbol rate used in the application.
      AVAILABLE_FS (list): A list of available sampling frequencies (in Hz) supported by the application.
@@ -59,6 +63,16 @@ MOD_SCHEME_MAP = {
     ModulationScheme.PHASE_SHIFT_KEYING: "PSK",
 }
 
+class InnerCode(StrEnum):
+    """Defines the available bit-level channel codes (FEC)."""
+    NONE = auto()
+    CONVOLUTIONAL = auto()
+
+INNER_CODE_MAP = {
+    InnerCode.NONE: "None",
+    InnerCode.CONVOLUTIONAL: "Convolutional (r=1/2, K=7)",
+}
+
 # ===========================================================
 #   App Start-Up Parameters
 # ===========================================================
@@ -6,16 +6,20 @@ import time
 from pathlib import Path
 from functools import wraps
 
-from src.constants import PulseShape, MOD_SCHEME_MAP
+from src.constants import PulseShape, MOD_SCHEME_MAP, InnerCode
 from src.dataclasses.dataclass_models import BasebandSignal, BandpassSignal, BitStream, ModSchemeLUT, PulseSignal, SymbolStream
-from src.modules.pulse_shapes import CosineSquarePulse, RectanglePulse, RaisedCosinePulse
-from src.modules.bit_mapping import BinaryMapper, GrayMapper, RandomMapper
-from src.modules.modulation_schemes import AmpShiftKeying, PhaseShiftKeying
+from src.dataclasses.container_io import save_container, save_containers, load_containers, FILE_SUFFIX
+from src.modules.pulse_shapes import RectanglePulse
 from src.modules.symbol_sequencer import SymbolSequencer
-from src.modules.baseband_modulator import BasebandSignalGenerator
 from src.modules.quadrature_modulator import QuadratureModulator
 from src.modules.audio_player import AudioPlaybackHandler
-from src.modules.helper_functions import export_transmitted_signal, add_barker_code
+from src.modules.audio_backend import create_audio_backend
+from src.modules.multichannel import split_bits, create_channel_signals, stack_channels
+from src.modules.render_cache import RenderCache, render_key, DEFAULT_CACHE_SIZE
+from src.modules.packetizer import code_and_pad_bits, create_framed_bandpass_signal
+from src.core.job_scheduler import JobScheduler
+from src.modules.channel_coding import ChannelCode, ConvolutionalCode, ReedSolomonCode
+from src.modules.helper_functions import export_transmitted_signal, add_barker_code, create_mod_scheme_lut, create_barker_symbols, create_pulse_signal
 
 from src.constants import DEFAULT_FS, DEFAULT_SPAN
 
@@ -66,13 +70,36 @@ class AppState(QObject):
         # self.INTERNAL_SPS = self.SPS // self.INTERPOLATION_FACTOR
         # self.INTERNAL_FS = self.FS // self.INTERPOLATION_FACTOR
 
-        self.audio_handler = AudioPlaybackHandler()
+        self.audio_handler = AudioPlaybackHandler(backend=create_audio_backend(initial_values.get("audio_backend")))
         # self.audio_handler.playback_started.connect(self._on_playback_started)
         # self.audio_handler.playback_finished.connect(self._on_playback_finished)
         # self.audio_handler.playback_error.connect(self._on_playback_error)
+        self.audio_handler.playback_stats.connect(self._on_playback_stats)
+        self.audio_handler.item_finished.connect(self._on_transmission_finished)
 
         self.map_mod_scheme = MOD_SCHEME_MAP
 
+        # Rendered transmit signals on disk, shared with the batch renderer (opt-in: --render-cache)
+        cache_dir = initial_values.get("render_cache_dir")
+        self.render_cache: RenderCache = None if cache_dir is None else RenderCache(
+            cache_dir, max_bytes=initial_values.get("render_cache_size", DEFAULT_CACHE_SIZE))
+
+        # DSP chain (and plot computations) on worker threads, newest request per stage wins
+        self.scheduler = JobScheduler(parent=self)
+        self._pending_carrier_freq = None
+
+        # Payload bits per CRC-32 frame (Packetizer), None: one unframed transmission
+        self.frame_bits = None
+
+        # Output channels: the Bitstream is split over them, one transmit signal each
+        self.channels = 1
+        self.current_channel_signals: np.ndarray = None     # (samples x channels), None: mono
+
+        # Optional FEC between Bitstream and Symbol Sequencer
+        # Outer (byte level, burst errors) --> Inner (bit level)
+        self.outer_code: ChannelCode = None
+        self.inner_code: ChannelCode = None
+
         # Initialize current Interactive Signals
         self.current_pulse_signal: PulseSignal = self._init_default_pulse()
         self.current_mod_scheme: ModSchemeLUT = self._init_default_mod_scheme()
@@ -83,21 +110,10 @@ class AppState(QObject):
         self.barker_baseband = None
 
     def init_barker_preemble(self):
-        # 1. Get the current Look-Up Table (Dictionary)
-        # Accessing the codebook generated by your ASK/PSK classes
-        lut = self.current_mod_scheme.look_up_table
+        # 1. Map the Barker bits to the two most "Distant" symbols of the current LUT
+        barker_symbols = create_barker_symbols(self.current_mod_scheme)
 
-        # 2. Pick the two most "Distant" symbols for maximum Barker contrast
-        # We find the symbols with the minimum and maximum real values
-        symbols = list(lut.values())
-        s_min = symbols[np.argmin(np.real(symbols))]
-        s_max = symbols[np.argmax(np.real(symbols))]
-
-        # 3. Map Barker bits to these specific Complex Symbols
-        barker_bits = np.array([1, 1, 1, 0, 0, 1, 0])
-        barker_symbols = np.where(barker_bits == 1, s_max, s_min)
-
-        # 4. Generate the "Hidden" Barker Baseband
+        # 2. Generate the "Hidden" Barker Baseband
         # This uses the specific generate() method from your Rectangle/RC pulse classes
         self.barker_baseband = signal.upfirdn(
             h = self.current_pulse_signal.data,
@@ -128,18 +144,7 @@ class AppState(QObject):
 
     def _init_default_mod_scheme(self):
 
-        mapper = BinaryMapper()
-
-        lut_data = AmpShiftKeying(2, mapper=mapper).codebook
-
-        self.current_mod_scheme = ModSchemeLUT(
-            name=f"2-ASK LUT",
-            data=None,
-            look_up_table=lut_data,
-            cardinality = 2,
-            mapper = "Binary",
-            mod_scheme="2-ASK",
-        )
+        self.current_mod_scheme = create_mod_scheme_lut("2-ASK", "Binary")
 
         self.sig_mod_lut_changed.emit(self.current_mod_scheme)
         return self.current_mod_scheme
@@ -154,44 +159,18 @@ class AppState(QObject):
             print("Missing required pulse parameters: 'pulse_type' or 'span'")
             return
 
-        pulse_generators = {
-            PulseShape.RECTANGLE: RectanglePulse,
-            PulseShape.COSINE_SQUARED: CosineSquarePulse,
-            PulseShape.RAISED_COSINE: RaisedCosinePulse,
-        }
-
-        # Validate if shape is available
-        generator_cls = pulse_generators.get(pulse_type)
-        if not generator_cls:
-            print(f"Unknown Pulse Shape: {pulse_type}")
-            return
-
-        # Create Generator Object
+        # Create Pulse Container (Generator selected by shape)
         try:
-            generator = generator_cls(self.SYM_RATE, self.FS, span, roll_off)
-            pulse_data = generator.generate()  # Generate the actual data
+            self.current_pulse_signal = create_pulse_signal(pulse_type, self.SYM_RATE, self.FS, span, roll_off)
         except Exception as e:
             print(f"Failed to generate pulse: {e}")
             return
 
-        # Update current pulse signal
-        self.current_pulse_signal = PulseSignal(
-            name=f"{pulse_type} Pulse",
-            data=pulse_data,
-            fs=self.FS,
-            sym_rate=self.SYM_RATE,
-            shape=pulse_type,
-            span=span
-        )
-
         # Emit signal to notify GUI
         self.sig_pulse_changed.emit(self.current_pulse_signal)
 
-        try:
-            if isinstance(self.current_symbol_stream, SymbolStream):
-                self.update_baseband_signal()
-        except:
-            pass
+        if hasattr(self, 'current_bitstream'):
+            self.update_baseband_signal()
 
 
     def on_mod_update(self, partial_data):
@@ -199,38 +178,7 @@ class AppState(QObject):
         sel_mod_scheme = partial_data.get("mod_scheme")
         sel_mapper = partial_data.get("bit_mapping")
 
-        if sel_mapper == "Binary":
-            mapper = BinaryMapper()
-        elif sel_mapper == "Gray":
-            mapper = GrayMapper()
-        elif sel_mapper == "Random":
-            mapper = RandomMapper()
-        else:
-            raise ValueError(f"Unsupported bit mapping: {sel_mapper}")
-
-        if sel_mod_scheme == "2-ASK":
-            lut_data = AmpShiftKeying(2, mapper=mapper).codebook
-        elif sel_mod_scheme == "4-ASK":
-            lut_data = AmpShiftKeying(4, mapper=mapper).codebook
-        elif sel_mod_scheme == "8-ASK":
-            lut_data = AmpShiftKeying(8, mapper=mapper).codebook
-        elif sel_mod_scheme =="2-PSK":
-            lut_data = PhaseShiftKeying(2, mapper=mapper).codebook
-        elif sel_mod_scheme =="4-PSK":
-            lut_data = PhaseShiftKeying(4, mapper=mapper).codebook
-        elif sel_mod_scheme =="8-PSK":
-            lut_data = PhaseShiftKeying(8, mapper=mapper).codebook
-        else:
-            raise ValueError(f"Unsupported modulation scheme: {sel_mod_scheme}")
-
-        self.current_mod_scheme = ModSchemeLUT(
-            name=f"{sel_mod_scheme} LUT",
-            data=None,
-            look_up_table=lut_data,
-            cardinality = int(sel_mod_scheme.split("-")[0]),
-            mapper = sel_mapper,
-            mod_scheme=sel_mod_scheme
-        )
+        self.current_mod_scheme = create_mod_scheme_lut(sel_mod_scheme, sel_mapper)
 
         self.sig_mod_lut_changed.emit(self.current_mod_scheme)
 
@@ -263,56 +211,119 @@ class AppState(QObject):
         self.update_symbol_stream()
 
 
+    def on_channel_code_update(self, partial_data):
+        inner_code = partial_data.get("inner_code", InnerCode.NONE)
+
+        inner_codes = {
+            InnerCode.NONE: None,
+            InnerCode.CONVOLUTIONAL: ConvolutionalCode,
+        }
+
+        if inner_code not in inner_codes:
+            print(f"Unknown Channel Code: {inner_code}")
+            return
+
+        # Build both codes first: an invalid selection keeps the current codes untouched
+        code_cls = inner_codes[inner_code]
+        new_inner_code = code_cls() if code_cls else None
+
+        new_outer_code = None
+        if partial_data.get("outer_rs", False):
+            try:
+                new_outer_code = ReedSolomonCode(nsym=partial_data.get("rs_parity", 32))
+            except ValueError as e:
+                print(f"Invalid Reed-Solomon parameters: {e}")
+                return
+
+        self.inner_code, self.outer_code = new_inner_code, new_outer_code
+
+        if hasattr(self, 'current_bitstream'):
+            self.update_symbol_stream()
+
+
+    @staticmethod
+    def _encode_bitstream(bitstream: BitStream, mod_scheme: ModSchemeLUT, codes) -> BitStream:
+        """
+        Applies the selected channel codes and zero pads to full symbols,
+        the same rule as the batch renderer (`code_and_pad_bits`).
+        Without code and padding the Bitstream is passed through.
+        """
+        mapped_bits = code_and_pad_bits(bitstream.data, mod_scheme, codes)
+        if not codes and len(mapped_bits) == len(bitstream.data):
+            return bitstream
+
+        label = ' + '.join(code.name for code in codes) if codes else "Padded to full Symbols"
+        return BitStream(
+            name=f"Coded Bit Stream: {label}",
+            data=mapped_bits
+        )
+
+
     #@profile_method
     def update_symbol_stream(self):
-        """Generates a new symbol stream and triggers a baseband signal update."""
+        """
+        Requests a new symbol stream + baseband signal from the current bits,
+        mod scheme, pulse and channel codes. Runs in the background; only the
+        newest request is delivered (`_on_baseband_rendered`).
+        """
 
         if not hasattr(self, 'current_bitstream') or self.current_bitstream.data is None:
             return
 
+        codes = [code for code in (self.outer_code, self.inner_code) if code is not None]
 
-        # Create Symbol Sequence with Symbol Sequencer Module
-        symbol_stream_data = SymbolSequencer(self.current_mod_scheme).map_bits_to_symbols(self.current_bitstream.data)
-
-        self.current_symbol_stream = SymbolStream(
-            name="Current Symbol Stream",
-            data=symbol_stream_data,
-            mod_scheme=self.current_mod_scheme,
-            bit_stream=self.current_bitstream
+        self.scheduler.submit(
+            "baseband", self._render_baseband,
+            self.current_bitstream, self.current_mod_scheme, self.current_pulse_signal, codes, self.SPS,
+            on_result=self._on_baseband_rendered,
+            cancels=("bandpass",)               # A bandpass of the old baseband is stale
         )
 
-        # Automatically update the baseband signal after the symbol stream is updated
-        self.update_baseband_signal()
-
 
     #@profile_method
     def update_baseband_signal(self):
-        """Generates a new baseband signal."""
-        if not hasattr(self, 'current_symbol_stream') or not hasattr(self, 'current_pulse_signal'):
-            return
+        """Generates a new baseband signal (pulse changed). The chain restarts at the bits,
+        so a symbol stream request that is still running is not lost."""
+        self.update_symbol_stream()
 
-        # Init Baseband generator with active Pulse Object
-        baseband_gen_obj = BasebandSignalGenerator(self.current_pulse_signal)
 
-        # Generate Baseband Signal
-        #bb_data = baseband_gen_obj.generate_baseband_signal(self.current_symbol_stream)
+    @staticmethod
+    def _render_baseband(job, bitstream: BitStream, mod_scheme: ModSchemeLUT, pulse: PulseSignal, codes, sps):
+        """Channel Codes --> Symbol Sequencer --> Pulse Shaping (worker thread, no AppState access)."""
+        coded_bitstream = AppState._encode_bitstream(bitstream, mod_scheme, codes)
+        job.report(0.2)
 
-        bb_data = signal.upfirdn(
-            h = self.current_pulse_signal.data,
-            x = self.current_symbol_stream.data,
-            up= self.SPS)
+        # Create Symbol Sequence with Symbol Sequencer Module
+        symbol_stream = SymbolStream(
+            name="Current Symbol Stream",
+            data=SymbolSequencer(mod_scheme).map_bits_to_symbols(coded_bitstream.data),
+            mod_scheme=mod_scheme,
+            bit_stream=coded_bitstream
+        )
+        job.report(0.4)
 
-        self.current_baseband_signal = BasebandSignal (
+        bb_data = signal.upfirdn(h=pulse.data, x=symbol_stream.data, up=sps)
+        job.report(1.0)
+
+        return BasebandSignal(
             name = "Current Baseband Signal",
             data = bb_data,
-            fs = self.FS,
-            sym_rate = self.SYM_RATE,
-            pulse = self.current_pulse_signal,
-            symbol_stream = self.current_symbol_stream
+            fs = pulse.fs,
+            sym_rate = pulse.sym_rate,
+            pulse = pulse,
+            symbol_stream = symbol_stream
         )
 
+
+    def _on_baseband_rendered(self, baseband_signal: BasebandSignal):
+        self.current_symbol_stream = baseband_signal.symbol_stream
+        self.current_baseband_signal = baseband_signal
         self.sig_baseband_changed.emit(self.current_baseband_signal)
 
+        # Modulate was pressed while the baseband was still being rendered
+        if self._pending_carrier_freq is not None:
+            self._request_bandpass(self._pending_carrier_freq)
+
 
     #@profile_method
     def on_carrier_freq_update(self, partial_data):
@@ -327,46 +338,211 @@ class AppState(QObject):
             print(f"Invalid carrier frequency value: {carrier_freq}")
             return
 
+        self.frame_bits = partial_data.get("frame_bits")
+        self.channels = max(int(partial_data.get("channels", 1)), 1)
+
+        # Rendered before --> straight from the render cache, no job and no wait for the baseband
+        cache_key = self._transmit_cache_key(carrier_freq)
+        cached_signal = self.render_cache.get(cache_key) if cache_key is not None else None
+        if cached_signal is not None:
+            self.scheduler.cancel("bandpass")
+            self._on_bandpass_rendered(cached_signal)
+            return
+
+        # The baseband is still being rendered --> modulate as soon as it is delivered
+        self._pending_carrier_freq = carrier_freq
+        if self.scheduler.is_busy("baseband"):
+            return
+
+        if not hasattr(self, 'current_baseband_signal'):
+            print("No baseband signal available to modulate.")
+            self._pending_carrier_freq = None
+            return
+
+        self._request_bandpass(carrier_freq)
+
+
+    def _transmit_cache_key(self, carrier_freq):
+        """
+        Render cache key of the requested transmit signal, computed from the
+        inputs only (bits, codes, pulse, scheme, carrier, framing).
+        None: not cached (cache off, multichannel or no bits).
+        """
+        if self.render_cache is None or self.channels > 1:
+            return None
+        if not hasattr(self, 'current_bitstream') or len(self.current_bitstream.data) == 0:
+            return None
+
+        codes = [code for code in (self.outer_code, self.inner_code) if code is not None]
+        framing = None if self.frame_bits is None else {"payload_bits": int(self.frame_bits)}
+
+        return render_key(self.current_bitstream.data, self.current_mod_scheme, self.current_pulse_signal,
+                          carrier_freq, codes=codes, framing=framing)
+
+
+    def _request_bandpass(self, carrier_freq):
         # Init Barker Preemble
         self.init_barker_preemble()
 
-        self.current_baseband_signal.data = np.concatenate((self.barker_baseband, self.current_baseband_signal.data))
+        # Stored by the job after rendering
+        cache_key = self._transmit_cache_key(carrier_freq)
+
+        if self.channels > 1:
+            # Multichannel: one independent transmit signal per output channel
+            codes = [code for code in (self.outer_code, self.inner_code) if code is not None]
+            self.scheduler.submit(
+                "bandpass", self._render_channels,
+                self.current_bitstream, self.current_mod_scheme, self.current_pulse_signal, codes,
+                carrier_freq, self.channels, self.frame_bits,
+                on_result=self._on_channels_rendered
+            )
+            return
+
+        if self.frame_bits is not None:
+            # Packetized: every frame is coded, shaped and modulated on its own (from the bits)
+            codes = [code for code in (self.outer_code, self.inner_code) if code is not None]
+            self.scheduler.submit(
+                "bandpass", self._render_framed_bandpass,
+                self.current_bitstream, self.current_mod_scheme, self.current_pulse_signal, codes,
+                carrier_freq, self.frame_bits, self.render_cache, cache_key,
+                on_result=self._on_bandpass_rendered
+            )
+            return
+
+        self.scheduler.submit(
+            "bandpass", self._render_bandpass,
+            self.current_baseband_signal, self.barker_baseband, carrier_freq, self.render_cache, cache_key,
+            on_result=self._on_bandpass_rendered
+        )
+
+
+    @staticmethod
+    def _render_bandpass(job, baseband: BasebandSignal, barker_baseband, carrier_freq,
+                         render_cache: RenderCache = None, cache_key: str = None):
+        """Barker Preamble + IQ Modulation, stored in the render cache if given (worker thread, no AppState access)."""
+        symbol_stream = baseband.symbol_stream
+        job.report(0.1)
+
+        # Preamble in front of a new Baseband container, the current one stays untouched
+        transmit_baseband = BasebandSignal(
+            name = "Transmit Baseband Signal",
+            data = np.concatenate((barker_baseband, baseband.data)),
+            fs = baseband.fs,
+            sym_rate = baseband.sym_rate,
+            pulse = baseband.pulse,
+            symbol_stream = symbol_stream
+        )
 
         # IQ Modulation
-        iq_data = QuadratureModulator(carrier_freq).modulate(self.current_baseband_signal)
+        iq_data = QuadratureModulator(carrier_freq).modulate(transmit_baseband)
+        job.report(0.8)
 
-        self.current_bandpass_signal = BandpassSignal (
+        bandpass_signal = BandpassSignal (
             name = "Current Bandpass Signal",
             data = iq_data,
-            fs = self.FS,
-            sym_rate = self.SYM_RATE,
-            baseband_signal = self.current_baseband_signal,
+            fs = baseband.fs,
+            sym_rate = baseband.sym_rate,
+            baseband_signal = transmit_baseband,
             carrier_freq = carrier_freq
         )
+        if render_cache is not None and cache_key is not None:
+            render_cache.put(cache_key, bandpass_signal)
+        job.report(1.0)
+
+        return bandpass_signal
+
+
+    @staticmethod
+    def _render_framed_bandpass(job, bitstream: BitStream, mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                                codes, carrier_freq, frame_bits, render_cache: RenderCache = None, cache_key: str = None):
+        """Packetizer --> per frame Channel Codes + Preamble + IQ Modulation (worker thread, no process pool)."""
+        job.report(0.1)
+        bandpass_signal = create_framed_bandpass_signal(bitstream.data, mod_scheme, pulse, carrier_freq,
+                                                        payload_bits=frame_bits, codes=codes, workers=1)
+        if render_cache is not None and cache_key is not None:
+            render_cache.put(cache_key, bandpass_signal)
+        job.report(1.0)
+
+        return bandpass_signal
+
+
+    @staticmethod
+    def _render_channels(job, bitstream: BitStream, mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                         codes, carrier_freq, channels, frame_bits):
+        """Bitstream split over the output channels, one transmit signal each (worker thread)."""
+        channels = min(channels, max(len(bitstream.data), 1))      # No channel without bits
+        job.report(0.1)
+        signals = create_channel_signals(split_bits(bitstream.data, channels), mod_scheme, pulse,
+                                         carrier_freq, codes, frame_bits)
+        job.report(0.9)
+
+        return signals, stack_channels([bandpass.data for bandpass in signals])
+
+
+    def _on_bandpass_rendered(self, bandpass_signal: BandpassSignal):
+        self._pending_carrier_freq = None
+        self.current_channel_signals = None
+        self.current_bandpass_signal = bandpass_signal
+        self.sig_bandpass_changed.emit(self.current_bandpass_signal)
+
+
+    def _on_channels_rendered(self, result):
+        """Plots show the first channel, Play / Queue / Export use all channels."""
+        signals, stacked = result
+        self._pending_carrier_freq = None
+        self.current_channel_signals = stacked
+        self.current_bandpass_signal = signals[0]
         self.sig_bandpass_changed.emit(self.current_bandpass_signal)
 
 
     #@profile_method
     def play_audio(self):
         """
-        Plays the real part of the current bandpass signal if it exists.
+        Streams the current transmit signal (the plotted / exported bandpass
+        container) to the sound card, normalized to its own peak.
         """
-        if hasattr(self, 'current_bandpass_signal') and self.current_bandpass_signal.data is not None:
-            # Audio hardware typically plays real-valued signals.
-            # We take the real part of the complex bandpass signal.
-            audio_data = np.real(self.current_bandpass_signal.data)
-            self.audio_handler.play(audio_data, self.FS)
+        if self.current_channel_signals is not None:
+            self.audio_handler.play(self.current_channel_signals, self.FS)
+        elif hasattr(self, 'current_bandpass_signal') and self.current_bandpass_signal.data is not None:
+            self.audio_handler.play(np.real(self.current_bandpass_signal.data), self.FS)
         else:
             self.sig_playback_status_changed.emit("Error: No signal generated to play.")
         # TODO UI Feedbacks please not in AppState
 
 
+    def queue_audio(self):
+        """
+        Appends the current transmit signal to the gapless transmit queue.
+        Queued signals are sent back to back while the queue is running.
+        """
+        if hasattr(self, 'current_bandpass_signal') and self.current_bandpass_signal.data is not None:
+            item = self.current_bandpass_signal if self.current_channel_signals is None else self.current_channel_signals
+            item_id = self.audio_handler.enqueue(item, self.FS)
+            self.sig_playback_status_changed.emit(f"Transmission {item_id} queued")
+        else:
+            self.sig_playback_status_changed.emit("Error: No signal generated to queue.")
+
+
+    def _on_playback_stats(self, stats):
+        self.sig_playback_status_changed.emit(f"Playback finished: {stats}")
+
+
+    def _on_transmission_finished(self, item_id):
+        self.sig_playback_status_changed.emit(f"Transmission {item_id} sent")
+
+
     @Slot()
     def on_play_btn_pressed(self):
         """ Slot to be connected to the UI's play button. """
         self.play_audio()
 
 
+    @Slot()
+    def on_queue_btn_pressed(self):
+        """ Slot to be connected to the UI's queue button. """
+        self.queue_audio()
+
+
     @Slot()
     def on_stop_signal_pressed(self):
         """ Slot to be connected to the UI's stop button. """
@@ -375,6 +551,12 @@ class AppState(QObject):
 
     def clear_signals(self):
         """Clear baseband and bandpass signal data to free memory and prevent orphaned objects."""
+        # Results of running jobs would bring the data back
+        self.scheduler.cancel("baseband")
+        self.scheduler.cancel("bandpass")
+        self._pending_carrier_freq = None
+        self.current_channel_signals = None
+
         # Delete the actual data objects
         if hasattr(self, 'current_baseband_signal'):
             del self.current_baseband_signal
@@ -403,24 +585,84 @@ class AppState(QObject):
 
             file_path = str(p.parent.resolve())
 
-            export_transmitted_signal(self.current_bandpass_signal, file_name, file_path)
+            # Multichannel: one WAV channel per output channel
+            export_transmitted_signal(self.current_bandpass_signal, file_name, file_path, data=self.current_channel_signals)
 
         except Exception as e:
             print(f"Error during WAV file export: {e}")
 
     @Slot()
     def on_export_pulse(self, path):
-        # 1. Convert the dataclass to a JSON string
-        json_string = self.current_pulse_signal.to_json(indent=4)
-
-        # 2. Physically write that string to the file path
+        """ Saves the current pulse as binary container (raw samples + JSON header). """
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(json_string)
-            print(f"File successfully saved to: {path}")
+            p = Path(path)
+            if p.suffix.lower() != FILE_SUFFIX:
+                p = p.with_suffix(FILE_SUFFIX)
+
+            save_container(p, self.current_pulse_signal)
+            print(f"File successfully saved to: {p}")
         except Exception as e:
             print(f"Error saving file: {e}")
 
+
+    # Session entries: name in the file --> AppState attribute
+    SESSION_CONTAINERS = {
+        "pulse": "current_pulse_signal",
+        "mod_scheme": "current_mod_scheme",
+        "bit_stream": "current_bitstream",
+        "symbol_stream": "current_symbol_stream",
+        "baseband": "current_baseband_signal",
+        "bandpass": "current_bandpass_signal",
+    }
+
+    @Slot()
+    def on_save_session(self, path):
+        """ Saves all current containers into one binary container file (shared containers stored once). """
+        session = {name: getattr(self, attr) for name, attr in self.SESSION_CONTAINERS.items() if hasattr(self, attr)}
+
+        try:
+            p = Path(path)
+            if p.suffix.lower() != FILE_SUFFIX:
+                p = p.with_suffix(FILE_SUFFIX)
+
+            save_containers(p, session)
+            self.sig_playback_status_changed.emit(f"Session saved to: {p}")
+        except Exception as e:
+            print(f"Error saving session: {e}")
+
+
+    @Slot()
+    def on_load_session(self, path):
+        """ Restores a saved session. The sample arrays are memory-mapped, not read. """
+        try:
+            session = load_containers(path)
+        except Exception as e:
+            print(f"Error loading session: {e}")
+            return
+
+        if not isinstance(session, dict) or "pulse" not in session or "mod_scheme" not in session:
+            print(f"Not a session file: {path}")
+            return
+
+        self.clear_signals()
+        self.scheduler.cancel_all()
+        for name, attr in self.SESSION_CONTAINERS.items():
+            if name in session:
+                setattr(self, attr, session[name])
+
+        self.SYM_RATE = self.current_pulse_signal.sym_rate
+        self.SPS = self.FS // self.SYM_RATE
+        self.init_barker_preemble()
+
+        self.sig_pulse_changed.emit(self.current_pulse_signal)
+        self.sig_mod_lut_changed.emit(self.current_mod_scheme)
+        if hasattr(self, 'current_baseband_signal'):
+            self.sig_baseband_changed.emit(self.current_baseband_signal)
+        if hasattr(self, 'current_bandpass_signal'):
+            self.sig_bandpass_changed.emit(self.current_bandpass_signal)
+
+        self.sig_playback_status_changed.emit(f"Session loaded from: {path}")
+
 # TODO Reorga Dataclasses for export
 # TODO Frequency Response for Pulse
 # TODO Create Start Chirp?
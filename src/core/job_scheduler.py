@@ -0,0 +1,203 @@
+'''
+Background Job Scheduler.
+
+Runs the DSP chain and the plot computations on worker threads, so long
+messages do not freeze the window. Jobs are grouped in stages
+("baseband", "bandpass", one per plot):
+
+    - Only the newest request per stage counts: a new submit replaces
+      the pending job of its stage and cancels the running one.
+    - A stage can cancel dependent stages (new baseband --> the bandpass
+      in progress is stale).
+    - Results are delivered on the GUI thread, and only if the job was
+      not superseded meanwhile.
+
+Job functions are called as `fn(job, *args)`. Long jobs call
+`job.report(fraction)` between steps: it emits the progress and raises
+JobCancelled if the job is stale, so it stops early.
+
+'''
+
+from collections import defaultdict
+import threading
+import traceback
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when a newer request replaced the job."""
+
+
+class Job:
+
+    def __init__(self, scheduler, stage: str, generation: int, fn, args, on_result):
+        self.scheduler = scheduler
+        self.stage = stage
+        self.generation = generation
+        self.fn = fn
+        self.args = args
+        self.on_result = on_result
+
+    @property
+    def cancelled(self) -> bool:
+        return self.scheduler.generation(self.stage) != self.generation
+
+    def check(self):
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, fraction: float):
+        """Progress of this job (0 ... 1). Stops the job if it was cancelled."""
+        self.check()
+        self.scheduler.job_progress.emit(self.stage, float(fraction))
+
+
+class JobScheduler(QObject):
+    """
+    Signals:
+        job_finished(stage, result): After the result callback, GUI thread
+        job_failed(stage, message)
+        job_progress(stage, fraction)
+        busy_changed(busy): Jobs pending / running or all done
+    """
+
+    job_finished = Signal(str, object)
+    job_failed = Signal(str, str)
+    job_progress = Signal(str, float)
+    busy_changed = Signal(bool)
+
+    _job_done = Signal(object, object)      # Worker --> GUI thread (job, result)
+
+    def __init__(self, workers: int = 2, parent=None):
+        super().__init__(parent)
+
+        self._condition = threading.Condition()
+        self._pending = {}                      # Stage --> newest job (insertion order = FIFO)
+        self._running = set()                   # Stages with a running job
+        self._delivering = defaultdict(int)     # Stage --> finished jobs not yet delivered to the GUI thread
+        self._generations = defaultdict(int)
+        self._busy = False
+        self._shutdown = False
+
+        self._job_done.connect(self._deliver)
+
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    # ---- API (GUI thread) ----
+    def submit(self, stage: str, fn, *args, on_result=None, cancels=()) -> Job:
+        """
+        Schedules `fn(job, *args)` as newest job of `stage`.
+
+        Args:
+            on_result: Called with the result on the GUI thread (not for cancelled jobs)
+            cancels: Stages whose jobs become stale with this request
+        """
+        with self._condition:
+            for other in cancels:
+                self._cancel_locked(other)
+
+            self._generations[stage] += 1
+            job = Job(self, stage, self._generations[stage], fn, args, on_result)
+
+            self._pending.pop(stage, None)      # Re-insert: the newest request runs last
+            self._pending[stage] = job
+            self._condition.notify()
+
+        self._update_busy()
+        return job
+
+    def cancel(self, stage: str):
+        with self._condition:
+            self._cancel_locked(stage)
+        self._update_busy()
+
+    def cancel_all(self):
+        with self._condition:
+            for stage in list(self._generations):
+                self._cancel_locked(stage)
+        self._update_busy()
+
+    def generation(self, stage: str) -> int:
+        return self._generations[stage]
+
+    def is_busy(self, stage: str = None) -> bool:
+        with self._condition:
+            if stage is None:
+                return bool(self._pending or self._running or any(self._delivering.values()))
+            return stage in self._pending or stage in self._running or self._delivering[stage] > 0
+
+    def shutdown(self):
+        self.cancel_all()
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+
+    # ---- Internals ----
+    def _cancel_locked(self, stage: str):
+        self._generations[stage] += 1
+        self._pending.pop(stage, None)
+
+    def _update_busy(self):
+        busy = self.is_busy()
+        if busy != self._busy:
+            self._busy = busy
+            self.busy_changed.emit(busy)
+
+    def _next_job(self) -> Job:
+        """Oldest pending job of a stage that is not running (one job per stage at a time)."""
+        with self._condition:
+            while True:
+                if self._shutdown:
+                    return None
+                for stage, job in self._pending.items():
+                    if stage not in self._running:
+                        del self._pending[stage]
+                        self._running.add(stage)
+                        return job
+                self._condition.wait()
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            result, failed = None, False
+            try:
+                job.check()
+                result = job.fn(job, *job.args)
+            except JobCancelled:
+                result = JobCancelled
+            except Exception:
+                failed = True
+                self.job_failed.emit(job.stage, traceback.format_exc())
+
+            with self._condition:
+                self._running.discard(job.stage)
+                self._delivering[job.stage] += 1
+                self._condition.notify_all()
+
+            # Failed jobs are delivered as cancelled: no result, only the busy state is updated
+            self._job_done.emit(job, JobCancelled if failed else result)
+
+    @Slot(object, object)
+    def _deliver(self, job: Job, result):
+        with self._condition:
+            self._delivering[job.stage] -= 1
+
+        # Stale check on the GUI thread: no race with a submit after the job ended
+        if result is not JobCancelled and not job.cancelled:
+            if job.on_result is not None:
+                try:
+                    job.on_result(result)
+                except Exception:
+                    self.job_failed.emit(job.stage, traceback.format_exc())
+                else:
+                    self.job_finished.emit(job.stage, result)
+            else:
+                self.job_finished.emit(job.stage, result)
+
+        self._update_busy()
@@ -0,0 +1,241 @@
+"""
+Binary Container Format for DataContainers.
+
+`to_json` writes every sample as text and repeats nested containers
+(a BandpassSignal holds its baseband, symbol stream, bitstream, ...).
+This format keeps JSON only for the header and stores the arrays as
+raw buffers:
+
+    | magic (4) | version (u16) | header size (u32) | JSON header | pad | array buffers ... |
+
+    header = {
+        "root":    {"__ref__": i} or {"name": {"__ref__": i}, ...},
+        "objects": [{"type": "PulseSignal", "fields": {...}}, ...],
+        "arrays":  [{"dtype": "<f8", "shape": [...], "offset": ...}, ...],
+    }
+
+Containers and arrays that are shared (same object) are written once and
+referenced by index, so they are shared again after loading. Buffers are
+aligned to 64 bytes and loaded as copy-on-write memory maps: opening is
+instant, the data is only read when it is accessed.
+
+"""
+
+from dataclasses import fields
+from pathlib import Path
+import json
+import struct
+import numpy as np
+
+from src.dataclasses.dataclass_models import DataContainer
+
+
+MAGIC = b"ADTC"
+VERSION = 1
+ALIGNMENT = 64
+FILE_SUFFIX = ".adtc"
+
+
+def _container_types() -> dict:
+    """Class name --> class of all DataContainer subclasses."""
+    types, pending = {}, [DataContainer]
+    while pending:
+        cls = pending.pop()
+        types[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return types
+
+
+def _aligned(offset: int) -> int:
+    return offset + (-offset % ALIGNMENT)
+
+
+# ===========================================================
+#   Writer
+# ===========================================================
+
+class _Encoder:
+    """Flattens a container graph into JSON objects + a list of arrays (deduplicated by identity)."""
+
+    def __init__(self):
+        self.objects = []
+        self.arrays = []
+        self._object_ids = {}
+        self._array_ids = {}
+
+    def encode(self, value):
+        if isinstance(value, DataContainer):
+            return {"__ref__": self._add_object(value)}
+        if isinstance(value, np.ndarray):
+            return {"__array__": self._add_array(value)}
+        if isinstance(value, dict):
+            return {"__dict__": [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, complex):
+            return {"__complex__": [value.real, value.imag]}
+        if isinstance(value, np.generic):
+            return self.encode(value.item())
+        return value
+
+    def _add_object(self, container: DataContainer) -> int:
+        key = id(container)
+        if key not in self._object_ids:
+            index = len(self.objects)
+            self._object_ids[key] = index
+            self.objects.append(None)           # Reserve the index before the children
+            self.objects[index] = {
+                "type": type(container).__name__,
+                "fields": {f.name: self.encode(getattr(container, f.name)) for f in fields(container)},
+            }
+        return self._object_ids[key]
+
+    def _add_array(self, array: np.ndarray) -> int:
+        if array.dtype.hasobject:
+            raise ValueError("Object arrays cannot be stored in a binary container.")
+
+        key = id(array)
+        if key not in self._array_ids:
+            self._array_ids[key] = len(self.arrays)
+            self.arrays.append(array)
+        return self._array_ids[key]
+
+
+def save_containers(path, containers) -> Path:
+    """
+    Writes one container or a dict of named containers (a session) to a binary container file.
+
+    Args:
+        path: Target file
+        containers: DataContainer or {name: DataContainer}
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    encoder = _Encoder()
+
+    if isinstance(containers, dict):
+        root = {name: encoder.encode(container) for name, container in containers.items()}
+    else:
+        root = encoder.encode(containers)
+
+    # Buffer offsets are relative to the (aligned) end of the header
+    array_headers, offset = [], 0
+    for array in encoder.arrays:
+        offset = _aligned(offset)
+        array_headers.append({"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+        offset += array.nbytes
+
+    header = json.dumps({"root": root, "objects": encoder.objects, "arrays": array_headers}).encode("utf-8")
+    prefix = MAGIC + struct.pack("<HI", VERSION, len(header))
+    data_start = _aligned(len(prefix) + len(header))
+
+    with open(path, "wb") as file:
+        file.write(prefix + header)
+        for array, array_header in zip(encoder.arrays, array_headers):
+            file.write(b"\x00" * (data_start + array_header["offset"] - file.tell()))
+            file.write(np.ascontiguousarray(array).data)
+
+    return path
+
+
+def save_container(path, container: DataContainer) -> Path:
+    return save_containers(path, container)
+
+
+# ===========================================================
+#   Reader
+# ===========================================================
+
+class _Decoder:
+
+    def __init__(self, path: Path, header: dict, data_start: int, mmap: bool):
+        self.path = path
+        self.header = header
+        self.data_start = data_start
+        self.mmap = mmap
+        self.types = _container_types()
+        self._objects = {}
+        self._arrays = {}
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "__ref__" in value:
+            return self._object(value["__ref__"])
+        if "__array__" in value:
+            return self._array(value["__array__"])
+        if "__dict__" in value:
+            return {self.decode(key): self.decode(item) for key, item in value["__dict__"]}
+        if "__complex__" in value:
+            return complex(*value["__complex__"])
+        return {key: self.decode(item) for key, item in value.items()}
+
+    def _object(self, index: int) -> DataContainer:
+        if index not in self._objects:
+            entry = self.header["objects"][index]
+            cls = self.types.get(entry["type"])
+            if cls is None:
+                raise ValueError(f"Unknown container type in {self.path}: {entry['type']}")
+
+            values = {name: self.decode(value) for name, value in entry["fields"].items()}
+            init_fields = {f.name for f in fields(cls) if f.init}
+
+            container = cls(**{name: value for name, value in values.items() if name in init_fields})
+            for name, value in values.items():             # Derived fields (e.g. length) as stored
+                if name not in init_fields:
+                    setattr(container, name, value)
+
+            self._objects[index] = container
+        return self._objects[index]
+
+    def _array(self, index: int) -> np.ndarray:
+        if index not in self._arrays:
+            entry = self.header["arrays"][index]
+            dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+            offset = self.data_start + entry["offset"]
+
+            if self.mmap and int(np.prod(shape)) > 0:
+                # Copy-on-write: lazy like a read-only map, but the arrays stay writable
+                array = np.memmap(self.path, dtype=dtype, mode="c", offset=offset, shape=shape)
+            else:
+                count = int(np.prod(shape))
+                array = np.fromfile(self.path, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+            self._arrays[index] = array
+        return self._arrays[index]
+
+
+def load_containers(path, mmap: bool = True):
+    """
+    Loads a binary container file written by `save_containers`.
+
+    Args:
+        mmap: Map the array buffers (lazy) instead of reading them
+    Returns:
+        The container or the dict of named containers, as saved
+    """
+    path = Path(path)
+    with open(path, "rb") as file:
+        prefix = file.read(10)
+        if len(prefix) < 10 or prefix[:4] != MAGIC:
+            raise ValueError(f"Not a binary container file: {path}")
+
+        version, header_size = struct.unpack("<HI", prefix[4:])
+        if version > VERSION:
+            raise ValueError(f"Container file version {version} is not supported (max. {VERSION}).")
+
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+    decoder = _Decoder(path, header, _aligned(10 + header_size), mmap)
+    root = header["root"]
+
+    if "__ref__" in root:
+        return decoder.decode(root)
+    return {name: decoder.decode(value) for name, value in root.items()}
+
+
+def load_container(path, mmap: bool = True) -> DataContainer:
+    return load_containers(path, mmap=mmap)
@@ -0,0 +1,220 @@
+'''
+Audio Output Backends.
+
+Strategy Pattern: the PlaybackWorker only needs a stream object with
+`start`, `stop`, `close` and `latency` that calls
+
+    callback(outdata, frames, time_info, status)
+
+from its own thread. Backends:
+
+    SoundDeviceBackend: Sound card via `sounddevice` (PortAudio)
+    NullBackend:        Clocked device without hardware, output is dropped
+    LoopbackBackend:    Clocked device that records the output (receive tests)
+
+The clocked backends run the callback on absolute deadlines like a sound
+card would, so playback timing can be tested headlessly (CI). `speed`
+runs the clock faster than real time.
+
+`sounddevice` is optional: without PortAudio the app falls back to the
+Null backend.
+
+'''
+
+from abc import ABC, abstractmethod
+import threading
+import time
+import numpy as np
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):          # Missing package or PortAudio library
+    sd = None
+
+
+class CallbackStatus:
+    """Status flags of the clocked streams (same attributes as sd.CallbackFlags)."""
+
+    def __init__(self, output_underflow: bool = False, output_overflow: bool = False):
+        self.output_underflow = output_underflow
+        self.output_overflow = output_overflow
+
+    def __bool__(self):
+        return self.output_underflow or self.output_overflow
+
+    def __str__(self):
+        flags = [name for name in ("output_underflow", "output_overflow") if getattr(self, name)]
+        return ", ".join(flags) if flags else "ok"
+
+
+# ===========================================================
+#   Backends
+# ===========================================================
+
+class AudioBackend(ABC):
+
+    name = "Audio Backend"
+
+    @abstractmethod
+    def create_output_stream(self, fs: int, channels: int, callback, dtype: str = 'float32'):
+        """Returns an (unstarted) output stream that calls `callback` per block."""
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class SoundDeviceBackend(AudioBackend):
+    """Sound card output through PortAudio."""
+
+    name = "sounddevice"
+
+    def __init__(self, device=None, blocksize: int = 0):
+        if sd is None:
+            raise RuntimeError("sounddevice / PortAudio is not available.")
+        self.device = device
+        self.blocksize = blocksize
+
+    def create_output_stream(self, fs, channels, callback, dtype='float32'):
+        return sd.OutputStream(
+            samplerate=fs,
+            channels=channels,
+            dtype=dtype,
+            device=self.device,
+            blocksize=self.blocksize,
+            callback=callback
+        )
+
+
+class ClockedStream:
+    """
+    Output stream driven by a thread on a fixed block clock.
+
+    A callback that returns later than the deadline of the next block is
+    reported as `output_underflow` in the status of the following call,
+    like a sound card that ran out of data.
+    """
+
+    def __init__(self, fs, channels, callback, blocksize: int = 512, speed: float = 1.0,
+                 dtype: str = 'float32', sink=None):
+        self.fs = fs
+        self.channels = channels
+        self.callback = callback
+        self.blocksize = blocksize
+        self.speed = speed
+        self.sink = sink
+        self.latency = blocksize / fs
+
+        self.active = False
+        self._outdata = np.zeros((blocksize, channels), dtype=dtype)
+        self._status = (CallbackStatus(), CallbackStatus(output_underflow=True))
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.active:
+            return
+        self.active = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        period = self.blocksize / self.fs / self.speed
+        deadline = time.perf_counter()
+        underflow = False
+
+        while not self._stop_event.is_set():
+            self.callback(self._outdata, self.blocksize, None, self._status[underflow])
+            if self.sink is not None:
+                self.sink(self._outdata)
+
+            deadline += period
+            now = time.perf_counter()
+            underflow = now > deadline + period
+            if underflow:
+                deadline = now                  # Resync the clock after a dropout
+            else:
+                self._stop_event.wait(max(deadline - now, 0.0))
+
+        self.active = False
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.active = False
+
+    def close(self):
+        self.stop()
+
+
+class NullBackend(AudioBackend):
+    """Clocked device without hardware, the output is dropped."""
+
+    name = "null"
+
+    def __init__(self, blocksize: int = 512, speed: float = 1.0):
+        self.blocksize = blocksize
+        self.speed = speed
+
+    def create_output_stream(self, fs, channels, callback, dtype='float32'):
+        return ClockedStream(fs, channels, callback, self.blocksize, self.speed, dtype)
+
+
+class LoopbackBackend(AudioBackend):
+    """
+    Clocked device that records everything it outputs into a preallocated
+    buffer, e.g. as input for the receive path. Output beyond the capacity
+    is counted in `dropped_frames`.
+    """
+
+    name = "loopback"
+
+    def __init__(self, blocksize: int = 512, speed: float = 1.0, capacity_seconds: float = 60.0):
+        self.blocksize = blocksize
+        self.speed = speed
+        self.capacity_seconds = capacity_seconds
+        self.recording = None
+        self.recorded_frames = 0
+        self.dropped_frames = 0
+
+    def create_output_stream(self, fs, channels, callback, dtype='float32'):
+        self.recording = np.zeros((int(self.capacity_seconds * fs), channels), dtype=dtype)
+        self.clear()
+        return ClockedStream(fs, channels, callback, self.blocksize, self.speed, dtype, sink=self._record)
+
+    def _record(self, block: np.ndarray):
+        num_frames = min(len(block), len(self.recording) - self.recorded_frames)
+        self.recording[self.recorded_frames:self.recorded_frames + num_frames] = block[:num_frames]
+        self.recorded_frames += num_frames
+        self.dropped_frames += len(block) - num_frames
+
+    def clear(self):
+        self.recorded_frames = 0
+        self.dropped_frames = 0
+
+    @property
+    def recorded(self) -> np.ndarray:
+        """View of the recorded frames (frames x channels)."""
+        if self.recording is None:
+            return np.zeros((0, 1), dtype=np.float32)
+        return self.recording[:self.recorded_frames]
+
+
+AUDIO_BACKENDS = {
+    SoundDeviceBackend.name: SoundDeviceBackend,
+    NullBackend.name: NullBackend,
+    LoopbackBackend.name: LoopbackBackend,
+}
+
+
+def create_audio_backend(name: str = None) -> AudioBackend:
+    """
+    Backend by name. Without a name the sound card is used if `sounddevice`
+    can be loaded, otherwise the Null backend.
+    """
+    if name is None:
+        name = SoundDeviceBackend.name if sd is not None else NullBackend.name
+
+    if name not in AUDIO_BACKENDS:
+        raise ValueError(f"Unknown audio backend: {name}")
+
+    return AUDIO_BACKENDS[name]()
@@ -1,140 +1,957 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 import numpy as np
-import sounddevice as sd
 
-from PySide6.QtCore import QObject, Signal, Slot, QThread
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal, Slot
 
-# --- Worker for non-blocking, callback-based audio playback ---
+from src.modules.audio_backend import AudioBackend, create_audio_backend
+
+
+# ===========================================================
+#   Ring Buffer + Block Sources
+# ===========================================================
+
+class RingBuffer:
+    """
+    Preallocated float32 ring buffer for one producer and one consumer thread.
+
+    Read and write positions only grow and are each written by one side only,
+    so no lock is needed. `read_into` copies at most two contiguous slices into
+    the output (no allocation in the audio callback).
+    """
+
+    def __init__(self, capacity: int, channels: int = 1):
+        self.capacity = int(capacity)
+        self.channels = channels
+        self.buffer = np.zeros((self.capacity, channels), dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        self._write_pos = 0
+        self._read_pos = 0
+
+    @property
+    def available(self) -> int:
+        """Frames ready for reading."""
+        return self._write_pos - self._read_pos
+
+    @property
+    def free(self) -> int:
+        """Frames that can be written without overwriting unread data."""
+        return self.capacity - self.available
+
+    def write(self, block: np.ndarray) -> int:
+        """
+        Copies as much of the block as fits (cast to float32 on the fly).
+
+        Returns:
+            Number of written frames
+        """
+        num_frames = min(len(block), self.free)
+        if num_frames == 0:
+            return 0
+
+        start = self._write_pos % self.capacity
+        first = min(num_frames, self.capacity - start)
+
+        self.buffer[start:start + first] = block[:first].reshape(first, -1)
+        if first < num_frames:
+            self.buffer[:num_frames - first] = block[first:num_frames].reshape(num_frames - first, -1)
+
+        self._write_pos += num_frames
+        return num_frames
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copies up to len(out) frames into `out`.
+
+        Returns:
+            Number of copied frames (the rest of `out` is left untouched)
+        """
+        num_frames = min(len(out), self.available)
+        if num_frames == 0:
+            return 0
+
+        start = self._read_pos % self.capacity
+        first = min(num_frames, self.capacity - start)
+
+        out[:first] = self.buffer[start:start + first]
+        if first < num_frames:
+            out[first:num_frames] = self.buffer[:num_frames - first]
+
+        self._read_pos += num_frames
+        return num_frames
+
+
+def array_blocks(data: np.ndarray, block_size: int = 4096):
+    """Block generator over an existing signal (views, no copy)."""
+    for start in range(0, len(data), block_size):
+        yield data[start:start + block_size]
+
+
+@dataclass
+class PlaybackStats:
+    """Timing report of one playback."""
+    callbacks: int = 0
+    underruns: int = 0
+    frames_played: int = 0
+    mean_callback_ms: float = 0.0
+    max_callback_ms: float = 0.0
+    output_latency_ms: float = 0.0
+
+    def __str__(self):
+        return (f"{self.callbacks} callbacks, {self.underruns} underruns, "
+                f"callback mean {self.mean_callback_ms:.3f} ms / max {self.max_callback_ms:.3f} ms, "
+                f"output latency {self.output_latency_ms:.1f} ms")
+
+
+class CallbackInstrumentation:
+    """
+    Timing record of the last `capacity` stream callbacks.
+
+    Preallocated arrays used as circular buffers, the callback only writes
+    a few scalars per call. Per callback:
+        duration_ms:    Time spent inside the callback
+        interval_ms:    Time since the previous callback started
+        jitter_ms:      Interval minus nominal block duration
+        fill_level:     Frames left in the ring buffer of the source
+        flags:          UNDERFLOW / OVERFLOW (device status), UNDERRUN (source ran dry)
+    """
+
+    UNDERFLOW = 1
+    OVERFLOW = 2
+    UNDERRUN = 4
+
+    FIELDS = ("duration_ms", "interval_ms", "jitter_ms", "fill_level")
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.duration_ms = np.zeros(capacity)
+        self.interval_ms = np.zeros(capacity)
+        self.jitter_ms = np.zeros(capacity)
+        self.fill_level = np.zeros(capacity, dtype=np.int64)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self._last_start = None
+
+    def record(self, t_start: float, t_end: float, frames: int, fs: int, status, underrun: bool, fill_level: int):
+        idx = self.count % self.capacity
+        nominal_ms = frames / fs * 1000
+
+        interval_ms = nominal_ms if self._last_start is None else (t_start - self._last_start) * 1000
+        self._last_start = t_start
+
+        self.duration_ms[idx] = (t_end - t_start) * 1000
+        self.interval_ms[idx] = interval_ms
+        self.jitter_ms[idx] = interval_ms - nominal_ms
+        self.fill_level[idx] = fill_level
+        self.flags[idx] = (
+            self.UNDERFLOW * bool(getattr(status, "output_underflow", False))
+            | self.OVERFLOW * bool(getattr(status, "output_overflow", False))
+            | self.UNDERRUN * underrun
+        )
+        self.count += 1
+
+    def values(self, field: str) -> np.ndarray:
+        """Recorded values of a field (ring order, fine for statistics)."""
+        if field not in self.FIELDS and field != "flags":
+            raise ValueError(f"Unknown instrumentation field: {field}")
+        return getattr(self, field)[:min(self.count, self.capacity)]
+
+    def histogram(self, field: str, bins: int = 50, value_range=None):
+        """
+        Returns:
+            (counts, bin_edges) as np.histogram
+        """
+        return np.histogram(self.values(field), bins=bins, range=value_range)
+
+    def flag_counts(self) -> dict:
+        flags = self.values("flags")
+        return {
+            "underflow": int(np.count_nonzero(flags & self.UNDERFLOW)),
+            "overflow": int(np.count_nonzero(flags & self.OVERFLOW)),
+            "underrun": int(np.count_nonzero(flags & self.UNDERRUN)),
+        }
+
+    def summary(self) -> dict:
+        """Mean / p99 / max of duration and |jitter|, flag counts and the lowest fill level."""
+        summary = {"callbacks": self.count}
+        if self.count == 0:
+            return summary
+
+        for field in ("duration_ms", "jitter_ms"):
+            values = np.abs(self.values(field))
+            summary[field] = {
+                "mean": float(np.mean(values)),
+                "p99": float(np.percentile(values, 99)),
+                "max": float(np.max(values)),
+            }
+        summary["min_fill_level"] = int(np.min(self.values("fill_level")))
+        summary.update(self.flag_counts())
+        return summary
+
+
+# --- Playback Source: one signal on its way to the stream ---
+class PlaybackSource:
+    """
+    A block generator feeding a RingBuffer from its own producer thread.
+
+    Attributes:
+        start_frame: Stream frame of the first sample (None: as soon as `prefill` is buffered)
+        stop_frame: Stream frame where the output is cut (None: play to the end)
+    """
+
+    def __init__(self, blocks, fs, gain: float = 1.0, buffer_time: float = 1.0,
+                 prefill: float = 0.1, start_frame: int = None, queue=None, channels: int = 1):
+        self.blocks = blocks
+        self.gain = gain
+        self.channels = channels
+        self.queue: TransmitQueue = queue   # Set if the blocks come from a TransmitQueue
+
+        self.ring = RingBuffer(int(buffer_time * fs), channels)
+        self.prefill_frames = min(int(prefill * fs), self.ring.capacity)
+
+        self.start_frame = start_frame
+        self.stop_frame = None
+        self.mix_gain = 1.0             # Applied in the mixer, can be changed while playing
+
+        # Mixer state (written by the audio callback)
+        self.played_in_block = False
+        self.is_finished = False
+        self.finish_reported = False
+
+        self.is_cancelled = False
+        self.producer_done = False
+        self.error_message = None
+        self._space_available = threading.Event()
+
+        self.stats = PlaybackStats()
+        self.callback_time_total = 0.0
+
+        self._producer = threading.Thread(target=self._produce, daemon=True)
+
+    @property
+    def is_ready(self) -> bool:
+        """Enough buffered (or everything produced) to start without underrun."""
+        if self.producer_done or self.ring.available >= self.prefill_frames:
+            return True
+        return self.is_idle and self.ring.available > 0
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self.producer_done and self.ring.available == 0
+
+    @property
+    def is_idle(self) -> bool:
+        """An empty transmit queue waits for items (silence is no underrun)."""
+        return self.queue is not None and self.queue.is_waiting
+
+    def start(self):
+        self._producer.start()
+        return self
+
+    def cancel(self):
+        self.is_cancelled = True
+        if self.queue is not None:
+            self.queue.close()
+        self._space_available.set()
+
+    def notify_read(self):
+        """Called by the consumer after reading, wakes up a waiting producer."""
+        self._space_available.set()
+
+    # ---- Producer Thread ----
+    def _produce(self):
+        """Pulls blocks from the generator and writes them into the ring buffer."""
+        try:
+            for block in self.blocks:
+                if self.gain != 1.0:
+                    block = block * self.gain
+
+                written = 0
+                while written < len(block):
+                    if self.is_cancelled:
+                        return
+                    n = self.ring.write(block[written:])
+                    written += n
+                    if n == 0:
+                        self._space_available.clear()
+                        self._space_available.wait(0.05)
+        except Exception as e:
+            self.error_message = f"Audio producer error: {e}"
+        finally:
+            self.producer_done = True
+
+
+# --- Transmit Queue: back-to-back items as one block stream ---
+class TransmitQueue:
+    """
+    FIFO of transmit items, played as one continuous block stream.
+
+    The items are joined in the producer thread, the callback just keeps
+    reading the ring buffer, so there is no gap between queued items:
+
+        crossfade_time > 0:  linear crossfade between back-to-back items
+        guard_time > 0:      silence between the items (without crossfade)
+
+    When the queue runs empty the producer waits for new items and the
+    stream outputs silence. `markers` holds (end frame, item_id) of every
+    item, the callback reports an item as finished when it has been played.
+    """
+
+    def __init__(self, fs, guard_time: float = 0.0, crossfade_time: float = 0.0, channels: int = 1):
+        self.fs = fs
+        self.channels = channels
+        self.guard_frames = int(round(guard_time * fs))
+        self.crossfade_frames = int(round(crossfade_time * fs))
+
+        self.markers = deque()          # (end frame, item_id), appended by producer, popped by callback
+        self.is_waiting = False
+
+        self._items = deque()
+        self._has_items = threading.Event()
+        self._closed = False
+
+    def put(self, blocks, item_id, gain: float = 1.0):
+        """Appends an item (block generator). Thread safe."""
+        self._items.append((blocks, item_id, gain))
+        self._has_items.set()
+
+    def close(self):
+        """Ends the block stream after the producer wakes up."""
+        self._closed = True
+        self._has_items.set()
+
+    def __len__(self):
+        return len(self._items)
+
+    def _next_item(self, wait: bool):
+        """Pops the next item, optionally waits until one is queued (None when closed)."""
+        while not self._closed:
+            if self._items:
+                return self._items.popleft()
+            if not wait:
+                return None
+
+            self.is_waiting = True
+            self._has_items.clear()
+            if not self._items:
+                self._has_items.wait(0.05)
+            self.is_waiting = False
+        return None
+
+    def _silence(self, num_frames: int) -> np.ndarray:
+        return np.zeros((num_frames, self.channels))
+
+    def blocks(self):
+        """Block generator over all items (runs in the producer thread), blocks are (frames x channels)."""
+        position = 0                    # Frames yielded so far
+        tail = self._silence(0)         # Held back end of the previous item (crossfade)
+        tail_item = None
+
+        while True:
+            # Back-to-back: only crossfade if the next item is already queued
+            item = self._next_item(wait=tail_item is None)
+
+            if item is None and tail_item is not None:
+                # Queue ran empty: flush the held back tail without fade
+                yield tail
+                position += len(tail)
+                self.markers.append((position, tail_item))
+                tail, tail_item = self._silence(0), None
+                continue
+
+            if item is None:
+                return
+
+            blocks, item_id, gain = item
+            head_needed = len(tail) if tail_item is not None else 0
+
+            if tail_item is None and position > 0 and self.guard_frames:
+                yield self._silence(self.guard_frames)
+                position += self.guard_frames
+
+            pending = self._silence(0)
+            for block in blocks:
+                block = np.real(block).reshape(len(block), self.channels) * gain
+                pending = np.concatenate((pending, block)) if len(pending) else block
+
+                # ---- Crossfade with the tail of the previous item ----
+                if head_needed:
+                    if len(pending) < head_needed:
+                        continue
+                    fade_in = (np.arange(1, head_needed + 1) / (head_needed + 1))[:, None]
+                    yield tail * (1 - fade_in) + pending[:head_needed] * fade_in
+                    position += head_needed
+                    self.markers.append((position, tail_item))
+                    pending = pending[head_needed:]
+                    head_needed, tail, tail_item = 0, self._silence(0), None
+
+                # ---- Hold back the end of the item for the next crossfade ----
+                ready = len(pending) - self.crossfade_frames
+                if ready > 0:
+                    yield pending[:ready]
+                    position += ready
+                    pending = pending[ready:]
+
+            if head_needed:
+                # Item shorter than the crossfade: previous tail + short item overlap
+                overlap = len(pending)
+                fade_in = (np.arange(1, overlap + 1) / (overlap + 1))[:, None]
+                mixed = tail.copy()
+                mixed[:overlap] = tail[:overlap] * (1 - fade_in) + pending * fade_in
+                yield mixed
+                position += len(mixed)
+                self.markers.append((position, tail_item))
+                self.markers.append((position, item_id))
+                tail, tail_item = self._silence(0), None
+            elif self.crossfade_frames:
+                tail, tail_item = pending, item_id
+            else:
+                self.markers.append((position, item_id))
+
+
+# --- Worker: long-lived output stream ---
 class PlaybackWorker(QObject):
     """
-    Handles audio playback in a separate thread using a real-time stream callback
-    to ensure low-latency and prevent buffer underruns.
+    Keeps one output stream open for the whole session and mixes all
+    active sources in the callback.
+
+        PlaybackSource (producer thread --> RingBuffer) --+
+        PlaybackSource (producer thread --> RingBuffer) --+--> mixer --> outdata
+        ...                                               --+
+
+    The main source (Play / Transmit Queue) is swapped by `set_source`,
+    further sources (other carriers, preambles, interference tones) are
+    added with `add_source` and mixed on top. Each source has its own gain
+    (`mix_gain`, applied at mix time) and sample-accurate start / stop on
+    the stream frame counter. Mixing costs O(block) per active source: one
+    copy from the ring into a preallocated scratch buffer, scale and add in
+    place. Without a source the stream outputs silence.
+
+    The callback never calls Qt and never formats strings: it only counts
+    and appends to deques. `dispatch_events` turns them into signals on the
+    GUI thread (timer driven while the stream is open).
     """
     finished = Signal()
     error = Signal(str)
+    stats_ready = Signal(object)
+    item_finished = Signal(object)      # item_id of a TransmitQueue entry
+    source_finished = Signal(object)    # PlaybackSource that played out or was stopped
+
+    SCRATCH_FRAMES = 8192
+    EVENT_INTERVAL_MS = 20
 
-    def __init__(self, data, fs):
+    def __init__(self, fs, backend: AudioBackend = None, instrumentation_size: int = 4096, channels: int = 1):
         super().__init__()
-        self.data = data
         self.fs = fs
+        self.channels = channels
+        self.backend = backend if backend is not None else create_audio_backend()
         self.stream = None
-        self.current_frame = 0
-        self.is_stopped = False
+        self.frame_counter = 0          # Frames handed to the device since the stream was opened
+
+        # Sources are swapped as a whole tuple (the callback never sees a half updated list)
+        self._sources: tuple = ()
+        self._main_source: PlaybackSource = None
+        self._sources_lock = threading.Lock()
+        self._needs_prune = False
+
+        self._scratch = np.zeros((self.SCRATCH_FRAMES, channels), dtype=np.float32)
+        self.instrumentation = CallbackInstrumentation(instrumentation_size)
+
+        # Events written by the callback, emitted by `dispatch_events`
+        self._finished_items = deque()          # item_id of played TransmitQueue entries
+        self._finished_sources = deque()
+        self._status_events = 0
+        self._reported_status_events = 0
+        self._last_status = None
+
+        self._event_timer = QTimer(self)
+        self._event_timer.setInterval(self.EVENT_INTERVAL_MS)
+        self._event_timer.timeout.connect(self.dispatch_events)
 
-    def _callback(self, outdata: np.ndarray, frames: int, time, status: sd.CallbackFlags):
+    @property
+    def is_open(self) -> bool:
+        return self.stream is not None
+
+    @property
+    def is_active(self) -> bool:
+        """A source is attached (playing or waiting for its start frame)."""
+        return any(not source.is_finished for source in self._sources)
+
+    @property
+    def current_source(self) -> PlaybackSource:
+        """The main source (Play / Transmit Queue)."""
+        return self._main_source
+
+    @property
+    def sources(self) -> tuple:
+        return self._sources
+
+    def open(self):
+        """Opens and starts the persistent stream (idempotent)."""
+        if self.stream is not None:
+            return
+
+        self.stream = self.backend.create_output_stream(
+            self.fs,
+            self.channels,
+            self._callback,
+            dtype='float32'
+        )
+        self.instrumentation.reset()
+        self.stream.start()
+
+        # Without an application (headless benchmark) events are only dispatched on request
+        if QCoreApplication.instance() is not None:
+            self._event_timer.start()
+
+    def close(self):
+        for source in self._sources:
+            source.cancel()
+        with self._sources_lock:
+            self._sources = ()
+            self._main_source = None
+
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+        # Callback stopped: report what is left
+        self._event_timer.stop()
+        self.dispatch_events()
+
+    def set_source(self, source: PlaybackSource):
+        """Swaps the main source. The old one is cancelled, mixed sources keep playing."""
+        with self._sources_lock:
+            old_source, self._main_source = self._main_source, source
+            sources = [s for s in self._sources if s is not old_source]
+            if source is not None:
+                sources.append(source)
+            self._sources = tuple(sources)
+
+        if old_source is not None:
+            old_source.cancel()
+
+    def add_source(self, source: PlaybackSource):
+        """Mixes a further source on top of the running output."""
+        with self._sources_lock:
+            self._sources = self._sources + (source,)
+
+    def stop_at(self, frame: int = None, source: PlaybackSource = None):
+        """
+        Cuts a source at a stream frame (None: at the next callback).
+        Without a source all sources are stopped.
+        """
+        stop_frame = self.frame_counter if frame is None else frame
+        for active in (self._sources if source is None else (source,)):
+            active.stop_frame = stop_frame
+
+    def _scratch_buffer(self, frames: int) -> np.ndarray:
+        if frames > len(self._scratch):
+            # Only if the driver asks for more than SCRATCH_FRAMES at once
+            self._scratch = np.zeros((frames, self.channels), dtype=np.float32)
+        return self._scratch
+
+    def _prune_finished(self):
+        """Drops finished sources. Never waits in the callback, retried on the next call."""
+        if not self._sources_lock.acquire(blocking=False):
+            return
+        try:
+            self._sources = tuple(source for source in self._sources if not source.is_finished)
+            if self._main_source is not None and self._main_source.is_finished:
+                self._main_source = None
+            self._needs_prune = False
+        finally:
+            self._sources_lock.release()
+
+    # ---- Audio Callback ----
+    def _callback(self, outdata: np.ndarray, frames: int, time_info, status):
         """
         The heart of the stream. Called by the audio driver to request more data.
+        Sums the sample-accurate windows of all active sources into `outdata`.
         """
+        t_start = time.perf_counter()
+
         if status:
-            self.error.emit(f"Stream callback status: {status}")
+            self._status_events += 1
+            self._last_status = status
 
-        chunk_end = self.current_frame + frames
-        remaining_frames = len(self.data) - self.current_frame
+        block_start = self.frame_counter
+        self.frame_counter += frames
+        outdata.fill(0)
 
-        if remaining_frames < frames:
-            # Last chunk
-            outdata[:remaining_frames] = self.data[self.current_frame:].reshape(-1, 1)
-            outdata[remaining_frames:] = 0 # Pad with silence
-            raise sd.CallbackStop # Signal that this is the last chunk
-        else:
-            # Standard chunk
-            outdata[:] = self.data[self.current_frame:chunk_end].reshape(-1, 1)
+        sources = self._sources
+        underrun = False
+        fill_level = 0
+        num_active = 0
 
-        self.current_frame = chunk_end
+        if sources:
+            scratch = self._scratch_buffer(frames)
+            fill_level = -1
 
-    @Slot()
-    def play(self):
+            for source in sources:
+                if source.is_finished:
+                    source.played_in_block = False
+                    continue
+                num_active += 1
+
+                source_underrun, finished = self._mix(source, outdata, scratch, frames, block_start)
+                underrun = underrun or source_underrun
+
+                # Lowest fill level of all active sources
+                available = source.ring.available
+                fill_level = available if fill_level < 0 else min(fill_level, available)
+
+                if source.queue is not None:
+                    # Items of the transmit queue that are completely played
+                    markers = source.queue.markers
+                    while markers and markers[0][0] <= source.stats.frames_played:
+                        self._finished_items.append(markers.popleft()[1])
+
+                if finished:
+                    source.is_finished = True
+                    self._needs_prune = True
+
+            if num_active > 1:
+                np.clip(outdata, -1.0, 1.0, out=outdata)
+
+            fill_level = max(fill_level, 0)
+
+        t_end = time.perf_counter()
+        self.instrumentation.record(t_start, t_end, frames, self.fs, status, underrun, fill_level)
+
+        elapsed_ms = (t_end - t_start) * 1000
+        for source in sources:
+            if source.played_in_block:
+                source.callback_time_total += elapsed_ms / 1000
+                if elapsed_ms > source.stats.max_callback_ms:
+                    source.stats.max_callback_ms = elapsed_ms
+            if source.is_finished and not source.finish_reported:
+                # Back to idle for this source, the stream keeps running.
+                # The producer sees the flag, the full cancel + signals follow in `dispatch_events`
+                source.finish_reported = True
+                source.is_cancelled = True
+                self._finished_sources.append(source)
+
+        if self._needs_prune:
+            self._prune_finished()
+
+    def _mix(self, source: PlaybackSource, outdata: np.ndarray, scratch: np.ndarray,
+             frames: int, block_start: int):
         """
-        Initializes and starts the audio output stream.
+        Adds the sample-accurate window of one source to this block.
+
+        Returns:
+            (underrun, finished)
         """
-        try:
-            # Normalize audio data safely
-            max_val = np.max(np.abs(self.data))
-            if max_val > 0:
-                self.data = self.data / max_val
-
-            self.stream = sd.OutputStream(
-                samplerate=self.fs,
-                channels=1, # Assuming mono audio
-                callback=self._callback,
-                finished_callback=self._on_stream_finished
-            )
-
-            with self.stream:
-                # The stream runs in the background. We wait here until it's stopped.
-                # The 'finished_callback' will trigger the 'finished' signal.
-                while not self.is_stopped and self.stream.active:
-                    sd.sleep(100) # Sleep to avoid busy-waiting
+        if source.start_frame is None and source.is_ready:
+            source.start_frame = block_start
 
-        except Exception as e:
-            self.error.emit(f"Audio stream error: {e}")
-            self.finished.emit() # Ensure we always finish
+        if source.start_frame is None:
+            begin = end = frames
+        else:
+            begin = min(max(source.start_frame - block_start, 0), frames)
+            end = frames
+            if source.stop_frame is not None:
+                end = min(max(source.stop_frame - block_start, begin), frames)
+
+        producer_done = source.producer_done
+        copied = source.ring.read_into(scratch[begin:end]) if end > begin else 0
+        source.notify_read()
+
+        if copied:
+            mixed = scratch[begin:begin + copied]
+            if source.mix_gain != 1.0:
+                np.multiply(mixed, source.mix_gain, out=mixed)
+            out = outdata[begin:begin + copied]
+            np.add(out, mixed, out=out)
 
+        underrun = begin + copied < end and not producer_done and not source.is_idle
+        if underrun:
+            source.stats.underruns += 1
+
+        source.played_in_block = end > begin
+        if source.played_in_block:
+            source.stats.callbacks += 1
+            source.stats.frames_played += copied
+
+        stop_reached = source.stop_frame is not None and source.stop_frame <= block_start + frames
+        return underrun, stop_reached or (producer_done and source.ring.available == 0)
+
+    # ---- Events (GUI thread) ----
     @Slot()
-    def stop(self):
-        """
-        Stops the audio stream.
-        """
-        self.is_stopped = True
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-        # The finished_callback will be called upon stopping.
+    def dispatch_events(self):
+        """Emits the events collected by the audio callback since the last call."""
+        status_events = self._status_events
+        if status_events != self._reported_status_events:
+            missed = status_events - self._reported_status_events
+            self._reported_status_events = status_events
+            self.error.emit(f"Stream callback status: {self._last_status} ({missed}x)")
 
-    def _on_stream_finished(self):
-        """A safe, simple proxy method to emit the finished signal."""
+        # Items first: the last item of a queue is reported before its source
+        while self._finished_items:
+            self.item_finished.emit(self._finished_items.popleft())
+        while self._finished_sources:
+            self._finish(self._finished_sources.popleft())
+
+    def _finish(self, source: PlaybackSource):
+        source.cancel()
+        if source.error_message:
+            self.error.emit(source.error_message)
+        if source.stats.callbacks:
+            source.stats.mean_callback_ms = source.callback_time_total / source.stats.callbacks * 1000
+        source.stats.output_latency_ms = float(self.stream.latency) * 1000 if self.stream is not None else 0.0
+        self.stats_ready.emit(source.stats)
+        self.source_finished.emit(source)
         self.finished.emit()
 
 
-# --- Main Handler Class (Thread Manager) ---
+# --- Main Handler Class ---
 class AudioPlaybackHandler(QObject):
     """
-    Manages the QThread for the PlaybackWorker to ensure the GUI remains responsive.
+    Owns the persistent PlaybackWorker. Nothing here blocks the GUI thread:
+    the stream runs in the audio driver thread, the synthesis in the
+    producer thread of each source.
     """
     playback_started = Signal()
     playback_finished = Signal()
     playback_error = Signal(str)
+    playback_stats = Signal(object)
+    item_finished = Signal(object)
+    source_finished = Signal(object)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, backend: AudioBackend = None,
+                 guard_time: float = 0.0, crossfade_time: float = 0.0):
         super().__init__(parent)
-        self.playback_thread = None
-        self.playback_worker = None
+        self.backend = backend if backend is not None else create_audio_backend()
+        self.playback_worker: PlaybackWorker = None
         self.is_playing = False
 
+        # Transmit Queue (timing applies to the next queue that is started)
+        self.guard_time = guard_time
+        self.crossfade_time = crossfade_time
+        self.transmit_queue: TransmitQueue = None
+        self._next_item_id = 0
+
+    def _ensure_worker(self, fs, channels: int = 1):
+        """Opens the stream once, reopens only if the sample rate or the channel count changes."""
+        worker = self.playback_worker
+        if worker is not None and (worker.fs != fs or worker.channels != channels):
+            self.shutdown()
+
+        if self.playback_worker is None:
+            self.playback_worker = PlaybackWorker(fs, backend=self.backend, channels=channels)
+            self.playback_worker.finished.connect(self.on_playback_finished)
+            self.playback_worker.error.connect(self.on_playback_error)
+            self.playback_worker.stats_ready.connect(self.playback_stats.emit)
+            self.playback_worker.item_finished.connect(self.item_finished.emit)
+            self.playback_worker.source_finished.connect(self.source_finished.emit)
+
+        self.playback_worker.open()
+        return self.playback_worker
+
     @Slot(np.ndarray, int)
-    def play(self, data, fs):
-        if self.is_playing:
-            self.stop() # Stop previous playback before starting a new one
+    def play(self, data, fs, start_frame: int = None):
+        """
+        Plays a complete signal, normalized to its peak (scaled block-wise, no full copy).
+        1-D: mono, 2-D: (samples x channels), one independent signal per output channel.
+        """
+        max_val = np.max(np.abs(data))
+        gain = 1 / max_val if max_val > 0 else 1.0
+        channels = data.shape[1] if data.ndim == 2 else 1
+        self.play_stream(array_blocks(data), fs, gain=gain, start_frame=start_frame, channels=channels)
+
+    def play_stream(self, blocks, fs, gain: float = 1.0, start_frame: int = None, channels: int = 1):
+        """
+        Plays a block generator. Playback starts while the generator
+        is still producing the rest of the signal.
+
+        Args:
+            start_frame: Stream frame to start on (see `current_frame`), None: as soon as possible
+            channels: Output channels, blocks are (frames x channels) (mono blocks go to all channels)
+        """
+        try:
+            worker = self._ensure_worker(fs, channels)
+        except Exception as e:
+            self.on_playback_error(f"Audio stream error: {e}")
+            return
+
+        source = PlaybackSource(blocks, fs, gain=gain, start_frame=start_frame, channels=channels).start()
+        worker.set_source(source) # Replaces (and cancels) a running playback
 
         self.is_playing = True
-        self.playback_thread = QThread()
-        self.playback_worker = PlaybackWorker(data, fs)
+        self.playback_started.emit()
 
-        self.playback_worker.moveToThread(self.playback_thread)
+    @staticmethod
+    def _as_blocks(item, gain: float = None):
+        """
+        Signal container / array / block generator --> (blocks, gain, channels).
+        Containers and arrays are normalized to their peak if no gain is given,
+        the channel count of a generator is unknown (None).
+        """
+        if hasattr(item, "data"):
+            item = np.real(item.data)
 
-        # Connect signals
-        self.playback_thread.started.connect(self.playback_worker.play)
-        self.playback_worker.finished.connect(self.on_playback_finished)
-        self.playback_worker.error.connect(self.on_playback_error)
+        if not isinstance(item, np.ndarray):
+            return item, 1.0 if gain is None else gain, None
 
-        self.playback_thread.start()
+        if gain is None:
+            max_val = np.max(np.abs(item)) if len(item) else 0
+            gain = 1 / max_val if max_val > 0 else 1.0
+
+        return array_blocks(item), gain, item.shape[1] if item.ndim == 2 else 1
+
+    def enqueue(self, item, fs, gain: float = None, item_id=None, channels: int = None):
+        """
+        Appends a transmission to the gapless transmit queue.
+
+        Args:
+            item: Signal container (real part of `data` is played), array or block generator
+            gain: None --> containers / arrays are normalized to their peak, generators unscaled
+            item_id: Reported by `item_finished` (default: running number)
+            channels: Channels of a generator item (arrays: from the shape, default mono)
+        Returns:
+            item_id
+        """
+        item, gain, item_channels = self._as_blocks(item, gain)
+        channels = item_channels or channels
+
+        if item_id is None:
+            item_id = self._next_item_id
+            self._next_item_id += 1
+
+        channels = channels or (self.transmit_queue.channels if self.transmit_queue is not None else 1)
+
+        try:
+            worker = self._ensure_worker(fs, channels)
+        except Exception as e:
+            self.on_playback_error(f"Audio stream error: {e}")
+            return item_id
+
+        source = worker.current_source
+        if self.transmit_queue is None or source is None or source.queue is not self.transmit_queue:
+            # No queue running: start one (replaces a single playback)
+            self.transmit_queue = TransmitQueue(fs, guard_time=self.guard_time,
+                                                crossfade_time=self.crossfade_time, channels=channels)
+            worker.set_source(PlaybackSource(self.transmit_queue.blocks(), fs,
+                                             queue=self.transmit_queue, channels=channels).start())
+            self.is_playing = True
+            self.playback_started.emit()
+
+        self.transmit_queue.put(item, item_id, gain=1.0 if gain is None else gain)
+        return item_id
+
+    def add_source(self, item, fs, gain: float = None, mix_gain: float = 1.0, start_frame: int = None):
+        """
+        Mixes a further transmission on top of the running output (e.g. a second
+        carrier or an interference tone), without touching the main playback.
+
+        Args:
+            item: Signal container, array or block generator
+            gain: Scaling in the producer (None: peak normalization of containers / arrays)
+            mix_gain: Gain in the mixer, can be changed while playing (`set_source_gain`)
+            start_frame: Stream frame to start on (see `current_frame`), None: as soon as possible
+        Returns:
+            The PlaybackSource (handle for `set_source_gain` / `remove_source`)
+        """
+        blocks, gain, channels = self._as_blocks(item, gain)
+
+        try:
+            # Keep the open stream, mono sources are spread over all channels
+            worker = self.playback_worker
+            if worker is None or worker.fs != fs:
+                worker = self._ensure_worker(fs, channels or 1)
+            worker.open()
+        except Exception as e:
+            self.on_playback_error(f"Audio stream error: {e}")
+            return None
+
+        source = PlaybackSource(blocks, fs, gain=gain, start_frame=start_frame, channels=worker.channels)
+        source.mix_gain = mix_gain
+        worker.add_source(source.start())
+
+        self.is_playing = True
         self.playback_started.emit()
+        return source
 
-    @Slot()
-    def stop(self):
+    def set_source_gain(self, source: PlaybackSource, mix_gain: float):
+        """Changes the mixer gain of a playing source (takes effect with the next block)."""
+        source.mix_gain = mix_gain
+
+    def remove_source(self, source: PlaybackSource, at_frame: int = None):
+        """Stops one mixed source (sample-accurate with `at_frame`)."""
         if self.playback_worker:
-            self.playback_worker.stop()
+            self.playback_worker.stop_at(at_frame, source=source)
 
-    def on_playback_finished(self):
-        if self.playback_thread is not None:
-            self.playback_thread.quit()
-            self.playback_thread.wait()
+    @property
+    def current_frame(self) -> int:
+        """Frame counter of the open stream (reference for sample-accurate start/stop)."""
+        return self.playback_worker.frame_counter if self.playback_worker is not None else 0
+
+    @property
+    def instrumentation(self) -> CallbackInstrumentation:
+        """Callback timing record of the open stream (None before the first Play)."""
+        return self.playback_worker.instrumentation if self.playback_worker is not None else None
+
+    @Slot()
+    def stop(self, at_frame: int = None):
+        if self.playback_worker:
+            self.playback_worker.stop_at(at_frame)
 
-        self.playback_thread = None
-        self.playback_worker = None
+    def shutdown(self):
+        """Closes the persistent stream (application exit)."""
+        if self.playback_worker is not None:
+            self.playback_worker.close()
+            self.playback_worker = None
         self.is_playing = False
+
+    def on_playback_finished(self):
+        # Dispatched after the callback finished the source: a new source may already be playing
+        self.is_playing = self.playback_worker is not None and self.playback_worker.is_active
         self.playback_finished.emit()
 
     def on_playback_error(self, error_message):
         print(f"Playback Error: {error_message}") # It's good to log this
         self.playback_error.emit(error_message)
-        self.on_playback_finished()
\ No newline at end of file
+
+
+# ===========================================================
+#   Headless Playback Benchmark (Null / Loopback backend)
+# ===========================================================
+
+def benchmark_playback(backend_name: str = "null", seconds: float = 5.0, fs: int = 48000,
+                       blocksize: int = 512, speed: float = 1.0) -> dict:
+    """
+    Plays a test tone through a clocked backend and returns the
+    instrumentation summary. No audio device and no event loop needed.
+    """
+    backend = create_audio_backend(backend_name)
+    backend.blocksize = blocksize
+    backend.speed = speed
+
+    tone = np.sin(2 * np.pi * 1000 * np.arange(int(seconds * fs)) / fs)
+
+    worker = PlaybackWorker(fs, backend=backend)
+    worker.open()
+    worker.set_source(PlaybackSource(array_blocks(tone), fs).start())
+
+    while worker.is_active:
+        time.sleep(0.01)
+    worker.close()
+
+    counts, edges = worker.instrumentation.histogram("duration_ms", bins=10)
+    summary = worker.instrumentation.summary()
+    summary["duration_histogram"] = {f"{lo:.4f}-{hi:.4f} ms": int(c) for lo, hi, c in zip(edges[:-1], edges[1:], counts)}
+    return summary
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(benchmark_playback(), indent=4))
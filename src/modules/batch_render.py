@@ -0,0 +1,176 @@
+'''
+Headless Batch Rendering.
+
+Renders every combination of a parameter grid (pulse, span, roll-off,
+modulation scheme, bit mapper, carrier, symbol rate) for every payload
+file to WAV + JSON metadata, without the GUI. Same transmit chain as the
+app (Barker Preamble + Pulse Shaping + IQ Modulation) and the same export.
+
+Every combination is one job in a process pool. Jobs only carry the
+parameters and the payload path; each worker loads the payload and writes
+its own files.
+
+Payloads:
+    Bit text (only '0' / '1' and whitespace, e.g. the app's .bin files) --> bits as written
+    Any other file (text, binary) --> its bytes, MSB first
+
+'''
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from itertools import product
+from pathlib import Path
+import json
+import time
+import numpy as np
+
+from src.constants import PulseShape, DEFAULT_FS
+from src.modules.helper_functions import create_mod_scheme_lut, create_pulse_signal, export_transmitted_signal
+from src.modules.packetizer import create_bandpass_signal
+from src.modules.render_cache import RenderCache, render_key, DEFAULT_CACHE_SIZE
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One grid point for one payload."""
+    payload: str
+    pulse_shape: str
+    span: int
+    roll_off: float
+    mod_scheme: str
+    mapper: str
+    carrier_freq: int
+    sym_rate: int
+    fs: int = DEFAULT_FS
+
+    @property
+    def file_name(self) -> str:
+        roll_off = "" if self.roll_off is None else f"_a{self.roll_off:g}"
+        return (f"{Path(self.payload).stem}_{self.mod_scheme}_{self.mapper}_{self.pulse_shape}"
+                f"_span{self.span}{roll_off}_fc{self.carrier_freq}_rs{self.sym_rate}.wav")
+
+
+@dataclass
+class RenderResult:
+    job: RenderJob
+    path: str
+    bits: int
+    audio_seconds: float
+    render_seconds: float
+    cached: bool = False
+
+
+def load_payload_bits(path) -> np.ndarray:
+    """Payload file --> bit array (see module docstring for the formats)."""
+    raw = Path(path).read_bytes()
+
+    bit_text = b"".join(raw.split())
+    if bit_text and not bit_text.strip(b"01"):
+        return (np.frombuffer(bit_text, dtype=np.uint8) - ord("0")).astype(np.int8)
+
+    return np.unpackbits(np.frombuffer(raw, dtype=np.uint8)).astype(np.int8)
+
+
+def build_render_jobs(payloads, pulse_shapes, spans, roll_offs, mod_schemes, mappers,
+                      carrier_freqs, sym_rates, fs: int = DEFAULT_FS) -> list[RenderJob]:
+    """
+    Cartesian product of all parameters. The roll-off only applies to the
+    Raised Cosine, other pulses get one job instead of one per roll-off.
+    """
+    jobs = {}
+    for payload, shape, span, roll_off, scheme, mapper, carrier, sym_rate in product(
+            payloads, pulse_shapes, spans, roll_offs, mod_schemes, mappers, carrier_freqs, sym_rates):
+
+        if fs % sym_rate:
+            raise ValueError(f"Symbol rate {sym_rate} does not divide the sample rate {fs}.")
+
+        job = RenderJob(
+            payload=str(payload),
+            pulse_shape=str(shape),
+            span=int(span),
+            roll_off=float(roll_off) if shape == PulseShape.RAISED_COSINE else None,
+            mod_scheme=scheme,
+            mapper=mapper,
+            carrier_freq=int(carrier),
+            sym_rate=int(sym_rate),
+            fs=fs
+        )
+        jobs.setdefault(job, None)          # Keeps the order, drops duplicates
+
+    return list(jobs)
+
+
+def render_job(job: RenderJob, output_dir, sample_format: str = "int16", cache_dir=None,
+               cache_size: int = DEFAULT_CACHE_SIZE) -> RenderResult:
+    """
+    Renders one job to `output_dir` (WAV + JSON sidecar). Runs in a worker process.
+    With a `cache_dir` the signal is taken from the render cache if it was rendered before.
+    """
+    t_start = time.perf_counter()
+
+    bits = load_payload_bits(job.payload)
+    pulse = create_pulse_signal(job.pulse_shape, job.sym_rate, job.fs, job.span, job.roll_off)
+    mod_scheme = create_mod_scheme_lut(job.mod_scheme, job.mapper)
+
+    def render():
+        return create_bandpass_signal(bits, mod_scheme, pulse, job.carrier_freq)
+
+    cache = None if cache_dir is None else RenderCache(cache_dir, max_bytes=cache_size)
+    if cache is None:
+        bandpass = render()
+    else:
+        bandpass = cache.get_or_render(render_key(bits, mod_scheme, pulse, job.carrier_freq), render)
+
+    export_transmitted_signal(bandpass, job.file_name, output_dir, sample_format=sample_format)
+
+    return RenderResult(
+        job=job,
+        path=str(Path(output_dir) / job.file_name),
+        bits=len(bits),
+        audio_seconds=len(bandpass.data) / job.fs,
+        render_seconds=time.perf_counter() - t_start,
+        cached=cache is not None and cache.hits > 0
+    )
+
+
+def run_batch(jobs: list[RenderJob], output_dir, sample_format: str = "int16",
+              workers: int = None, progress_callback=None, cache_dir=None,
+              cache_size: int = DEFAULT_CACHE_SIZE) -> list[RenderResult]:
+    """
+    Renders all jobs in a process pool (workers=1: in this process).
+
+    Args:
+        cache_dir: Render cache directory shared by all workers (None: no cache)
+        cache_size: Size bound of the render cache in bytes
+        progress_callback: Called with each RenderResult (in completion order)
+    Returns:
+        All results in job order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+
+    def collect(result):
+        results[result.job] = result
+        if progress_callback:
+            progress_callback(result)
+
+    if workers == 1:
+        for job in jobs:
+            collect(render_job(job, output_dir, sample_format, cache_dir, cache_size))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_job, job, output_dir, sample_format, cache_dir, cache_size)
+                       for job in jobs]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    return [results[job] for job in jobs]
+
+
+def export_batch_index(results: list[RenderResult], path):
+    """Writes one JSON entry per rendered file (parameters + statistics)."""
+    entries = [{**asdict(result.job), **{key: value for key, value in asdict(result).items() if key != "job"}}
+               for result in results]
+    Path(path).write_text(json.dumps(entries, indent=4))
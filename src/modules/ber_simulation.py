@@ -0,0 +1,158 @@
+'''
+Monte Carlo BER / SER Simulation on symbol level.
+
+Sends random bits through SymbolSequencer --> AWGN --> Minimum Distance
+Detector and counts bit and symbol errors. Pulse shaping and the carrier
+are left out: with a Nyquist pulse and matched filter the symbol level
+model gives the same error rates, just a lot faster.
+
+One SNR point is simulated in vectorized batches until enough errors are
+counted (early termination) or the bit budget is used up.
+Independent points of a sweep run in a process pool.
+
+'''
+
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import numpy as np
+
+from src.modules.symbol_sequencer import SymbolSequencer
+from src.modules.helper_functions import create_mod_scheme_lut
+
+
+@dataclass
+class BERPoint:
+    """Result of one simulated point (scheme x mapper x Eb/N0)."""
+    mod_scheme: str
+    mapper: str
+    ebn0_db: float
+    bits: int
+    bit_errors: int
+    symbols: int
+    symbol_errors: int
+    ber: float
+    ser: float
+
+
+def simulate_ber_point(mod_scheme: str, mapper: str, ebn0_db: float,
+                       min_errors: int = 100, max_bits: int = 10_000_000,
+                       batch_bits: int = 200_000, seed: int = None, mapper_seed: int = 0) -> BERPoint:
+    """
+    Simulates a single point of the BER curve.
+
+    Args:
+        mod_scheme: Scheme name as in the GUI, e.g. "4-PSK"
+        mapper: "Gray", "Binary" or "Random"
+        ebn0_db: Energy per bit to noise density ratio in dB
+        min_errors: Stop as soon as this many bit errors are counted
+        max_bits: Upper limit of simulated bits
+        batch_bits: Bits per vectorized batch
+        seed: Seed for bits and noise
+        mapper_seed: Seed of the "Random" mapper (same mapping for the whole curve)
+    """
+    rng = np.random.default_rng(seed)
+
+    mod_scheme_lut = create_mod_scheme_lut(mod_scheme, mapper, mapper_seed=mapper_seed)
+    sequencer = SymbolSequencer(mod_scheme_lut)
+
+    constellation = sequencer.lut_array
+    bits_per_symbol = int(np.log2(len(constellation)))
+
+    # LUT index --> bit chunk (the LUT keys are the binary value of the chunk)
+    shifts = np.arange(bits_per_symbol - 1, -1, -1)
+    index_bits = ((np.arange(len(constellation))[:, None] >> shifts) & 1).astype(np.int8)
+
+    # Noise: Es = mean |s|^2, N0 = Es / (k * Eb/N0), sigma^2 per dimension = N0 / 2
+    es = np.mean(np.abs(constellation) ** 2)
+    n0 = es / (bits_per_symbol * 10 ** (ebn0_db / 10))
+    sigma = np.sqrt(n0 / 2)
+
+    batch_symbols = max(batch_bits // bits_per_symbol, 1)
+
+    bits_total = bit_errors = symbols_total = symbol_errors = 0
+
+    while bit_errors < min_errors and bits_total < max_bits:
+
+        tx_bits = rng.integers(0, 2, size=batch_symbols * bits_per_symbol, dtype=np.int8)
+        tx_symbols = sequencer.map_bits_to_symbols(tx_bits)
+
+        noise = sigma * (rng.standard_normal(batch_symbols) + 1j * rng.standard_normal(batch_symbols))
+        rx_symbols = tx_symbols + noise
+
+        # Minimum distance detection for the whole batch
+        distances = np.abs(rx_symbols[:, None] - constellation[None, :])
+        rx_idx = np.argmin(distances, axis=1)
+
+        rx_bits = index_bits[rx_idx].reshape(-1)
+        tx_idx = tx_bits.reshape(-1, bits_per_symbol) @ (1 << shifts)
+
+        bit_errors += int(np.count_nonzero(rx_bits != tx_bits))
+        symbol_errors += int(np.count_nonzero(rx_idx != tx_idx))
+        bits_total += len(tx_bits)
+        symbols_total += batch_symbols
+
+    return BERPoint(
+        mod_scheme=mod_scheme,
+        mapper=mapper,
+        ebn0_db=float(ebn0_db),
+        bits=bits_total,
+        bit_errors=bit_errors,
+        symbols=symbols_total,
+        symbol_errors=symbol_errors,
+        ber=bit_errors / bits_total,
+        ser=symbol_errors / symbols_total
+    )
+
+
+def run_ber_sweep(mod_schemes, mappers, ebn0_range, min_errors: int = 100,
+                  max_bits: int = 10_000_000, workers: int = None, seed: int = 0,
+                  progress_callback=None) -> list[BERPoint]:
+    """
+    Sweeps scheme x mapper x Eb/N0. Every point is one job in the process pool.
+
+    Args:
+        progress_callback: Called with each finished BERPoint (in completion order)
+    Returns:
+        All points, sorted by scheme, mapper and Eb/N0
+    """
+    jobs = [
+        (mod_scheme, mapper, float(ebn0_db))
+        for mod_scheme in mod_schemes
+        for mapper in mappers
+        for ebn0_db in ebn0_range
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(simulate_ber_point, mod_scheme, mapper, ebn0_db,
+                        min_errors, max_bits, seed=seed + job_idx, mapper_seed=seed)
+            for job_idx, (mod_scheme, mapper, ebn0_db) in enumerate(jobs)
+        ]
+
+        for future in as_completed(futures):
+            point = future.result()
+            results.append(point)
+            if progress_callback:
+                progress_callback(point)
+
+    results.sort(key=lambda p: (p.mod_scheme, p.mapper, p.ebn0_db))
+    return results
+
+
+def export_ber_results(results: list[BERPoint], path):
+    """Writes the results as CSV or JSON (chosen by the file suffix)."""
+    path = Path(path)
+    rows = [asdict(point) for point in results]
+
+    if path.suffix.lower() == ".json":
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(rows, json_file, indent=4)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(BERPoint.__dataclass_fields__))
+            writer.writeheader()
+            writer.writerows(rows)
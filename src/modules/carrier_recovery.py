@@ -0,0 +1,146 @@
+'''
+Carrier Frequency Offset (CFO) and Phase Estimation.
+
+Speaker / Microphone chains and different Sound Card clocks move the
+received carrier away from the nominal `carrier_freq`. After the
+QuadratureDemodulator the baseband therefore rotates with the residual
+offset and PSK symbols can not be decided.
+
+Two stage estimation on the received Preamble and Pilot segments:
+
+    1. Coarse:  Zero padded FFT peak + parabolic interpolation
+    2. Fine:    Least squares fit of the phase slope (vectorized)
+
+The correction is applied with the NCOMixer, no Python loop per sample.
+
+Modulation is removed either data-aided (known reference symbols, e.g. the
+Barker Preamble) or non-data-aided by raising the samples to the power M
+(M-PSK, ASK with M = 2).
+
+'''
+
+from dataclasses import dataclass
+import numpy as np
+
+from src.modules.quadrature_modulator import NCOMixer
+
+
+@dataclass
+class CarrierEstimate:
+    """Result of the estimator. Frequency in Hz, Phase in rad."""
+    freq_offset: float
+    phase_offset: float
+
+
+class CarrierOffsetEstimator:
+    """
+    Estimates and corrects frequency and phase offset of a complex baseband.
+
+    Attributes:
+        fs: Sample rate of the analysed samples (baseband fs or symbol rate)
+        modulation_order: Power M used to strip the modulation (non-data-aided)
+        zero_pad_factor: FFT length = next power of 2 of len(x) * zero_pad_factor
+    """
+
+    def __init__(self, fs: float, modulation_order: int = 2, zero_pad_factor: int = 8):
+        self.fs = fs
+        self.modulation_order = modulation_order
+        self.zero_pad_factor = zero_pad_factor
+
+    def _strip_modulation(self, samples: np.ndarray, reference: np.ndarray):
+        """Returns the unmodulated tone and the power it was raised to."""
+        samples = np.asarray(samples, dtype=complex)
+
+        if reference is not None:
+            return samples * np.conj(reference), 1
+
+        return samples ** self.modulation_order, self.modulation_order
+
+    # ---- 1. Coarse Estimation ----
+    def coarse_estimate(self, samples: np.ndarray, reference: np.ndarray = None) -> float:
+        """
+        Frequency offset from the zero padded FFT peak.
+
+        Returns:
+            Frequency offset in Hz
+        """
+        tone, power = self._strip_modulation(samples, reference)
+
+        n_fft = int(2 ** np.ceil(np.log2(len(tone) * self.zero_pad_factor)))
+        spectrum = np.abs(np.fft.fft(tone, n=n_fft))
+
+        peak = int(np.argmax(spectrum))
+
+        # Parabolic interpolation on the log magnitude of the 3 bins around the peak
+        alpha, beta, gamma = np.log(spectrum[[peak - 1, peak, (peak + 1) % n_fft]] + 1e-12)
+        denominator = alpha - 2 * beta + gamma
+        delta = 0.5 * (alpha - gamma) / denominator if denominator != 0 else 0.0
+
+        # Bin index --> signed frequency
+        bin_freq = np.fft.fftfreq(n_fft, d=1 / self.fs)[peak]
+        freq = bin_freq + delta * self.fs / n_fft
+
+        return freq / power
+
+    # ---- 2. Fine Estimation ----
+    def fine_estimate(self, samples: np.ndarray, reference: np.ndarray = None,
+                      sample_idx: np.ndarray = None) -> CarrierEstimate:
+        """
+        Residual frequency and phase from a least squares fit of the unwrapped phase.
+
+        Args:
+            samples: Samples with small residual offset (after coarse correction)
+            reference: Known symbols (Preamble / Pilots), None for non-data-aided
+            sample_idx: Positions of the samples in the signal (Pilots are not contiguous)
+        """
+        tone, power = self._strip_modulation(samples, reference)
+
+        if sample_idx is None:
+            sample_idx = np.arange(len(tone))
+        t = np.asarray(sample_idx, dtype=float) / self.fs
+
+        phase = np.unwrap(np.angle(tone))
+
+        # Weight with the magnitude: weak samples have unreliable phase
+        weights = np.abs(tone)
+        slope, intercept = np.polyfit(t, phase, deg=1, w=weights)
+
+        return CarrierEstimate(
+            freq_offset=slope / (2 * np.pi * power),
+            phase_offset=float(np.angle(np.exp(1j * intercept))) / power
+        )
+
+    def estimate(self, samples: np.ndarray, reference: np.ndarray = None,
+                 sample_idx: np.ndarray = None) -> CarrierEstimate:
+        """Coarse + Fine estimation in one go."""
+        samples = np.asarray(samples, dtype=complex)
+
+        if sample_idx is None:
+            coarse = self.coarse_estimate(samples, reference)
+            t = np.arange(len(samples)) / self.fs
+        else:
+            # Pilots: the FFT needs equally spaced samples, go straight to the fit.
+            # Residual offset must be below fs / (2 * pilot spacing) --> estimate on Preamble first
+            coarse = 0.0
+            t = np.asarray(sample_idx, dtype=float) / self.fs
+
+        derotated = samples * np.exp(-2j * np.pi * coarse * t)
+        fine = self.fine_estimate(derotated, reference, sample_idx)
+
+        return CarrierEstimate(
+            freq_offset=coarse + fine.freq_offset,
+            phase_offset=fine.phase_offset
+        )
+
+    def correct(self, baseband: np.ndarray, estimate: CarrierEstimate, start_idx: int = 0) -> np.ndarray:
+        """
+        Removes the estimated offset from the baseband with the NCO mixer.
+
+        Args:
+            baseband: Complex baseband (same fs as the estimation)
+            estimate: Result of `estimate`
+            start_idx: Position of baseband[0] relative to the estimation time origin
+        """
+        start_phase = estimate.phase_offset + 2 * np.pi * estimate.freq_offset * start_idx / self.fs
+        mixer = NCOMixer(estimate.freq_offset, self.fs, phase=start_phase)
+        return mixer.mix(baseband)
@@ -0,0 +1,194 @@
+'''
+Acoustic Channel Simulator.
+
+Models the way from the QuadratureModulator output through speaker, room
+and microphone, so the receive path can be tested without real hardware.
+
+Strategy Pattern: every impairment is a ChannelEffect. The AcousticChannel
+applies a chain of effects to a whole batch of signals.
+
+Batches are 2-D arrays (realizations x samples). All effects work on the
+full batch at once, parameters can be fixed or drawn per realization:
+
+    gain_db = 6.0           --> same value for all rows
+    gain_db = (-6.0, 6.0)   --> uniform random value per row
+
+'''
+
+from abc import ABC, abstractmethod
+import numpy as np
+from scipy.signal import oaconvolve
+
+from src.modules.timing_recovery import FarrowInterpolator
+
+
+def _draw(param, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+    """Per realization values (batch_size, 1) from a fixed value, a (low, high) range or an array."""
+    if isinstance(param, tuple):
+        values = rng.uniform(param[0], param[1], size=batch_size)
+    else:
+        values = np.broadcast_to(np.asarray(param, dtype=float), (batch_size,))
+    return values[:, None]
+
+
+# ===========================================================
+#   Channel Effects
+# ===========================================================
+
+class ChannelEffect(ABC):
+
+    @abstractmethod
+    def apply(self, signals: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Args:
+            signals: Batch of signals (realizations x samples)
+            rng: Random generator of the channel (reproducible runs)
+        Returns:
+            Batch of the same shape
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class GainEffect(ChannelEffect):
+    """Speaker / Microphone gain in dB."""
+
+    def __init__(self, gain_db=0.0):
+        self.gain_db = gain_db
+
+    def apply(self, signals, rng):
+        gain = 10 ** (_draw(self.gain_db, len(signals), rng) / 20)
+        return signals * gain
+
+
+class DCOffsetEffect(ChannelEffect):
+    """Constant offset of the A/D Converter."""
+
+    def __init__(self, offset=0.0):
+        self.offset = offset
+
+    def apply(self, signals, rng):
+        return signals + _draw(self.offset, len(signals), rng)
+
+
+class AWGNEffect(ChannelEffect):
+    """
+    Additive white Gaussian noise with a given SNR in dB.
+    The SNR refers to the mean power of each realization.
+    """
+
+    def __init__(self, snr_db):
+        self.snr_db = snr_db
+
+    def apply(self, signals, rng):
+        snr_lin = 10 ** (_draw(self.snr_db, len(signals), rng) / 10)
+        signal_power = np.mean(np.abs(signals) ** 2, axis=-1, keepdims=True)
+        noise_std = np.sqrt(signal_power / snr_lin)
+
+        if np.iscomplexobj(signals):
+            noise = (rng.standard_normal(signals.shape) + 1j * rng.standard_normal(signals.shape)) / np.sqrt(2)
+        else:
+            noise = rng.standard_normal(signals.shape)
+
+        return signals + noise_std * noise
+
+
+class MultipathEffect(ChannelEffect):
+    """
+    Room acoustics as FIR filter (measured or simulated room impulse responses).
+
+    Args:
+        impulse_responses: A single RIR (1-D) or a set of RIRs (2-D, one per row).
+            With a set, every realization gets one RIR at random, unless the
+            number of RIRs equals the batch size (then row by row).
+    """
+
+    def __init__(self, impulse_responses: np.ndarray):
+        self.impulse_responses = np.atleast_2d(np.asarray(impulse_responses))
+
+    def apply(self, signals, rng):
+        num_samples = signals.shape[-1]
+        num_rirs = len(self.impulse_responses)
+
+        if num_rirs == 1 or num_rirs == len(signals):
+            rirs = self.impulse_responses
+        else:
+            rirs = self.impulse_responses[rng.integers(0, num_rirs, size=len(signals))]
+
+        # Overlap-Add FFT convolution: fast for long RIRs, whole batch in one call
+        received = oaconvolve(signals, rirs, mode="full", axes=-1)
+
+        # Keep the length of the transmit signal (causal, the reverb tail is cut)
+        return received[:, :num_samples]
+
+
+class ClockDriftEffect(ChannelEffect):
+    """
+    Sample clock mismatch between sender and receiver in ppm
+    (positive: the receiver samples faster, the signal gets longer).
+    Resampling with the cubic Farrow interpolator, the length is kept.
+    """
+
+    def __init__(self, ppm=0.0, start_offset=0.0):
+        self.ppm = ppm
+        self.start_offset = start_offset
+
+    def apply(self, signals, rng):
+        batch_size, num_samples = signals.shape
+
+        ratio = 1 + _draw(self.ppm, batch_size, rng) * 1e-6
+        offset = _draw(self.start_offset, batch_size, rng)
+
+        # Receiver sample n sees the sender at time (n + offset) / ratio
+        positions = (np.arange(num_samples)[None, :] + offset) / ratio
+
+        # Pad with zeros: positions outside of the signal turn into silence
+        pre, post = FarrowInterpolator.PRE, FarrowInterpolator.POST
+        padded = np.pad(signals, ((0, 0), (pre + 1, post + 1)))
+        positions = np.clip(positions + pre + 1, pre, padded.shape[-1] - post - 1)
+
+        return FarrowInterpolator().interpolate(padded, positions)
+
+
+# ===========================================================
+#   Channel
+# ===========================================================
+
+class AcousticChannel:
+    """
+    Chain of ChannelEffects applied to a batch of signals.
+
+    Typical order (as in the real link):
+        ClockDrift --> Multipath --> Gain --> DCOffset --> AWGN
+    """
+
+    def __init__(self, effects: list[ChannelEffect] = None, seed: int = None):
+        self.effects = effects if effects is not None else []
+        self.rng = np.random.default_rng(seed)
+
+    def add_effect(self, effect: ChannelEffect):
+        self.effects.append(effect)
+        return self
+
+    def simulate(self, signals: np.ndarray, num_realizations: int = None) -> np.ndarray:
+        """
+        Sends a batch of signals through the channel.
+
+        Args:
+            signals: Single signal (1-D) or batch (2-D, realizations x samples)
+            num_realizations: Repeat a single signal for this many realizations
+        Returns:
+            Received batch (2-D), or 1-D for a single signal without realizations
+        """
+        signals = np.asarray(signals)
+        single = signals.ndim == 1
+
+        if single:
+            signals = np.broadcast_to(signals, (num_realizations or 1, len(signals)))
+
+        received = signals
+        for effect in self.effects:
+            received = effect.apply(received, self.rng)
+
+        if single and num_realizations is None:
+            return received[0]
+        return received
@@ -0,0 +1,498 @@
+'''
+Forward Error Correction (FEC) for the Bitstream.
+
+Optional stage between the Bitstream and the SymbolSequencer. Every
+acoustic glitch would otherwise corrupt the data directly.
+
+Strategy Pattern: each code implements `encode` and `decode`.
+
+    ConvolutionalCode:  Rate 1/2, K = 7 (171, 133 octal) with soft decision
+                        Viterbi decoder.
+    ReedSolomonCode:    RS(255, k) over GF(256), byte oriented (burst errors).
+                        Used as outer code in front of a bit-level code.
+
+Soft values follow the 2-ASK / Binary mapping of the app:
+    positive --> bit 1, negative --> bit 0, magnitude = reliability
+
+'''
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class ChannelCode(ABC):
+    """Abstract Base Class for Channel Codes working on bit arrays."""
+
+    name = "Channel Code"
+
+    @abstractmethod
+    def encode(self, bits: np.ndarray) -> np.ndarray:
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def decode(self, received: np.ndarray) -> np.ndarray:
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+# ===========================================================
+#   Convolutional Code + Viterbi Decoder
+# ===========================================================
+
+class ConvolutionalCode(ChannelCode):
+    """
+    Terminated convolutional code (K-1 zero tail bits).
+
+    Decoder:
+        - Add-Compare-Select vectorized over all 2^(K-1) states
+          (and over all frames of a batch)
+        - Sliding traceback window: decisions are only kept for
+          block_len + traceback_depth steps, so frame length is unlimited
+
+    Attributes:
+        constraint_length: K
+        generators: Generator polynomials (octal notation, MSB = current input)
+        traceback_depth: Survivor length before a decision is final (~5K)
+        block_len: Steps decided per traceback
+    """
+
+    name = "Convolutional (r=1/2, K=7)"
+
+    def __init__(self, constraint_length: int = 7, generators=(0o171, 0o133),
+                 traceback_depth: int = 42, block_len: int = 256):
+
+        self.K = constraint_length
+        self.generators = generators
+        self.n_out = len(generators)
+        self.num_states = 2 ** (self.K - 1)
+        self.traceback_depth = traceback_depth
+        self.block_len = block_len
+
+        # Tap vectors: tap[i] belongs to u[n - i]
+        self.taps = np.array(
+            [[(g >> (self.K - 1 - i)) & 1 for i in range(self.K)] for g in generators],
+            dtype=np.int8
+        )
+
+        self._build_trellis()
+
+    def _build_trellis(self):
+        """
+        State = previous K-1 inputs, newest input in the MSB:
+            next_state = (u << (K-2)) | (state >> 1)
+        For every next state the two predecessors and their expected output signs.
+        """
+        msb_shift = self.K - 2
+        next_states = np.arange(self.num_states)
+
+        # Input bit that leads into next_state is its MSB
+        self.input_bit = (next_states >> msb_shift).astype(np.int8)
+
+        # Predecessors: shift back, the dropped (oldest) bit is 0 or 1
+        base = (next_states << 1) & (self.num_states - 1)
+        self.predecessors = np.stack((base, base | 1))                  # (2, num_states)
+
+        # Register content of the transition: (u, state) --> K bits
+        registers = (self.input_bit[None, :].astype(np.int64) << (self.K - 1)) | self.predecessors
+
+        out_bits = np.zeros((2, self.num_states, self.n_out), dtype=np.int8)
+        for j, g in enumerate(self.generators):
+            masked = registers & g
+            out_bits[:, :, j] = np.array([bin(v).count("1") & 1 for v in masked.ravel()]).reshape(masked.shape)
+
+        # Expected soft sign: bit 1 --> +1, bit 0 --> -1
+        expected_signs = (2 * out_bits - 1).astype(np.float64)           # (pred, next_state, n_out)
+
+        # Butterfly layout: next_state = u * half + i has the predecessors 2i and 2i + 1
+        # --> (u, i, pred, n_out), so ACS works on reshaped views without fancy indexing
+        half = self.num_states // 2
+        self.butterfly_signs = expected_signs.transpose(1, 0, 2).reshape(2, half, 2, self.n_out)
+
+    # ---- Encoder ----
+    def encode(self, bits: np.ndarray) -> np.ndarray:
+        """Encodes the bits (+ K-1 tail bits). Output length = 2 * (len(bits) + K - 1)."""
+        bits = np.asarray(bits, dtype=np.int8)
+        terminated = np.concatenate((bits, np.zeros(self.K - 1, dtype=np.int8)))
+
+        # Each output stream is the GF(2) convolution of the input with its taps
+        streams = [np.convolve(terminated, taps)[:len(terminated)] & 1 for taps in self.taps]
+
+        # Interleave: c0[0], c1[0], c0[1], c1[1], ...
+        return np.stack(streams, axis=1).reshape(-1).astype(np.int8)
+
+    # ---- Decoder ----
+    def decode_hard(self, bits: np.ndarray) -> np.ndarray:
+        """Hard decision decoding of received bits."""
+        return self.decode(2.0 * np.asarray(bits, dtype=np.float64) - 1.0)
+
+    def decode(self, received: np.ndarray) -> np.ndarray:
+        """
+        Soft decision Viterbi decoding.
+
+        Args:
+            received: Soft values (positive --> 1). 1-D for one frame or
+                      2-D (frames x values) for a batch of equally long frames.
+        Returns:
+            Decoded bits without the tail, 1-D or 2-D like the input
+        """
+        received = np.asarray(received, dtype=np.float64)
+        single = received.ndim == 1
+        received = np.atleast_2d(received)
+
+        num_frames = received.shape[0]
+        num_steps = received.shape[1] // self.n_out
+        soft = received[:, :num_steps * self.n_out].reshape(num_frames, num_steps, self.n_out)
+
+        decoded = np.zeros((num_frames, num_steps), dtype=np.int8)
+        half = self.num_states // 2
+
+        # Terminated code starts in state 0
+        path_metrics = np.full((num_frames, self.num_states), -np.inf)
+        path_metrics[:, 0] = 0.0
+
+        window = self.block_len + self.traceback_depth
+        decisions = np.zeros((window, num_frames, self.num_states), dtype=np.int8)
+        decided = 0                                        # Steps with final decisions
+
+        for block_start in range(0, num_steps, self.block_len):
+            block_soft = soft[:, block_start:block_start + self.block_len]
+
+            # Branch metrics of all transitions of the block at once: (frames, steps, u, i, pred)
+            branch = np.einsum("ftj,uipj->ftuip", block_soft, self.butterfly_signs)
+
+            for offset in range(block_soft.shape[1]):
+                step = block_start + offset
+
+                # ---- Add-Compare-Select over all states (butterflies) ----
+                candidates = path_metrics.reshape(num_frames, 1, half, 2) + branch[:, offset]
+                choice = candidates[..., 1] > candidates[..., 0]
+                path_metrics = np.maximum(candidates[..., 0], candidates[..., 1]).reshape(num_frames, self.num_states)
+                decisions[step % window] = choice.reshape(num_frames, self.num_states)
+
+                # ---- Sliding Traceback: finalize one block ----
+                if step + 1 - decided == window:
+                    path_metrics -= np.max(path_metrics, axis=1, keepdims=True)
+                    best_states = np.argmax(path_metrics, axis=1)
+                    self._traceback(decisions, best_states, step, decided, decided + self.block_len, decoded)
+                    decided += self.block_len
+
+        # ---- Flush: terminated frames end in state 0 ----
+        end_states = np.zeros(num_frames, dtype=np.int64)
+        self._traceback(decisions, end_states, num_steps - 1, decided, num_steps, decoded)
+
+        # Remove the tail bits
+        decoded = decoded[:, :max(num_steps - (self.K - 1), 0)]
+        return decoded[0] if single else decoded
+
+    def _traceback(self, decisions, states, last_step, first_step, stop_step, decoded):
+        """Follows the survivors from last_step back to first_step, writes bits in [first_step, stop_step)."""
+        window = len(decisions)
+        frames = np.arange(len(states))
+        states = np.asarray(states, dtype=np.int64)
+
+        state_mask = self.num_states - 1
+        msb_shift = self.K - 2
+
+        for step in range(last_step, first_step - 1, -1):
+            if step < stop_step:
+                decoded[:, step] = states >> msb_shift
+            # Predecessor = state shifted back + the stored decision as oldest bit
+            states = ((states << 1) & state_mask) | decisions[step % window][frames, states]
+
+
+# ===========================================================
+#   Reed-Solomon Code over GF(256)
+# ===========================================================
+
+GF_PRIMITIVE_POLY = 0x11d       # x^8 + x^4 + x^3 + x^2 + 1, alpha = 2
+
+
+def _build_gf_tables():
+    """Log / Antilog tables of GF(256). EXP is doubled, so LOG[a] + LOG[b] needs no modulo."""
+    gf_exp = np.zeros(512, dtype=np.int64)
+    gf_log = np.zeros(256, dtype=np.int64)
+
+    value = 1
+    for power in range(255):
+        gf_exp[power] = value
+        gf_log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= GF_PRIMITIVE_POLY
+
+    gf_exp[255:510] = gf_exp[:255]
+    return gf_exp, gf_log
+
+
+GF_EXP, GF_LOG = _build_gf_tables()
+
+# Plain lists for the scalar arithmetic of the per-codeword decoder (faster than numpy scalars)
+_GF_EXP_LIST = GF_EXP.tolist()
+_GF_LOG_LIST = GF_LOG.tolist()
+
+
+def gf_mul(a, b):
+    """Element-wise multiplication in GF(256) (arrays or scalars)."""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    product = GF_EXP[GF_LOG[a] + GF_LOG[b]]
+    return np.where((a == 0) | (b == 0), 0, product)
+
+
+class ReedSolomonCode(ChannelCode):
+    """
+    Systematic RS(n = 255, k) code, corrects up to nsym / 2 byte errors per codeword.
+
+    The bits are packed to bytes (zero padded to a full byte) and split into
+    codewords of k bytes. The last codeword is shortened, so no codeword
+    padding has to be signalled to the receiver. The byte padding is: the
+    payload length travels with the data (e.g. in the frame header), `decode`
+    strips the padding with it (`num_bits`). The instance keeps no per-payload
+    state, so one code can be shared by concurrent jobs.
+
+    Encoder and syndromes are vectorized over all codewords,
+    only codewords with non-zero syndromes are decoded one by one.
+
+    Attributes:
+        nsym: Number of parity bytes per codeword (redundancy)
+    """
+
+    N = 255
+
+    def __init__(self, nsym: int = 32):
+        if not 2 <= nsym < self.N:
+            raise ValueError("Number of parity bytes must be between 2 and 254.")
+
+        self.nsym = nsym
+        self.k = self.N - nsym
+        self.name = f"Reed-Solomon RS(255,{self.k})"
+        self.last_decode_failures = 0
+
+        # Generator g(x) = (x - a^0)(x - a^1)...(x - a^(nsym-1)), highest degree first
+        generator = np.array([1], dtype=np.int64)
+        for i in range(nsym):
+            factor = np.array([1, GF_EXP[i]], dtype=np.int64)
+            product = np.zeros(len(generator) + 1, dtype=np.int64)
+            product[:-1] ^= generator
+            product[1:] ^= gf_mul(generator, factor[1])
+            generator = product
+        self.generator = generator
+
+        # Powers of alpha for the syndromes: a^(i * p), p = power of the codeword position
+        self._syndrome_powers = np.arange(nsym)[:, None] * np.arange(self.N)[None, :]
+
+    # ---- Helpers ----
+    def _bits_to_codeword_bytes(self, bits: np.ndarray, block_len: int):
+        """Packs the bits and splits them into rows of block_len bytes (last row may be shorter)."""
+        data = np.packbits(np.asarray(bits, dtype=np.uint8)).astype(np.int64)
+        num_full = len(data) // block_len
+        full_rows = data[:num_full * block_len].reshape(num_full, block_len)
+        remainder = data[num_full * block_len:]
+        return full_rows, remainder
+
+    # ---- Encoder ----
+    def encode_bytes(self, messages: np.ndarray) -> np.ndarray:
+        """
+        Encodes a batch of messages (rows of k bytes) to codewords (rows of n bytes).
+        LFSR division by g(x), one column per step, all codewords at once.
+        """
+        messages = np.atleast_2d(np.asarray(messages, dtype=np.int64))
+        parity = np.zeros((len(messages), self.nsym), dtype=np.int64)
+
+        for column in messages.T:
+            feedback = column ^ parity[:, 0]
+            parity[:, :-1] = parity[:, 1:]
+            parity[:, -1] = 0
+            parity ^= gf_mul(feedback[:, None], self.generator[None, 1:])
+
+        return np.concatenate((messages, parity), axis=1)
+
+    def encode(self, bits: np.ndarray) -> np.ndarray:
+        full_rows, remainder = self._bits_to_codeword_bytes(bits, self.k)
+        codewords = self.encode_bytes(full_rows).reshape(-1) if len(full_rows) else np.zeros(0, dtype=np.int64)
+
+        if len(remainder):
+            # Shortened codeword: leading zeros do not change the parity
+            padded = np.concatenate((np.zeros(self.k - len(remainder), dtype=np.int64), remainder))
+            last = self.encode_bytes(padded)[0, self.k - len(remainder):]
+            codewords = np.concatenate((codewords, last))
+
+        return np.unpackbits(codewords.astype(np.uint8)).astype(np.int8)
+
+    # ---- Decoder ----
+    def syndromes(self, codewords: np.ndarray) -> np.ndarray:
+        """
+        Syndromes S_i = C(a^i) of a batch of codewords (rows of equal length).
+        Returns: (num_codewords, nsym)
+        """
+        codewords = np.atleast_2d(np.asarray(codewords, dtype=np.int64))
+        length = codewords.shape[1]
+
+        # Byte j is the coefficient of x^(length - 1 - j)
+        powers = self._syndrome_powers[:, :length][:, ::-1] % 255           # (nsym, length)
+        synd = np.zeros((len(codewords), self.nsym), dtype=np.int64)
+
+        # Chunks of codewords keep the (chunk, nsym, length) term array small
+        chunk_size = 64
+        for start in range(0, len(codewords), chunk_size):
+            chunk = codewords[start:start + chunk_size, None, :]             # (chunk, 1, length)
+
+            terms = GF_EXP[GF_LOG[chunk] + powers[None, :, :]]
+            terms[np.broadcast_to(chunk == 0, terms.shape)] = 0
+
+            synd[start:start + chunk_size] = np.bitwise_xor.reduce(terms, axis=2)
+
+        return synd
+
+    def _correct_codeword(self, codeword: np.ndarray, synd: np.ndarray) -> bool:
+        """Berlekamp-Massey + Chien search + Forney. Corrects in place, False if not decodable."""
+        gf_exp, gf_log = _GF_EXP_LIST, _GF_LOG_LIST
+
+        def mul(a, b):
+            return 0 if a == 0 or b == 0 else gf_exp[gf_log[a] + gf_log[b]]
+
+        def inverse(a):
+            return gf_exp[255 - gf_log[a]]
+
+        synd = [int(v) for v in synd]
+
+        # ---- 1. Berlekamp-Massey: error locator Lambda(x), ascending powers ----
+        locator = [1] + [0] * self.nsym
+        previous = [1] + [0] * self.nsym
+        num_errors, shift, last_delta = 0, 1, 1
+
+        for n in range(self.nsym):
+            delta = synd[n]
+            for i in range(1, num_errors + 1):
+                delta ^= mul(locator[i], synd[n - i])
+
+            if delta == 0:
+                shift += 1
+                continue
+
+            scale = mul(delta, inverse(last_delta))
+            updated = locator.copy()
+            for i in range(self.nsym + 1 - shift):
+                if previous[i]:
+                    updated[i + shift] ^= mul(scale, previous[i])
+
+            if 2 * num_errors <= n:
+                previous, last_delta = locator, delta
+                num_errors = n + 1 - num_errors
+                shift = 1
+            else:
+                shift += 1
+            locator = updated
+
+        locator = locator[:num_errors + 1]
+        if 2 * num_errors > self.nsym:
+            return False
+
+        # ---- 2. Chien search: roots X^-1 = a^-p for all positions at once ----
+        locator_arr = np.array(locator, dtype=np.int64)
+        length = len(codeword)
+        positions = np.arange(length)
+        exponents = (GF_LOG[locator_arr][:, None] - np.arange(num_errors + 1)[:, None] * positions[None, :]) % 255
+        terms = np.where(locator_arr[:, None] == 0, 0, GF_EXP[exponents])
+        error_powers = positions[np.bitwise_xor.reduce(terms, axis=0) == 0]
+
+        if len(error_powers) != num_errors:
+            return False
+
+        # ---- 3. Forney: e = X * Omega(X^-1) / Lambda'(X^-1) ----
+        omega = [0] * self.nsym                        # S(x) * Lambda(x) mod x^nsym
+        for i, s_i in enumerate(synd):
+            for j in range(min(num_errors + 1, self.nsym - i)):
+                omega[i + j] ^= mul(s_i, locator[j])
+
+        for power in error_powers:
+            x_inv = gf_exp[(255 - int(power)) % 255]
+
+            omega_val, x_pow = 0, 1
+            for coef in omega:
+                omega_val ^= mul(coef, x_pow)
+                x_pow = mul(x_pow, x_inv)
+
+            # Formal derivative in GF(2^m): only odd powers remain
+            derivative_val, x_pow = 0, 1
+            x_inv_sq = mul(x_inv, x_inv)
+            for i in range(1, num_errors + 1, 2):
+                derivative_val ^= mul(locator[i], x_pow)
+                x_pow = mul(x_pow, x_inv_sq)
+
+            if derivative_val == 0:
+                return False
+
+            magnitude = mul(mul(gf_exp[int(power)], omega_val), inverse(derivative_val))
+            codeword[length - 1 - power] ^= magnitude
+
+        return True
+
+    def decode_bytes(self, codewords: np.ndarray) -> np.ndarray:
+        """Corrects a batch of codewords (rows of equal length), returns the message bytes."""
+        codewords = np.atleast_2d(np.asarray(codewords, dtype=np.int64)).copy()
+
+        synd = self.syndromes(codewords)
+        corrupted = np.flatnonzero(np.any(synd != 0, axis=1))
+
+        for row in corrupted:
+            if not self._correct_codeword(codewords[row], synd[row]):
+                self.last_decode_failures += 1
+
+        return codewords[:, :-self.nsym]
+
+    def decode(self, received: np.ndarray, num_bits: int = None) -> np.ndarray:
+        """
+        Decodes hard bits.
+
+        Args:
+            num_bits: Payload length in bits (None: keep the zero padding to full bytes)
+        Returns:
+            The payload bits
+        """
+        self.last_decode_failures = 0
+        full_rows, remainder = self._bits_to_codeword_bytes(received, self.N)
+
+        messages = [self.decode_bytes(full_rows).reshape(-1)] if len(full_rows) else []
+        if len(remainder) > self.nsym:
+            messages.append(self.decode_bytes(remainder)[0])
+
+        if not messages:
+            return np.zeros(0, dtype=np.int8)
+
+        payload = np.unpackbits(np.concatenate(messages).astype(np.uint8)).astype(np.int8)
+        return payload if num_bits is None else payload[:num_bits]
+
+
+def benchmark_reed_solomon(num_bytes: int = 1_000_000, nsym: int = 32, errors_per_codeword: int = 4, seed: int = 0):
+    """Measures encoder and decoder throughput in MB/s (payload bytes)."""
+    import time
+
+    rng = np.random.default_rng(seed)
+    code = ReedSolomonCode(nsym)
+
+    num_codewords = num_bytes // code.k
+    messages = rng.integers(0, 256, size=(num_codewords, code.k))
+
+    start = time.perf_counter()
+    codewords = code.encode_bytes(messages)
+    encode_time = time.perf_counter() - start
+
+    # Random byte errors in every codeword
+    rows = np.repeat(np.arange(num_codewords), errors_per_codeword)
+    cols = np.concatenate([rng.choice(code.N, errors_per_codeword, replace=False) for _ in range(num_codewords)])
+    codewords[rows, cols] ^= rng.integers(1, 256, size=len(rows))
+
+    start = time.perf_counter()
+    decoded = code.decode_bytes(codewords)
+    decode_time = time.perf_counter() - start
+
+    payload_mb = messages.size / 1e6
+    return {
+        "encode_mb_s": payload_mb / encode_time,
+        "decode_mb_s": payload_mb / decode_time,
+        "all_corrected": bool(np.array_equal(decoded, messages)),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark_reed_solomon())
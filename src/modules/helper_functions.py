@@ -1,8 +1,12 @@
 import json
 import numpy as np
-from scipy.io import wavfile
 from pathlib import Path
-from src.dataclasses.dataclass_models import BandpassSignal, BitStream
+from src.constants import PulseShape
+from src.dataclasses.dataclass_models import BandpassSignal, BitStream, ModSchemeLUT, PulseSignal
+from src.modules.bit_mapping import BinaryMapper, GrayMapper, RandomMapper
+from src.modules.modulation_schemes import AmpShiftKeying, PhaseShiftKeying
+from src.modules.pulse_shapes import CosineSquarePulse, RectanglePulse, RaisedCosinePulse
+from src.modules.wav_io import write_wav_blocks
 
 
 # ===========================================================
@@ -10,24 +14,58 @@ from src.dataclasses.dataclass_models import BandpassSignal, BitStream
 # ===========================================================
 
 
-def export_transmitted_signal(signal: BandpassSignal, filename, filepath):
+EXPORT_BLOCK_FRAMES = 65536
+
+
+def signal_peak(data: np.ndarray, block_frames: int = EXPORT_BLOCK_FRAMES) -> float:
+    """Peak magnitude, scanned block-wise (no full size temporary array)."""
+    peak = 0.0
+    for start in range(0, len(data), block_frames):
+        peak = max(peak, float(np.max(np.abs(data[start:start + block_frames]))))
+    return peak
+
+
+def write_normalized_wav(data: np.ndarray, fs: int, path, sample_format: str = "int16", peak: float = None):
+    """
+    Writes a signal as WAV, block by block, normalized to `peak`
+    (None: the peak of the data, computed once).
+    1-D data gives a mono file, (samples x channels) a multichannel file.
+
+    Returns:
+        The closed WavWriter (frames_written, clipped_samples)
     """
-    Export a signal as a WAV file.
+    if peak is None:
+        peak = signal_peak(data)
+
+    channels = data.shape[1] if data.ndim == 2 else 1
+    blocks = (data[start:start + EXPORT_BLOCK_FRAMES] for start in range(0, len(data), EXPORT_BLOCK_FRAMES))
+
+    return write_wav_blocks(blocks, path, fs, channels=channels, sample_format=sample_format, peak=peak or None)
+
+
+def export_transmitted_signal(signal: BandpassSignal, filename, filepath, sample_format: str = "int16",
+                              peak: float = None, data: np.ndarray = None):
+    """
+    Export a signal as a WAV file (streamed in blocks) with a JSON sidecar.
 
     Parameters:
+    signal (BandpassSignal): The transmitted signal container.
     filename (str): The name of the output WAV file.
-    signal (np.ndarray): The audio signal data.
-    fs (int): The sampling frequency.
+    filepath (str): The output directory.
+    sample_format (str): "int16", "int24" or "float32".
+    peak (float): Normalization peak, e.g. a known bound (None: computed from the data).
+    data (np.ndarray): Samples to write instead of signal.data, e.g. all channels
+                       (samples x channels) of a multichannel transmission.
     """
-    # Normalize signal to the range of int16
-
     full_path = Path(filepath) / filename
-    data = signal.data
+    data = signal.data if data is None else data
     fs = signal.baseband_signal.fs
-    normalized_signal = np.int16((data / np.max(np.abs(data))) * 32767)
+
+    if peak is None:
+        peak = signal_peak(data)
 
     try:
-        wavfile.write(str(full_path), fs, normalized_signal)
+        write_normalized_wav(data, fs, full_path, sample_format=sample_format, peak=peak)
 
     except Exception as e:
         print(f"Error during WAV file export: {e}")
@@ -35,6 +73,9 @@ def export_transmitted_signal(signal: BandpassSignal, filename, filepath):
     metadata = {
         "name": filename,
         "fs": fs,
+        "channels": data.shape[1] if data.ndim == 2 else 1,
+        "sample_format": sample_format,
+        "peak": peak,
         "sym_rate": signal.baseband_signal.sym_rate,
         "carrier_freq": signal.carrier_freq,
         "pulse": {
@@ -47,10 +88,7 @@ def export_transmitted_signal(signal: BandpassSignal, filename, filepath):
 
     try:
 
-        data = json.dumps([
-            {k: metadata[k] for k in metadata}],
-            indent=4,
-            )
+        data = json.dumps([metadata], indent=4)
 
         with open(full_path.with_suffix('.json'), 'w') as json_file:
             json_file.write(data)
@@ -60,9 +98,89 @@ def export_transmitted_signal(signal: BandpassSignal, filename, filepath):
 
 
 
+BARKER_BITS = np.array([1, 1, 1, 0, 0, 1, 0])
+
+
 def add_barker_code(bitstream: BitStream):
-    barker_bits = np.array([1,1,1,0,0,1,0])
+    barker_bits = BARKER_BITS
 
     bitstream = np.concatenate((barker_bits,bitstream.data))
 
-    return bitstream
\ No newline at end of file
+    return bitstream
+
+
+def create_barker_symbols(mod_scheme: ModSchemeLUT) -> np.ndarray:
+    """
+    Maps the Barker-7 bits to the two most distant symbols (min / max real part)
+    of the Look-Up Table, for maximum preamble contrast.
+    """
+    symbols = list(mod_scheme.look_up_table.values())
+    s_min = symbols[np.argmin(np.real(symbols))]
+    s_max = symbols[np.argmax(np.real(symbols))]
+
+    return np.where(BARKER_BITS == 1, s_max, s_min)
+
+
+def create_mod_scheme_lut(sel_mod_scheme: str, sel_mapper: str, mapper_seed: int = None) -> ModSchemeLUT:
+    """
+    Creates the Look-Up Table container for a scheme name like "4-PSK"
+    and a mapper name ("Binary", "Gray", "Random").
+    """
+    mappers = {
+        "Binary": BinaryMapper,
+        "Gray": GrayMapper,
+        "Random": lambda: RandomMapper(seed=mapper_seed),
+    }
+    schemes = {
+        "ASK": AmpShiftKeying,
+        "PSK": PhaseShiftKeying,
+    }
+
+    if sel_mapper not in mappers:
+        raise ValueError(f"Unsupported bit mapping: {sel_mapper}")
+
+    try:
+        cardinality_str, scheme_name = sel_mod_scheme.split("-")
+        cardinality = int(cardinality_str)
+        scheme_cls = schemes[scheme_name]
+    except (ValueError, KeyError):
+        raise ValueError(f"Unsupported modulation scheme: {sel_mod_scheme}")
+
+    lut_data = scheme_cls(cardinality, mapper=mappers[sel_mapper]()).codebook
+
+    return ModSchemeLUT(
+        name=f"{sel_mod_scheme} LUT",
+        data=None,
+        look_up_table=lut_data,
+        cardinality=cardinality,
+        mapper=sel_mapper,
+        mod_scheme=sel_mod_scheme
+    )
+
+
+def create_pulse_signal(pulse_type: str, sym_rate: int, fs: int, span: int, roll_off: float = None) -> PulseSignal:
+    """
+    Creates the Pulse container for a pulse shape name ("rectangle",
+    "cosine_squared", "raised_cosine").
+    """
+    pulse_generators = {
+        PulseShape.RECTANGLE: RectanglePulse,
+        PulseShape.COSINE_SQUARED: CosineSquarePulse,
+        PulseShape.RAISED_COSINE: RaisedCosinePulse,
+    }
+
+    generator_cls = pulse_generators.get(pulse_type)
+    if not generator_cls:
+        raise ValueError(f"Unknown Pulse Shape: {pulse_type}")
+
+    pulse_data = generator_cls(sym_rate, fs, span, roll_off).generate()
+
+    return PulseSignal(
+        name=f"{pulse_type} Pulse",
+        data=pulse_data,
+        fs=fs,
+        sym_rate=sym_rate,
+        shape=pulse_type,
+        span=span,
+        roll_off=roll_off
+    )
@@ -0,0 +1,55 @@
+'''
+Multichannel Transmission.
+
+Stereo / multichannel sound cards can carry independent bitstreams at the
+same time: N output channels --> N times the throughput at the same symbol
+rate. Every channel is modulated on its own (own bits, same carrier) with
+the same chain as a single channel transmission, plain or packetized. The
+app splits its one Bitstream over the channels (`split_bits`).
+
+Array layout as in sounddevice and WAV files: (samples x channels).
+
+'''
+
+import numpy as np
+
+from src.dataclasses.dataclass_models import BandpassSignal, ModSchemeLUT, PulseSignal
+from src.modules.packetizer import create_bandpass_signal, create_framed_bandpass_signal
+
+
+def split_bits(bits: np.ndarray, channels: int) -> list[np.ndarray]:
+    """Splits one Bitstream into `channels` contiguous parts (the first parts are one bit longer)."""
+    return np.array_split(np.asarray(bits), channels)
+
+
+def stack_channels(signals: list[np.ndarray]) -> np.ndarray:
+    """Joins 1-D signals to one (samples x channels) array, shorter channels are zero padded."""
+    num_samples = max((len(sig) for sig in signals), default=0)
+
+    stacked = np.zeros((num_samples, len(signals)))
+    for channel, sig in enumerate(signals):
+        stacked[:len(sig), channel] = np.real(sig)
+
+    return stacked
+
+
+def create_channel_signals(bit_streams: list[np.ndarray], mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                           carrier_freq: int, codes=(), frame_bits: int = None) -> list[BandpassSignal]:
+    """
+    One transmit container per output channel (in this process), e.g. for
+    the plots of a multichannel transmission. Join with `stack_channels`.
+
+    Args:
+        frame_bits: Payload bits per CRC-32 frame (None: unframed)
+    """
+    signals = []
+    for channel, bits in enumerate(bit_streams):
+        if frame_bits is None:
+            bandpass = create_bandpass_signal(bits, mod_scheme, pulse, carrier_freq, codes)
+        else:
+            bandpass = create_framed_bandpass_signal(bits, mod_scheme, pulse, carrier_freq,
+                                                     payload_bits=frame_bits, codes=codes, workers=1)
+        bandpass.name = f"Channel {channel + 1}/{len(bit_streams)}: {bandpass.name}"
+        signals.append(bandpass)
+
+    return signals
@@ -0,0 +1,337 @@
+'''
+Framing Layer: Packetizer + parallel Frame Modulation.
+
+One long Bitstream with a single Preamble is lost completely after a
+single sync loss. The Packetizer splits the payload into short numbered
+frames, each protected by a CRC-32, and every frame gets its own Barker
+Preamble. A receiver can resync on every frame and drop only the broken
+ones.
+
+Frame layout (bits, MSB first):
+
+    | seq (16) | length (16) | payload (length bits) | CRC-32 (32) |
+
+The CRC is computed byte-wise (table-driven) over the `np.packbits` output
+of header + payload. It is the standard reflected CRC-32 (zlib / Ethernet).
+
+Frames are independent, so they are modulated in a process pool and
+concatenated with guard gaps of silence. `create_framed_bandpass_signal`
+returns the joined frames as containers (app transmit path with framing).
+
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import numpy as np
+from scipy import signal
+
+from src.dataclasses.dataclass_models import BandpassSignal, BasebandSignal, ModSchemeLUT, PulseSignal, SymbolStream, BitStream
+from src.modules.symbol_sequencer import SymbolSequencer
+from src.modules.quadrature_modulator import QuadratureModulator
+from src.modules.helper_functions import create_barker_symbols
+
+
+# ===========================================================
+#   CRC-32 (table-driven)
+# ===========================================================
+
+CRC32_POLY = 0xEDB88320             # Reflected 0x04C11DB7
+
+
+def _build_crc32_table() -> np.ndarray:
+    """CRC of every possible byte value, so the CRC advances one byte per lookup."""
+    table = np.zeros(256, dtype=np.uint32)
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ CRC32_POLY if crc & 1 else crc >> 1
+        table[byte] = crc
+    return table
+
+
+CRC32_TABLE = _build_crc32_table()
+
+
+def crc32_bytes(data: np.ndarray) -> np.ndarray:
+    """
+    Table-driven CRC-32 over bytes.
+
+    Args:
+        data: uint8 array, 1-D (one message) or 2-D (one message per row, same length)
+    Returns:
+        CRC as uint32 (scalar for 1-D, one per row for 2-D)
+    """
+    data = np.atleast_2d(np.asarray(data, dtype=np.uint8))
+
+    # Byte by byte, but vectorized over all messages
+    crc = np.full(len(data), 0xFFFFFFFF, dtype=np.uint32)
+    for column in data.T:
+        crc = CRC32_TABLE[(crc ^ column) & 0xFF] ^ (crc >> 8)
+    crc ^= np.uint32(0xFFFFFFFF)
+
+    return crc if data.shape[0] > 1 else crc[0]
+
+
+def crc32_bits(bits: np.ndarray) -> int:
+    """CRC-32 of a bit array (zero padded to full bytes by np.packbits)."""
+    return int(crc32_bytes(np.packbits(np.asarray(bits, dtype=np.uint8))))
+
+
+def _int_to_bits(value: int, num_bits: int) -> np.ndarray:
+    shifts = np.arange(num_bits - 1, -1, -1)
+    return ((value >> shifts) & 1).astype(np.int8)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int(np.asarray(bits, dtype=np.int64) @ (1 << np.arange(len(bits) - 1, -1, -1)))
+
+
+# ===========================================================
+#   Packetizer
+# ===========================================================
+
+@dataclass
+class Frame:
+    """A received frame after the CRC check."""
+    seq: int
+    payload: np.ndarray
+    crc_ok: bool
+
+
+class Packetizer:
+    """
+    Splits a Bitstream into numbered frames with length header and CRC-32.
+
+    Attributes:
+        payload_bits: Payload per frame (the last frame may be shorter)
+    """
+
+    SEQ_BITS = 16
+    LEN_BITS = 16
+    CRC_BITS = 32
+    HEADER_BITS = SEQ_BITS + LEN_BITS
+
+    def __init__(self, payload_bits: int = 1024):
+        if not 0 < payload_bits < 2 ** self.LEN_BITS:
+            raise ValueError(f"Payload per frame must be between 1 and {2 ** self.LEN_BITS - 1} bits.")
+        self.payload_bits = payload_bits
+
+    def packetize(self, bits: np.ndarray) -> list[np.ndarray]:
+        """
+        Args:
+            bits: Payload Bitstream
+        Returns:
+            List of frame bit arrays (header + payload + CRC)
+        """
+        bits = np.asarray(bits, dtype=np.int8)
+        num_frames = max(int(np.ceil(len(bits) / self.payload_bits)), 1)
+
+        if num_frames > 2 ** self.SEQ_BITS:
+            raise ValueError(f"Payload too long: more than {2 ** self.SEQ_BITS} frames.")
+
+        frames = []
+        for seq in range(num_frames):
+            payload = bits[seq * self.payload_bits:(seq + 1) * self.payload_bits]
+            header = np.concatenate((_int_to_bits(seq, self.SEQ_BITS), _int_to_bits(len(payload), self.LEN_BITS)))
+            frames.append(np.concatenate((header, payload)))
+
+        # CRC of all full frames in one vectorized pass, the short last frame separately
+        full = [frame for frame in frames if len(frame) == self.HEADER_BITS + self.payload_bits]
+        crcs = []
+        if full:
+            crcs = np.atleast_1d(crc32_bytes(np.packbits(np.asarray(full, dtype=np.uint8), axis=1))).tolist()
+        if len(full) < len(frames):
+            crcs.append(crc32_bits(frames[-1]))
+
+        return [np.concatenate((frame, _int_to_bits(crc, self.CRC_BITS))) for frame, crc in zip(frames, crcs)]
+
+    def depacketize(self, frame_bits: np.ndarray) -> Frame:
+        """
+        Parses one received frame (hard decided bits) and checks the CRC.
+        Extra bits behind the CRC (symbol padding, FEC tail) are ignored.
+        """
+        frame_bits = np.asarray(frame_bits, dtype=np.int8)
+
+        if len(frame_bits) < self.HEADER_BITS + self.CRC_BITS:
+            return Frame(seq=-1, payload=np.zeros(0, dtype=np.int8), crc_ok=False)
+
+        seq = _bits_to_int(frame_bits[:self.SEQ_BITS])
+        length = _bits_to_int(frame_bits[self.SEQ_BITS:self.HEADER_BITS])
+
+        crc_start = self.HEADER_BITS + length
+        if crc_start + self.CRC_BITS > len(frame_bits):
+            return Frame(seq=seq, payload=np.zeros(0, dtype=np.int8), crc_ok=False)
+
+        received_crc = _bits_to_int(frame_bits[crc_start:crc_start + self.CRC_BITS])
+        crc_ok = crc32_bits(frame_bits[:crc_start]) == received_crc
+
+        return Frame(seq=seq, payload=frame_bits[self.HEADER_BITS:crc_start], crc_ok=crc_ok)
+
+    @staticmethod
+    def reassemble(frames: list[Frame]) -> np.ndarray:
+        """Joins the payload of all frames with valid CRC in sequence order."""
+        valid = sorted((frame for frame in frames if frame.crc_ok), key=lambda frame: frame.seq)
+        if not valid:
+            return np.zeros(0, dtype=np.int8)
+        return np.concatenate([frame.payload for frame in valid])
+
+
+# ===========================================================
+#   Frame Modulation
+# ===========================================================
+
+def code_and_pad_bits(bits: np.ndarray, mod_scheme: ModSchemeLUT, codes=()) -> np.ndarray:
+    """Channel codes (outer first), then zero padding to full symbols: exactly the bits that get mapped."""
+    coded_bits = bits
+    for code in codes:
+        coded_bits = code.encode(coded_bits)
+
+    # Pad to full symbols, the SymbolSequencer would drop the remainder
+    bits_per_symbol = int(np.log2(mod_scheme.cardinality))
+    return np.concatenate((coded_bits, np.zeros(-len(coded_bits) % bits_per_symbol, dtype=np.int8)))
+
+
+def create_bandpass_signal(bits: np.ndarray, mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                           carrier_freq: int, codes=()) -> BandpassSignal:
+    """
+    Full transmit chain as containers:
+    Channel Codes --> Symbols --> Barker Preamble + Pulse Shaping --> IQ Modulation.
+    """
+    coded_bits = code_and_pad_bits(bits, mod_scheme, codes)
+    symbols = SymbolSequencer(mod_scheme).map_bits_to_symbols(coded_bits)
+
+    # Preamble shaped on its own and put in front of the data, as in the app:
+    # its pulse tail does not overlap the first data symbols
+    sps = pulse.fs // pulse.sym_rate
+    barker_baseband = signal.upfirdn(h=pulse.data, x=create_barker_symbols(mod_scheme), up=sps)
+    bb_data = np.concatenate((barker_baseband, signal.upfirdn(h=pulse.data, x=symbols, up=sps)))
+
+    baseband = BasebandSignal(
+        name="Frame Baseband Signal",
+        data=bb_data,
+        fs=pulse.fs,
+        sym_rate=pulse.sym_rate,
+        pulse=pulse,
+        symbol_stream=SymbolStream(
+            name="Frame Symbol Stream",
+            data=symbols,
+            mod_scheme=mod_scheme,
+            bit_stream=BitStream(name="Frame Bit Stream", data=coded_bits)
+        )
+    )
+
+    return BandpassSignal(
+        name="Frame Bandpass Signal",
+        data=QuadratureModulator(carrier_freq).modulate(baseband),
+        fs=pulse.fs,
+        sym_rate=pulse.sym_rate,
+        baseband_signal=baseband,
+        carrier_freq=carrier_freq
+    )
+
+
+def modulate_frame(frame_bits: np.ndarray, mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                   carrier_freq: int, codes=()) -> np.ndarray:
+    """
+    One frame: Channel Codes --> Symbols --> Barker Preamble + Pulse Shaping --> IQ Modulation.
+    Module level function, so it can be sent to worker processes.
+    """
+    return create_bandpass_signal(frame_bits, mod_scheme, pulse, carrier_freq, codes).data
+
+
+def _map_frames(job, frames: list, workers: int = None) -> list:
+    """`job` for every frame, in a process pool unless workers=1 (or a single frame)."""
+    if workers == 1 or len(frames) < 2:
+        return [job(frame) for frame in frames]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(job, frames))
+
+
+def _join_with_guards(waveforms: list[np.ndarray], guard_samples: int) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenates waveforms with `guard_samples` zeros in between --> (joined, start of every waveform)."""
+    lengths = np.array([len(waveform) for waveform in waveforms], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths + guard_samples)[:-1])).astype(np.int64)
+
+    # Preallocated output, the guards stay zero
+    total_len = int(starts[-1] + lengths[-1]) if len(waveforms) else 0
+    dtype = np.result_type(*waveforms) if len(waveforms) else np.float64
+    output = np.zeros(total_len, dtype=dtype)
+    for start, waveform in zip(starts, waveforms):
+        output[start:start + len(waveform)] = waveform
+
+    return output, starts
+
+
+def modulate_frames(frames: list[np.ndarray], mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                    carrier_freq: int, codes=(), guard_time: float = 0.05,
+                    workers: int = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Modulates all frames independently and joins them with guard gaps.
+
+    Args:
+        frames: Output of Packetizer.packetize
+        codes: Channel codes applied per frame (outer first)
+        guard_time: Silence between two frames in seconds
+        workers: Worker processes (None: all cores, 1: no pool)
+    Returns:
+        (bandpass signal, start sample of every frame)
+    """
+    job = partial(modulate_frame, mod_scheme=mod_scheme, pulse=pulse, carrier_freq=carrier_freq, codes=tuple(codes))
+    waveforms = _map_frames(job, frames, workers)
+
+    return _join_with_guards(waveforms, int(round(guard_time * pulse.fs)))
+
+
+def create_framed_bandpass_signal(bits: np.ndarray, mod_scheme: ModSchemeLUT, pulse: PulseSignal,
+                                  carrier_freq: int, payload_bits: int = 1024, codes=(),
+                                  guard_time: float = 0.05, workers: int = 1) -> BandpassSignal:
+    """
+    Packetized transmit chain as containers: Packetizer --> per frame
+    Channel Codes + Barker Preamble + Pulse Shaping + IQ Modulation --> frames with guard gaps.
+
+    Baseband, Symbol Stream and Bitstream of the result are the joined frames
+    (the Baseband with the same guard gaps), so plots, playback and export
+    all show the transmitted frames.
+
+    Args:
+        payload_bits: Payload per frame
+        workers: Worker processes (1: no pool, None: all cores)
+    """
+    frames = Packetizer(payload_bits).packetize(bits)
+
+    job = partial(create_bandpass_signal, mod_scheme=mod_scheme, pulse=pulse, carrier_freq=carrier_freq, codes=tuple(codes))
+    frame_signals = _map_frames(job, frames, workers)
+
+    guard_samples = int(round(guard_time * pulse.fs))
+    iq_data, _ = _join_with_guards([frame.data for frame in frame_signals], guard_samples)
+    bb_data, _ = _join_with_guards([frame.baseband_signal.data for frame in frame_signals], guard_samples)
+
+    symbol_streams = [frame.baseband_signal.symbol_stream for frame in frame_signals]
+
+    baseband = BasebandSignal(
+        name="Framed Baseband Signal",
+        data=bb_data,
+        fs=pulse.fs,
+        sym_rate=pulse.sym_rate,
+        pulse=pulse,
+        symbol_stream=SymbolStream(
+            name=f"Framed Symbol Stream ({len(frames)} Frames)",
+            data=np.concatenate([stream.data for stream in symbol_streams]),
+            mod_scheme=mod_scheme,
+            bit_stream=BitStream(
+                name=f"Framed Bit Stream ({len(frames)} Frames)",
+                data=np.concatenate([stream.bit_stream.data for stream in symbol_streams])
+            )
+        )
+    )
+
+    return BandpassSignal(
+        name=f"Framed Bandpass Signal ({len(frames)} Frames)",
+        data=iq_data,
+        fs=pulse.fs,
+        sym_rate=pulse.sym_rate,
+        baseband_signal=baseband,
+        carrier_freq=carrier_freq
+    )
@@ -60,5 +60,29 @@ class QuadratureDemodulator(Modulator):
         return baseband_signal
 
 
+class NCOMixer:
+    """
+    Numerically Controlled Oscillator as complex mixer.
 
+    Shifts a complex signal down by `freq` (x * e^(-j(2*pi*f*n/fs + phase))).
+    The phase is carried over between calls, so a long signal can be mixed
+    block by block without phase jumps. Vectorized over the whole block.
+    """
 
+    def __init__(self, freq: float, fs: int, phase: float = 0.0):
+        self.freq = freq
+        self.fs = fs
+        self.phase = phase
+
+    def mix(self, signal_block: np.ndarray) -> np.ndarray:
+
+        num_samples = len(signal_block)
+        phase_step = 2 * np.pi * self.freq / self.fs
+
+        phase_vector = self.phase + phase_step * np.arange(num_samples)
+        mixed = signal_block * np.exp(-1j * phase_vector)
+
+        # Phase continuity for the next block
+        self.phase = float(np.mod(self.phase + phase_step * num_samples, 2 * np.pi))
+
+        return mixed
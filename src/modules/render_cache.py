@@ -0,0 +1,193 @@
+'''
+Content-Addressed Render Cache.
+
+Rendered transmit signals are stored on disk under a hash of everything
+that determines them:
+
+    export metadata fields (fs, sym_rate, carrier, pulse, scheme, mapper)
+    + Look-Up Table + pulse samples + channel codes + framing
+    + digest of the payload bits
+
+The key only needs the inputs, so it is computed (and the cache checked)
+before anything is synthesized. Same parameters and payload --> same key
+--> the signal is loaded instead of synthesized, in the GUI as well as in
+the batch renderer (which may run in several processes on the same
+directory).
+
+Every entry is one binary container file, opened memory-mapped. The audio
+is stored as float32 and the transmit Baseband (with its symbols, bits and
+pulse) as complex64, so a hit restores the same containers as a render.
+Disk cost: 4 + 8 bytes per sample, about 580 kB per second of audio at
+48 kHz (the 2 GiB default holds ~1 hour).
+The cache is bounded in size: hits refresh the modification time, and
+the least recently used entries are deleted when a new entry pushes the
+total above `max_bytes`. It is opt-in in the GUI and the batch CLI.
+
+'''
+
+from pathlib import Path
+import hashlib
+import json
+import os
+import numpy as np
+
+from src.dataclasses.dataclass_models import BandpassSignal, BasebandSignal, ModSchemeLUT, PulseSignal
+from src.dataclasses.container_io import save_container, load_container, FILE_SUFFIX
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "adtx" / "render"
+DEFAULT_CACHE_SIZE = 2 * 1024 ** 3
+
+CACHE_VERSION = 3                   # Increase when the transmit chain changes
+
+
+def _array_digest(data: np.ndarray) -> str:
+    data = np.ascontiguousarray(data)
+    return hashlib.sha256(data.dtype.str.encode() + str(data.shape).encode() + data.tobytes()).hexdigest()
+
+
+def render_key(bits: np.ndarray, mod_scheme: ModSchemeLUT, pulse: PulseSignal, carrier_freq: int,
+               codes=(), framing: dict = None) -> str:
+    """
+    Stable key of a rendered transmit signal.
+
+    Args:
+        bits: Payload bits (before channel coding)
+        codes: Channel codes (outer first), identified by their names (incl. parameters)
+        framing: Packetizer settings, e.g. {"payload_bits": 1024} (None: unframed)
+    """
+    parameters = {
+        "version": CACHE_VERSION,
+        "fs": int(pulse.fs),
+        "sym_rate": int(pulse.sym_rate),
+        "carrier_freq": int(carrier_freq),
+        "pulse": {
+            "shape": str(pulse.shape),
+            "span": pulse.span,
+            "roll_off": pulse.roll_off,
+            "data": _array_digest(np.asarray(pulse.data, dtype=np.float64)),
+        },
+        "modulation_scheme": mod_scheme.mod_scheme,
+        "mapper": mod_scheme.mapper,
+        "look_up_table": [[int(key), float(np.real(value)), float(np.imag(value))]
+                          for key, value in sorted(mod_scheme.look_up_table.items())],
+        "codes": [code.name for code in codes],
+        "framing": framing,
+        "bits": _array_digest(np.packbits(np.asarray(bits, dtype=np.uint8))),
+        "num_bits": len(bits),
+    }
+
+    return hashlib.sha256(json.dumps(parameters, sort_keys=True).encode()).hexdigest()
+
+
+def compact_signal(signal: BandpassSignal) -> BandpassSignal:
+    """Cache entry of a signal: float32 audio, complex64 Baseband."""
+    baseband = signal.baseband_signal
+    return BandpassSignal(
+        name=signal.name,
+        data=np.asarray(np.real(signal.data), dtype=np.float32),
+        fs=signal.fs,
+        sym_rate=signal.sym_rate,
+        baseband_signal=BasebandSignal(
+            name=baseband.name,
+            data=np.asarray(baseband.data, dtype=np.complex64),
+            fs=baseband.fs,
+            sym_rate=baseband.sym_rate,
+            pulse=baseband.pulse,
+            symbol_stream=baseband.symbol_stream
+        ),
+        carrier_freq=signal.carrier_freq
+    )
+
+
+class RenderCache:
+    """
+    Attributes:
+        directory: Cache directory (created on demand)
+        max_bytes: Size bound of all entries
+        hits / misses: Statistics of this instance
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{FILE_SUFFIX}"
+
+    def get(self, key: str) -> BandpassSignal:
+        """Cached signal (memory-mapped) or None."""
+        path = self._path(key)
+        try:
+            signal = load_container(path)
+            os.utime(path)                          # LRU: most recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return signal
+
+    def put(self, key: str, signal: BandpassSignal):
+        """Stores a signal (see `compact_signal`), then evicts the least recently used entries above the size bound."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+
+        # Write under a temporary name: readers in other processes never see a partial file
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        try:
+            save_container(temp_path, compact_signal(signal))
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Render cache write failed: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self.evict(keep=path)
+
+    def get_or_render(self, key: str, render) -> BandpassSignal:
+        """Cached signal, or `render()` stored under the key (the rendered signal is returned in full)."""
+        signal = self.get(key)
+        if signal is None:
+            signal = render()
+            self.put(key, signal)
+        return signal
+
+    def entries(self) -> list:
+        """(path, size, last use) of all entries, least recently used first."""
+        entries = []
+        for path in self.directory.glob(f"*{FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:                         # Evicted by another process meanwhile
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Path = None):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+            except OSError:                         # Still mapped (Windows) or already gone
+                pass
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,255 @@
+'''
+Spectrum Engine.
+
+Power Spectral Density estimate of long signals (Welch / Bartlett):
+the signal is cut into overlapping segments (strided view, no copy),
+each segment is windowed and transformed, the periodograms are averaged.
+
+    - Segments are processed in blocks, so the temporary arrays stay small
+      for signals of any length.
+    - The window (and its power) is computed once per length and kept;
+      the FFT length is fixed by `nperseg`, so scipy.fft reuses its plan.
+    - Results are memoized per container: the same container shown again
+      (other view, tab switch, session reload) costs a dictionary lookup.
+      Entries are dropped when their container is garbage collected.
+
+Spectrogram (StftTileCache): the STFT columns are computed in tiles of
+consecutive columns, at fixed sample positions. A tile is keyed by its
+sample range + a digest of its samples, so after an edit (or while a
+signal grows) only tiles with new or changed samples are computed, all
+others come from the cache. Tiles are stored in dB as float32.
+
+Real signals --> one-sided PSD (0 ... fs/2), complex signals --> two-sided
+PSD centered on 0 Hz (-fs/2 ... fs/2).
+
+'''
+
+from collections import OrderedDict
+import hashlib
+import threading
+import weakref
+import numpy as np
+from scipy import fft as sp_fft
+from scipy.signal import get_window
+
+
+class WelchEstimator:
+    """
+    Attributes:
+        nperseg: Segment length = FFT length
+        overlap: Segment overlap (0.5 Welch with Hann, 0 + 'boxcar' = Bartlett)
+        window: Window name (scipy.signal.get_window)
+        block_segments: Segments transformed at once
+    """
+
+    def __init__(self, nperseg: int = 4096, overlap: float = 0.5, window: str = 'hann', block_segments: int = 64):
+        if not 0 <= overlap < 1:
+            raise ValueError("Overlap must be in [0, 1).")
+
+        self.nperseg = nperseg
+        self.overlap = overlap
+        self.window = window
+        self.block_segments = block_segments
+        self._windows = {}
+
+    def _get_window(self, length: int):
+        """Window and its power sum(w^2), cached per length."""
+        if length not in self._windows:
+            window = get_window(self.window, length)
+            self._windows[length] = (window, np.sum(window ** 2))
+        return self._windows[length]
+
+    def psd(self, data: np.ndarray, fs: float):
+        """
+        Returns:
+            (frequencies in Hz, PSD in V^2/Hz), sorted by frequency
+        """
+        data = np.asarray(data)
+        is_complex = np.iscomplexobj(data)
+
+        # Short signals: one segment over the whole signal, zero-padded to the FFT length
+        seg_len = min(self.nperseg, len(data))
+        if seg_len == 0:
+            return np.array([]), np.array([])
+
+        step = max(seg_len - int(self.overlap * seg_len), 1)
+        window, window_power = self._get_window(seg_len)
+
+        segments = np.lib.stride_tricks.sliding_window_view(data, seg_len)[::step]
+        transform = sp_fft.fft if is_complex else sp_fft.rfft
+
+        psd = None
+        for start in range(0, len(segments), self.block_segments):
+            block = segments[start:start + self.block_segments] * window
+            spectrum = transform(block, n=self.nperseg, axis=-1)
+            power = np.sum(spectrum.real ** 2 + spectrum.imag ** 2, axis=0)
+            psd = power if psd is None else psd + power
+
+        # Density scaling, averaged over all segments
+        psd /= fs * window_power * len(segments)
+
+        if is_complex:
+            freqs = sp_fft.fftshift(sp_fft.fftfreq(self.nperseg, d=1 / fs))
+            return freqs, sp_fft.fftshift(psd)
+
+        # One-sided: double everything except DC (and Nyquist for an even length)
+        psd[1:-1 if self.nperseg % 2 == 0 else None] *= 2
+        return sp_fft.rfftfreq(self.nperseg, d=1 / fs), psd
+
+
+class SpectrumEngine:
+    """
+    Memoized PSD per container. Thread safe: plots are computed on worker threads.
+    """
+
+    def __init__(self, estimator: WelchEstimator = None):
+        self.estimator = estimator or WelchEstimator()
+        self._lock = threading.Lock()
+        self._cache = {}            # id(container) --> (weakref, data id, result)
+
+    def psd(self, container):
+        """(frequencies, PSD) of `container.data` at `container.fs`, computed once per container."""
+        key = id(container)
+
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is not None:
+            ref, data_id, result = entry
+            if ref() is container and data_id == id(container.data):
+                return result
+
+        # Computed outside the lock: other containers are not blocked meanwhile
+        result = self.estimator.psd(container.data, container.fs)
+
+        with self._lock:
+            self._cache[key] = (weakref.ref(container, lambda _, key=key: self._discard(key)),
+                                id(container.data), result)
+        return result
+
+    def _discard(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class StftTileCache:
+    """
+    Same result as scipy.signal.spectrogram (density, constant detrend), in dB.
+
+    Attributes:
+        nperseg / noverlap / window: STFT parameters
+        tile_columns: STFT columns per tile
+        max_bytes: Size bound of all cached tiles (least recently used are dropped)
+        computed / reused: Tile statistics
+    """
+
+    def __init__(self, nperseg: int = 256, noverlap: int = 128, window: str = 'hann',
+                 tile_columns: int = 128, max_bytes: int = 256 * 1024 ** 2):
+        self.nperseg = nperseg
+        self.noverlap = noverlap
+        self.step = nperseg - noverlap
+        self.window = window
+        self.tile_columns = tile_columns
+        self.max_bytes = max_bytes
+        self.computed = 0
+        self.reused = 0
+
+        self._window = get_window(window, nperseg).astype(np.float32)
+        self._window_power = float(np.sum(self._window.astype(np.float64) ** 2))
+        self._lock = threading.Lock()
+        self._tiles = OrderedDict()             # key --> dB tile (columns x frequencies)
+        self._bytes = 0
+
+    def num_columns(self, num_samples: int) -> int:
+        if num_samples < self.nperseg:
+            return 0
+        return (num_samples - self.nperseg) // self.step + 1
+
+    def frequencies(self, fs: float, is_complex: bool) -> np.ndarray:
+        if is_complex:
+            return sp_fft.fftshift(sp_fft.fftfreq(self.nperseg, d=1 / fs))
+        return sp_fft.rfftfreq(self.nperseg, d=1 / fs)
+
+    def column_times(self, fs: float, start_col: int, stop_col: int) -> np.ndarray:
+        """Segment centers in seconds."""
+        return (np.arange(start_col, stop_col) * self.step + self.nperseg / 2) / fs
+
+    def columns(self, data: np.ndarray, fs: float, start_col: int = 0, stop_col: int = None):
+        """
+        STFT columns [start_col, stop_col) in dB.
+
+        Returns:
+            (times, frequencies, spectrogram in dB as float32, shape columns x frequencies)
+        """
+        is_complex = np.iscomplexobj(data)
+        num_cols = self.num_columns(len(data))
+        stop_col = num_cols if stop_col is None else min(stop_col, num_cols)
+        start_col = min(max(start_col, 0), stop_col)
+
+        tiles = []
+        first_tile = start_col // self.tile_columns
+        last_tile = -(-stop_col // self.tile_columns)
+        for tile in range(first_tile, last_tile):
+            tile_start = tile * self.tile_columns
+            tile_stop = min(tile_start + self.tile_columns, num_cols)
+            tile_db = self._tile(data, fs, is_complex, tile_start, tile_stop)
+            tiles.append(tile_db[max(start_col - tile_start, 0):stop_col - tile_start])
+
+        num_freqs = self.nperseg if is_complex else self.nperseg // 2 + 1
+        spectrogram_db = np.concatenate(tiles) if tiles else np.empty((0, num_freqs), dtype=np.float32)
+
+        return self.column_times(fs, start_col, stop_col), self.frequencies(fs, is_complex), spectrogram_db
+
+    def _tile(self, data, fs, is_complex, start_col, stop_col) -> np.ndarray:
+        start = start_col * self.step
+        stop = (stop_col - 1) * self.step + self.nperseg
+        samples = np.ascontiguousarray(data[start:stop])
+
+        digest = hashlib.sha256(samples).hexdigest()
+        key = (fs, samples.dtype.str, start, stop, digest)
+
+        with self._lock:
+            tile_db = self._tiles.get(key)
+            if tile_db is not None:
+                self._tiles.move_to_end(key)
+                self.reused += 1
+                return tile_db
+
+        tile_db = self._compute_tile(samples, fs, is_complex)
+
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = tile_db
+                self._bytes += tile_db.nbytes
+            self.computed += 1
+            while self._bytes > self.max_bytes and len(self._tiles) > 1:
+                _, evicted = self._tiles.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+        return tile_db
+
+    def _compute_tile(self, samples, fs, is_complex) -> np.ndarray:
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.nperseg)[::self.step]
+        frames = frames.astype(np.complex64 if is_complex else np.float32)
+        frames -= frames.mean(axis=1, keepdims=True)
+        frames *= self._window
+
+        if is_complex:
+            spectrum = sp_fft.fftshift(sp_fft.fft(frames, axis=-1), axes=-1)
+        else:
+            spectrum = sp_fft.rfft(frames, axis=-1)
+
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+        power *= np.float32(1 / (fs * self._window_power))
+        if not is_complex:
+            power[:, 1:-1 if self.nperseg % 2 == 0 else None] *= 2
+
+        return 10 * np.log10(power + np.float32(1e-10))
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
+            self._bytes = 0
@@ -8,6 +8,9 @@ class SymbolSequencer:
         self.mod_scheme_lut = mod_scheme_container.look_up_table
         self.k = mod_scheme_container.cardinality
 
+        # LUT as array --> direct indexing with the symbol indices
+        self.lut_array = np.array([self.mod_scheme_lut[idx] for idx in range(self.k)], dtype=np.complex128)
+
     def map_bits_to_symbols(self, bit_stream: np.array) -> np.ndarray:
         """
         Generates the complex symbol sequence using the look-up book.
@@ -27,8 +30,8 @@ class SymbolSequencer:
         powers = 2 ** np.arange(bits_per_symbol - 1, -1, -1)
         sym_idx_array = chunk_array @ powers
 
-        # Map Indices to Symbols using the Look-Up Table and Index from the loop
-        symbol_sequence = np.array([self.mod_scheme_lut[idx] for idx in sym_idx_array], dtype=np.complex128) # TODO pre-compute LUT as np.array for direct indexing
+        # Map Indices to Symbols using the Look-Up Table
+        symbol_sequence = self.lut_array[sym_idx_array]
 
         return symbol_sequence
 
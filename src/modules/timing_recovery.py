@@ -0,0 +1,244 @@
+'''
+Symbol Timing Recovery for the receive path.
+
+The Sound Card of the receiver never runs in sync with the transmitter
+(44.1 kHz vs. 48 kHz devices, ppm drift of the crystals). The recovery loop
+estimates the fractional symbol instants and resamples the matched filter
+output exactly there.
+
+Everything works block-wise: the loop filter only updates once per block of
+symbols, inside a block all strobes, interpolations and timing errors are
+computed with NumPy at once. So there is no Python loop per symbol.
+
+Strategy Pattern for the Timing Error Detector (TED):
+    - GardnerTED:           2 samples / symbol, decision free
+    - MuellerMullerTED:     1 sample / symbol, decision directed
+
+'''
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+# ===========================================================
+#   Fractional Interpolation
+# ===========================================================
+
+class FarrowInterpolator:
+    """
+    Cubic Lagrange Interpolator in Farrow Structure.
+
+    Interpolates between x[n] and x[n+1] with the fractional
+    interval mu in [0, 1). Uses the 4 neighbours x[n-1] ... x[n+2].
+    """
+
+    # Needed samples around the base index
+    PRE = 1
+    POST = 2
+
+    def interpolate(self, x: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """
+        Evaluate x at the (fractional) sample positions t.
+
+        Args:
+            x: Input samples (real or complex), 1-D or a 2-D batch (rows = signals)
+            t: Fractional sample positions, PRE <= t < len(x) - POST.
+               For a batch one row of positions per signal.
+        Returns:
+            Interpolated samples, same shape as t
+        """
+        base_idx = np.floor(t).astype(np.int64)
+        mu = t - base_idx
+
+        if x.ndim > 1:
+            # Batch: index into the flat array (row offset added to the positions)
+            base_idx = base_idx + np.arange(x.shape[0])[:, None] * x.shape[-1]
+            x = np.ascontiguousarray(x).reshape(-1)
+
+        neighbours = [x[base_idx + k] for k in range(-1, 3)]
+
+        x_m1, x_0, x_p1, x_p2 = neighbours
+
+        # ---- Farrow Coefficients (Cubic Lagrange) ----
+        c2 = 0.5 * (x_m1 + x_p1) - x_0
+        c3 = (x_p2 - x_m1) / 6 + 0.5 * (x_0 - x_p1)
+        c1 = x_p1 - x_0 - c2 - c3               # from p(1) = x[n+1]
+
+        # Horner Scheme (in place, long batches are memory bound)
+        y = c3
+        y *= mu
+        y += c2
+        y *= mu
+        y += c1
+        y *= mu
+        y += x_0
+        return y
+
+
+# ===========================================================
+#   Timing Error Detectors
+#   Convention: error > 0 --> strobes are late
+# ===========================================================
+
+class TimingErrorDetector(ABC):
+
+    # Does the detector need the mid-symbol sample?
+    needs_mid_samples = False
+
+    @abstractmethod
+    def error(self, on_time: np.ndarray, mid: np.ndarray, prev: complex) -> np.ndarray:
+        """
+        Timing errors of a whole block.
+
+        Args:
+            on_time: Samples at the symbol strobes of the block
+            mid: Samples half a symbol before each strobe (None if not needed)
+            prev: Last on-time sample of the previous block
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class GardnerTED(TimingErrorDetector):
+    """e[k] = Re{ (y[k] - y[k-1]) * conj(y[k-1/2]) }"""
+
+    needs_mid_samples = True
+
+    def error(self, on_time, mid, prev):
+        previous = np.concatenate(([prev], on_time[:-1]))
+        return np.real((on_time - previous) * np.conj(mid))
+
+
+class MuellerMullerTED(TimingErrorDetector):
+    """
+    e[k] = Re{ conj(d[k]) * y[k-1] - conj(d[k-1]) * y[k] }
+
+    The decisions d[k] are taken from the constellation (nearest symbol).
+    Without constellation a sign slicer on I and Q is used.
+    """
+
+    def __init__(self, constellation: np.ndarray = None):
+        self.constellation = None if constellation is None else np.asarray(constellation, dtype=complex)
+
+    def _decide(self, y: np.ndarray) -> np.ndarray:
+        if self.constellation is None:
+            return np.sign(y.real) + 1j * np.sign(y.imag)
+
+        # Nearest Symbol for all Samples at once
+        distances = np.abs(y[:, None] - self.constellation[None, :])
+        return self.constellation[np.argmin(distances, axis=1)]
+
+    def error(self, on_time, mid, prev):
+        previous = np.concatenate(([prev], on_time[:-1]))
+        decisions = self._decide(on_time)
+        prev_decisions = self._decide(previous)
+        return np.real(np.conj(decisions) * previous - np.conj(prev_decisions) * on_time)
+
+
+# ===========================================================
+#   Timing Recovery Loop
+# ===========================================================
+
+class SymbolTimingRecovery:
+    """
+    Block-wise timing recovery loop (PI loop filter).
+
+    Tracks the strobe phase and the symbol period, so constant clock drift
+    between Sender and Receiver (e.g. 44.1 kHz vs 48 kHz nominal) is followed
+    without steady-state error.
+
+    The instance keeps its state between calls of `process`, so a long
+    recording can be fed chunk by chunk.
+
+    Attributes:
+        sps: Nominal samples per symbol (may be fractional)
+        ted: Timing Error Detector strategy
+        block_symbols: Number of symbols per loop update
+        kp: Proportional gain (phase correction in symbol periods)
+        ki: Integral gain (relative period correction)
+    """
+
+    def __init__(self, sps: float, ted: TimingErrorDetector = None,
+                 block_symbols: int = 32, kp: float = 0.2, ki: float = 0.0005):
+
+        if sps < 2:
+            raise ValueError("Timing recovery needs at least 2 samples per symbol.")
+
+        self.sps = float(sps)
+        self.ted = ted if ted is not None else GardnerTED()
+        self.block_symbols = block_symbols
+        self.kp = kp
+        self.ki = ki
+
+        self.interpolator = FarrowInterpolator()
+        self.reset()
+
+    def reset(self):
+        """Back to nominal timing, drops the buffered samples."""
+        self.period = self.sps
+        self._buffer = np.zeros(0, dtype=complex)
+        self._next_strobe = None                # Position in _buffer
+        self._prev_sample = 0j
+
+        # Per block diagnostics
+        self.period_history = []
+        self.error_history = []
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Recover the symbols from the next chunk of the matched filter output.
+
+        Args:
+            samples: Matched filter output (real or complex)
+        Returns:
+            Complex symbol samples found in this chunk
+        """
+        buffer = np.concatenate((self._buffer, np.asarray(samples, dtype=complex)))
+
+        if self._next_strobe is None:
+            # First strobe late enough for the mid sample + interpolator history
+            self._next_strobe = self.period / 2 + FarrowInterpolator.PRE
+
+        last_valid = len(buffer) - FarrowInterpolator.POST - 1
+        symbols = []
+
+        while True:
+            # ---- Strobes of the next block ----
+            strobes = self._next_strobe + np.arange(self.block_symbols) * self.period
+            strobes = strobes[strobes < last_valid]
+            if len(strobes) == 0:
+                break
+
+            on_time = self.interpolator.interpolate(buffer, strobes)
+            mid = None
+            if self.ted.needs_mid_samples:
+                mid = self.interpolator.interpolate(buffer, strobes - self.period / 2)
+
+            errors = self.ted.error(on_time, mid, self._prev_sample)
+
+            # Normalize by Signal Power --> gains independent of amplitude
+            power = np.mean(np.abs(on_time) ** 2)
+            mean_error = np.mean(errors) / power if power > 0 else 0.0
+
+            # ---- PI Loop Filter (once per block) ----
+            self.period -= self.ki * mean_error * self.period
+            self._next_strobe = strobes[-1] + self.period - self.kp * mean_error * self.period
+            self._prev_sample = on_time[-1]
+
+            self.period_history.append(self.period)
+            self.error_history.append(mean_error)
+            symbols.append(on_time)
+
+        # ---- Keep the unused tail (+ history for mid sample / interpolator) ----
+        keep_from = int(np.floor(self._next_strobe - self.period / 2)) - FarrowInterpolator.PRE - 1
+        keep_from = min(max(keep_from, 0), len(buffer))
+        self._buffer = buffer[keep_from:]
+        self._next_strobe -= keep_from
+
+        if not symbols:
+            return np.zeros(0, dtype=complex)
+        return np.concatenate(symbols)
+
+    @property
+    def clock_offset_ppm(self) -> float:
+        """Deviation of the tracked symbol period in ppm (> 0: receiver clock runs fast)."""
+        return (self.period / self.sps - 1) * 1e6
@@ -0,0 +1,416 @@
+'''
+Streaming WAV I/O.
+
+WavWriter writes a WAV file block by block with constant memory:
+the header is written upfront with placeholder sizes, which are patched
+on `close`. Normalization uses a peak that is known beforehand
+(precomputed or declared, e.g. the peak of a rendered container), so the
+signal never has to be held or scanned as a whole.
+
+WavReader memory-maps an existing file and converts to float lazily (per
+slice or block), with optional streaming resampling, e.g. 44.1 kHz
+captures --> 48 kHz (StreamingResampler).
+
+Sample formats:
+    int16:      PCM 16 bit
+    int24:      PCM 24 bit (packed little endian)
+    float32:    IEEE float (WAVE_FORMAT_IEEE_FLOAT)
+
+'''
+
+import mmap
+import struct
+from pathlib import Path
+import numpy as np
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+
+# Sample format --> (format tag, bytes per sample)
+SAMPLE_FORMATS = {
+    "int16": (WAVE_FORMAT_PCM, 2),
+    "int24": (WAVE_FORMAT_PCM, 3),
+    "float32": (WAVE_FORMAT_IEEE_FLOAT, 4),
+}
+
+RIFF_MAX_SIZE = 0xFFFFFFFF
+
+
+# ===========================================================
+#   Writer
+# ===========================================================
+
+class WavWriter:
+    """
+    Block-wise WAV writer.
+
+    Attributes:
+        fs: Sample rate
+        channels: Number of channels, blocks are (frames x channels) or 1-D for mono
+        sample_format: "int16", "int24" or "float32"
+        peak: Samples are divided by this value (None: written as they are, full scale = 1.0)
+        frames_written: Frames in the file so far
+        clipped_samples: Samples beyond full scale (peak too small)
+
+    Usage:
+        with WavWriter(path, fs, peak=peak) as writer:
+            for block in blocks:
+                writer.write(block)
+    """
+
+    def __init__(self, path, fs: int, channels: int = 1, sample_format: str = "int16", peak: float = None):
+        if sample_format not in SAMPLE_FORMATS:
+            raise ValueError(f"Unsupported WAV sample format: {sample_format}")
+
+        self.path = Path(path)
+        self.fs = int(fs)
+        self.channels = channels
+        self.sample_format = sample_format
+        self.format_tag, self.sample_width = SAMPLE_FORMATS[sample_format]
+        self.scale = 1.0 / peak if peak else 1.0
+
+        self.frames_written = 0
+        self.clipped_samples = 0
+
+        self._file = open(self.path, "wb")
+        self._write_header()
+
+    # ---- Header ----
+    def _write_header(self):
+        block_align = self.channels * self.sample_width
+        is_float = self.format_tag == WAVE_FORMAT_IEEE_FLOAT
+
+        fmt_chunk = struct.pack("<HHIIHH", self.format_tag, self.channels, self.fs,
+                                self.fs * block_align, block_align, 8 * self.sample_width)
+        if is_float:
+            fmt_chunk += struct.pack("<H", 0)           # cbSize
+
+        self._file.write(b"RIFF" + struct.pack("<I", 0) + b"WAVE")
+        self._file.write(b"fmt " + struct.pack("<I", len(fmt_chunk)) + fmt_chunk)
+
+        # Non-PCM formats need a fact chunk with the number of frames
+        self._fact_offset = None
+        if is_float:
+            self._file.write(b"fact" + struct.pack("<I", 4))
+            self._fact_offset = self._file.tell()
+            self._file.write(struct.pack("<I", 0))
+
+        self._file.write(b"data")
+        self._data_size_offset = self._file.tell()
+        self._file.write(struct.pack("<I", 0))
+        self._data_start = self._file.tell()
+
+    # ---- Samples ----
+    def _encode(self, block: np.ndarray) -> bytes:
+        samples = np.real(block) * self.scale
+
+        if self.sample_format == "float32":
+            return samples.astype("<f4").tobytes()
+
+        full_scale = 2 ** (8 * self.sample_width - 1) - 1
+        over = np.abs(samples) > 1.0
+        if over.any():
+            self.clipped_samples += int(np.count_nonzero(over))
+            samples = np.clip(samples, -1.0, 1.0)
+
+        values = np.round(samples * full_scale)
+
+        if self.sample_format == "int16":
+            return values.astype("<i2").tobytes()
+
+        # int24: lower 3 bytes of each little endian int32
+        return values.astype("<i4").reshape(-1, 1).view(np.uint8)[:, :3].tobytes()
+
+    def write(self, block: np.ndarray):
+        """Appends a block of frames (1-D mono or frames x channels)."""
+        block = np.asarray(block)
+        if block.ndim == 1:
+            block = block.reshape(-1, 1)
+        if block.shape[1] != self.channels:
+            raise ValueError(f"Block has {block.shape[1]} channels, the file {self.channels}.")
+
+        data = self._encode(block)
+        if self._file.tell() + len(data) - 8 > RIFF_MAX_SIZE:
+            raise ValueError("WAV file would exceed the 4 GiB RIFF limit.")
+
+        self._file.write(data)
+        self.frames_written += len(block)
+
+    def close(self):
+        """Patches the chunk sizes into the header."""
+        if self._file.closed:
+            return
+
+        data_size = self._file.tell() - self._data_start
+        if data_size % 2:
+            self._file.write(b"\x00")                   # Chunks are word aligned
+
+        riff_size = self._file.tell() - 8
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", riff_size))
+        self._file.seek(self._data_size_offset)
+        self._file.write(struct.pack("<I", data_size))
+        if self._fact_offset is not None:
+            self._file.seek(self._fact_offset)
+            self._file.write(struct.pack("<I", self.frames_written))
+
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_wav_blocks(blocks, path, fs: int, channels: int = 1, sample_format: str = "int16",
+                     peak: float = None) -> WavWriter:
+    """Writes a block generator to a WAV file. Returns the (closed) writer for its statistics."""
+    with WavWriter(path, fs, channels=channels, sample_format=sample_format, peak=peak) as writer:
+        for block in blocks:
+            writer.write(block)
+    return writer
+
+
+# ===========================================================
+#   Reader (memory-mapped)
+# ===========================================================
+
+class WavReader:
+    """
+    Memory-mapped WAV reader for long recordings.
+
+    Opening only parses the header and maps the data chunk, nothing is
+    loaded. Samples are converted to float32 (full scale = 1.0) lazily,
+    only for the requested slice or block. `blocks` drops the pages it has
+    passed, so even multi-GB captures are streamed with constant memory:
+
+        reader = WavReader("capture.wav")
+        reader[48000:96000]                         # --> float32 (frames x channels)
+        for block in reader.blocks(target_fs=48000):  # streaming resampling
+            ...
+
+    Supports PCM int16 / int24 / int32 and IEEE float32 (also in
+    WAVE_FORMAT_EXTENSIBLE files).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._parse_header()
+
+        if self.sample_width == 3:
+            # No numpy dtype for 24 bit: map bytes, convert per slice
+            dtype, shape = np.uint8, (self.frames, self.channels * 3)
+        else:
+            dtype = "<f4" if self.format_tag == WAVE_FORMAT_IEEE_FLOAT else f"<i{self.sample_width}"
+            shape = (self.frames, self.channels)
+
+        with open(self.path, "rb") as wav_file:
+            self._mmap = mmap.mmap(wav_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.raw = np.ndarray(shape, dtype=dtype, buffer=self._mmap, offset=self._data_offset)
+
+    def close(self):
+        self.raw = None
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _release(self, start: int, stop: int):
+        """Drops the mapped pages of frames [start, stop) from memory (they are reloaded on access)."""
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        frame_bytes = self.raw.strides[0]
+        begin = self._data_offset + start * frame_bytes
+        begin -= begin % mmap.PAGESIZE
+        end = self._data_offset + stop * frame_bytes
+        if end > begin:
+            self._mmap.madvise(mmap.MADV_DONTNEED, begin, min(end, len(self._mmap)) - begin)
+
+    def _parse_header(self):
+        with open(self.path, "rb") as wav_file:
+            riff, _, wave = struct.unpack("<4sI4s", wav_file.read(12))
+            if riff != b"RIFF" or wave != b"WAVE":
+                raise ValueError(f"Not a RIFF/WAVE file: {self.path}")
+
+            fmt = None
+            while True:
+                header = wav_file.read(8)
+                if len(header) < 8:
+                    raise ValueError(f"No data chunk in {self.path}")
+                chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+                if chunk_id == b"fmt ":
+                    fmt = wav_file.read(chunk_size)
+                    wav_file.seek(chunk_size % 2, 1)
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        raise ValueError(f"Data chunk before fmt chunk in {self.path}")
+                    self._data_offset = wav_file.tell()
+                    data_size = chunk_size
+                    break
+                else:
+                    wav_file.seek(chunk_size + chunk_size % 2, 1)
+
+            # A data size beyond the file end (streams written without patching) --> use the file size
+            file_size = self.path.stat().st_size
+            data_size = min(data_size, file_size - self._data_offset)
+
+        format_tag, self.channels, self.fs, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+        if format_tag == 0xFFFE and len(fmt) >= 26:
+            format_tag = struct.unpack("<H", fmt[24:26])[0]    # Sub format GUID starts with the tag
+
+        self.format_tag = format_tag
+        self.sample_width = bits // 8
+
+        supported = (format_tag == WAVE_FORMAT_PCM and self.sample_width in (2, 3, 4)) or \
+                    (format_tag == WAVE_FORMAT_IEEE_FLOAT and self.sample_width == 4)
+        if not supported:
+            raise ValueError(f"Unsupported WAV format (tag {format_tag}, {bits} bit) in {self.path}")
+
+        self.frames = data_size // block_align
+
+    def __len__(self):
+        return self.frames
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.fs
+
+    def read(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """Frames [start, stop) as float32 (frames x channels)."""
+        raw = self.raw[start:stop]
+
+        if self.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+            return np.array(raw, dtype=np.float32)
+
+        if self.sample_width == 3:
+            # Sign extend 3 little endian bytes into the upper bytes of an int32
+            packed = np.zeros((len(raw), self.channels, 4), dtype=np.uint8)
+            packed[:, :, 1:] = np.asarray(raw).reshape(len(raw), self.channels, 3)
+            values = packed.view("<i4")[:, :, 0]
+            return values.astype(np.float32) / np.float32(2 ** 31)
+
+        return raw.astype(np.float32) / np.float32(2 ** (8 * self.sample_width - 1))
+
+    def __getitem__(self, index) -> np.ndarray:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.frames)
+            return self.read(start, stop)[::step]
+        if isinstance(index, tuple):
+            return self[index[0]][(Ellipsis,) + index[1:]]      # (frames, channel) indexing
+        return self.read(index, index + 1)[0]
+
+    def blocks(self, block_frames: int = 65536, target_fs: int = None, start: int = 0, stop: int = None):
+        """
+        Float32 blocks (frames x channels) over [start, stop).
+
+        Args:
+            target_fs: Resample on the fly to this rate (e.g. 44.1 kHz capture --> 48 kHz)
+        """
+        stop = self.frames if stop is None else min(stop, self.frames)
+
+        resampler = None
+        if target_fs is not None and target_fs != self.fs:
+            resampler = StreamingResampler(self.fs, target_fs)
+
+        for block_start in range(start, stop, block_frames):
+            block_stop = min(block_start + block_frames, stop)
+            block = self.read(block_start, block_stop)
+            self._release(block_start, block_stop)      # Constant RSS over the whole file
+            if resampler is None:
+                yield block
+                continue
+
+            resampled = resampler.process(block)
+            if len(resampled):
+                yield resampled
+
+        if resampler is not None:
+            tail = resampler.flush()
+            if len(tail):
+                yield tail
+
+
+# ===========================================================
+#   Streaming Resampler
+# ===========================================================
+
+class StreamingResampler:
+    """
+    Rational polyphase resampler (fs_in --> fs_out) for a stream of blocks.
+
+    Same Kaiser FIR design and delay compensation as scipy's resample_poly,
+    but with state: the input history is carried from block to block, so
+    the joined output equals the resampling of the whole signal.
+    """
+
+    def __init__(self, fs_in: int, fs_out: int, half_len: int = 10, kaiser_beta: float = 5.0):
+        from math import gcd
+        from scipy.signal import firwin
+
+        divisor = gcd(int(fs_in), int(fs_out))
+        self.up = int(fs_out) // divisor
+        self.down = int(fs_in) // divisor
+
+        max_rate = max(self.up, self.down)
+        h = firwin(2 * half_len * max_rate + 1, 1.0 / max_rate, window=("kaiser", kaiser_beta)) * self.up
+
+        # Zero pad in front: the group delay becomes a whole number of output samples
+        pre_pad = (-((len(h) - 1) // 2)) % self.down
+        self.h = np.concatenate((np.zeros(pre_pad), h))
+        self.delay = ((len(h) - 1) // 2 + pre_pad) // self.down
+
+        self.reset()
+
+    def reset(self):
+        self._buffer = None
+        self._buffer_start = 0          # Global input index of _buffer[0] (multiple of down)
+        self._next_output = 0           # Global index (incl. delay) of the next output sample
+        self._inputs = 0
+
+    def _outputs_until(self, num_inputs: int) -> int:
+        """Number of (delayed) output samples that only depend on the first num_inputs inputs."""
+        return (num_inputs - 1) * self.up // self.down + 1 if num_inputs else 0
+
+    def _run(self, last_output: int) -> np.ndarray:
+        from scipy.signal import upfirdn
+
+        first = self._next_output
+        if last_output <= first:
+            return np.zeros((0,) + self._buffer.shape[1:], dtype=np.float32)
+
+        # Local output j of the buffer <--> global output j + buffer_start * up / down
+        offset = self._buffer_start * self.up // self.down
+        y = upfirdn(self.h, self._buffer, self.up, self.down, axis=0)[first - offset:last_output - offset]
+        self._next_output = last_output
+
+        # Drop input history that no future output needs
+        oldest_needed = max((last_output * self.down - len(self.h) + 1) // self.up, 0)
+        keep_from = oldest_needed - oldest_needed % self.down
+        self._buffer = self._buffer[keep_from - self._buffer_start:]
+        self._buffer_start = keep_from
+
+        # Remove the filter delay at the start of the stream
+        skip = max(self.delay - first, 0)
+        return y[skip:].astype(np.float32)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        block = np.asarray(block)
+        self._buffer = block if self._buffer is None else np.concatenate((self._buffer, block))
+        self._inputs += len(block)
+        return self._run(self._outputs_until(self._inputs))
+
+    def flush(self) -> np.ndarray:
+        """Remaining output (filter tail), total length ceil(N * up / down) as in resample_poly."""
+        if self._buffer is None:
+            return np.zeros(0, dtype=np.float32)
+
+        total = -(-self._inputs * self.up // self.down) + self.delay
+        padding = np.zeros((len(self.h) // self.up + 2,) + self._buffer.shape[1:], dtype=self._buffer.dtype)
+        self._buffer = np.concatenate((self._buffer, padding))
+        return self._run(total)
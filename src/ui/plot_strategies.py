@@ -5,10 +5,11 @@ from scipy.fft import fft, fftfreq, fftshift
 from scipy import signal
 
 import pyqtgraph as pg
-from PySide6.QtCore import Qt,QRectF
+from PySide6.QtCore import Qt,QRectF, QTimer
 from src.ui.plot_widgets import PlotWidget
 from src.dataclasses.dataclass_models import PulseSignal, ModSchemeLUT, BasebandSignal
 from src.constants import PulseShape
+from src.modules.spectrum import SpectrumEngine, StftTileCache
 
 
 def downsample_for_plot(x_data, y_data, max_points=10000):
@@ -37,18 +38,147 @@ def downsample_for_plot(x_data, y_data, max_points=10000):
     return x_downsampled, y_downsampled
 
 
+class MinMaxPyramid:
+    """
+    Peak preserving multi-resolution decimation of one real signal.
+
+    Built once per signal: level 1 holds min / max of every `base_bin`
+    samples, every further level combines `factor` bins of the level
+    below. A query returns the finest level that fits the point budget
+    as interleaved (min, max) pairs, so peaks and the envelope of a
+    carrier stay visible at any zoom. Ranges that fit the budget are
+    returned as raw samples.
+    """
+
+    def __init__(self, data: np.ndarray, base_bin: int = 8, factor: int = 2, min_bins: int = 256,
+                 block_size: int = 2 ** 20):
+        self.data = data
+        self.levels = []                        # (bin size, mins, maxs) from fine to coarse
+
+        if len(data) < 2 * base_bin:
+            return
+
+        # Level 1 in blocks: no full size temporary copy of the signal
+        num_bins = -(-len(data) // base_bin)
+        mins = np.empty(num_bins, dtype=np.float32)
+        maxs = np.empty(num_bins, dtype=np.float32)
+        block_size -= block_size % base_bin
+        for start in range(0, len(data), block_size):
+            block = np.asarray(data[start:start + block_size], dtype=np.float32)
+            block = np.pad(block, (0, -len(block) % base_bin), mode='edge').reshape(-1, base_bin)
+            first = start // base_bin
+            mins[first:first + len(block)] = block.min(axis=1)
+            maxs[first:first + len(block)] = block.max(axis=1)
+        self.levels.append((base_bin, mins, maxs))
+
+        bin_size = base_bin
+        while len(mins) > min_bins:
+            bin_size *= factor
+            pad = -len(mins) % factor
+            mins = np.pad(mins, (0, pad), mode='edge').reshape(-1, factor).min(axis=1)
+            maxs = np.pad(maxs, (0, pad), mode='edge').reshape(-1, factor).max(axis=1)
+            self.levels.append((bin_size, mins, maxs))
+
+    def __len__(self):
+        return len(self.data)
+
+    def query(self, start: int, stop: int, max_points: int = 4000):
+        """
+        Samples [start, stop) with at most about `max_points` points.
+
+        Returns:
+            (sample positions, values) as float arrays
+        """
+        start = int(np.clip(start, 0, len(self.data)))
+        stop = int(np.clip(stop, start, len(self.data)))
+
+        if stop - start <= max_points or not self.levels:
+            return np.arange(start, stop, dtype=np.float64), np.asarray(self.data[start:stop], dtype=np.float32)
+
+        # Finest level with at most max_points / 2 bins (= max_points min/max values) in range
+        for bin_size, mins, maxs in self.levels:
+            first_bin, last_bin = start // bin_size, -(-stop // bin_size)
+            if last_bin - first_bin <= max_points // 2:
+                break
+
+        centers = np.arange(first_bin, last_bin) * bin_size + bin_size / 2
+        values = np.empty(2 * len(centers), dtype=np.float32)
+        values[0::2] = mins[first_bin:last_bin]
+        values[1::2] = maxs[first_bin:last_bin]
+
+        return np.repeat(centers, 2), values
+
+
 
 
 class PlotStrategy(ABC):
+    """
+    `plot` draws a container in one go. Strategies with heavy numerics split
+    it into `compute` (numpy only, no Qt, no state on self --> may run on a
+    worker thread) and `draw` (GUI thread); the PlotManager then runs them
+    separately.
+
+    Strategies own their plot items (curves, scatter, images) and update them
+    in place (`setData` / `setImage`) instead of clearing the plot and
+    building new items on every update.
+    """
+
+    def __init__(self):
+        self._items = {}
+
     @abstractmethod
     def plot(self, widget: PlotWidget, signal_model):
         pass
 
+    def _item(self, widget: PlotWidget, key: str, factory):
+        """Long-lived plot item: created once, added again if the plot was cleared meanwhile."""
+        item = self._items.get(key)
+        if item is None:
+            item = self._items[key] = factory()
+        if item not in widget.plot_widget.getPlotItem().items:
+            widget.plot_widget.addItem(item)
+        return item
+
+    def _curve(self, widget: PlotWidget, key: str, color='b', name=None) -> pg.PlotDataItem:
+        return self._item(widget, key, lambda: pg.PlotDataItem(
+            pen=pg.mkPen(color=color, width=2), name=name, skipFiniteCheck=True, clipToView=True))
+
+    def _set_curve(self, widget: PlotWidget, key: str, x, y, color='b', name=None) -> pg.PlotDataItem:
+        """
+        Updates (or creates) a curve. Values as float32, the x axis stays float64:
+        float32 can not resolve single samples on the time axis of long signals.
+        """
+        curve = self._curve(widget, key, color, name)
+        curve.setData(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float32), skipFiniteCheck=True)
+        curve.setVisible(True)
+        return curve
+
+    def _image(self, widget: PlotWidget, key: str = "image", colormap=None) -> pg.ImageItem:
+        def create():
+            image = pg.ImageItem()
+            if colormap is not None:
+                image.setColorMap(pg.colormap.get(colormap))
+            return image
+        return self._item(widget, key, create)
+
+    def _hide(self, *keys):
+        for key in keys:
+            if key in self._items:
+                self._items[key].setVisible(False)
+
+    def compute(self, signal_model):
+        return signal_model
+
+    def draw(self, widget: PlotWidget, prepared):
+        self.plot(widget, prepared)
+
+    def clear(self):
+        """Releases data the strategy keeps between plots (e.g. decimation pyramids)."""
+        pass
+
 
 class PulsePlotStrategy(PlotStrategy):
     def plot(self, widget: PlotWidget, signal_model: PulseSignal):
-        widget.plot_widget.clear()
-
         # Time Vector Calculation in Seconds
         t_duration = len(signal_model.data) / signal_model.fs
 
@@ -67,7 +197,7 @@ class PulsePlotStrategy(PlotStrategy):
         time_ds, data_ds = downsample_for_plot(timevector_ms, signal_model.data, max_points=5000)
 
         # Plot with MS time vector
-        widget.plot_data(time_ds, data_ds, color='b', name=signal_model.name)
+        self._set_curve(widget, "pulse", time_ds, data_ds, color='b', name=signal_model.name)
 
 
 class ConstellationPlotStrategy(PlotStrategy):
@@ -79,18 +209,15 @@ class ConstellationPlotStrategy(PlotStrategy):
         """
         Sets up the design and layout of the plot.
         """
-        widget.plot_widget.clear()
         widget.plot_widget.setTitle(f"Constellation: {modscheme_signal_container.name}")
         widget.plot_widget.setLabel('bottom', 'In-Phase (I / Real)')
         widget.plot_widget.setLabel('left', 'Quadrature (Q / Imaginary)')
         widget.plot_widget.setAspectLocked(True)
         widget.plot_widget.showGrid(x=True, y=False)
 
-        plot_item = widget.plot_widget.getPlotItem()
-
         cross_hair_pen = pg.mkPen('w', style=Qt.PenStyle.DashLine)
-        plot_item.addLine(x = 0, pen = cross_hair_pen)
-        plot_item.addLine(y = 0, pen = cross_hair_pen)
+        self._item(widget, "cross_x", lambda: pg.InfiniteLine(pos=0, angle=90, pen=cross_hair_pen))
+        self._item(widget, "cross_y", lambda: pg.InfiniteLine(pos=0, angle=0, pen=cross_hair_pen))
 
     def _process_data(self, modscheme_signal_container: ModSchemeLUT):
         """
@@ -123,43 +250,37 @@ class ConstellationPlotStrategy(PlotStrategy):
         dict_look_up_table, i_data, q_data, k, label_offset_i, label_offset_q = self._process_data(modscheme_signal_container)
 
         # --- 1. Plot the Symbols ---
-        scatter = pg.ScatterPlotItem(
+        scatter = self._item(widget, "symbols", lambda: pg.ScatterPlotItem(
             size=8,
             pen=pg.mkPen('w', width=1),
             brush=pg.mkBrush('b'),
             hoverable=True
-        )
-        scatter.addPoints(i_data, q_data)
-        widget.plot_widget.addItem(scatter)
+        ))
+        scatter.setData(i_data.astype(np.float32), q_data.astype(np.float32))
 
         # --- 2. Add Bit Labels (Annotation) ---
 
-        # Determine the number of bits per symbol (k) from the cardinality (M)
-        M = len(dict_look_up_table)
-        k = int(np.log2(M)) if M > 0 else 0
-
-        # Define an offset for the label so it doesn't overlap the symbol point
-        label_offset_i = 0.1 * np.max(np.abs(i_data)) if len(i_data) > 0 else 0.1
-        label_offset_q = 0.1 * np.max(np.abs(q_data)) if len(q_data) > 0 else 0.1
-
-        # Iterate through the codebook to add labels
-        for binary_index, symbol in dict_look_up_table.items():
+        # Iterate through the codebook to update the labels; TextItems are reused
+        for label_index, (binary_index, symbol) in enumerate(dict_look_up_table.items()):
 
             # Convert the key (0, 1, 2, 3...) to its corresponding bit sequence ('00', '01', '10', '11'...)
             bit_label = format(binary_index, f'0{k}b')
 
-            # Create a pyqtgraph TextItem for the label
-            # We add a small offset (label_offset_i) to position the text clearly
-            text_item = pg.TextItem(
-                text=bit_label,
+            text_item = self._item(widget, f"label_{label_index}", lambda: pg.TextItem(
                 color=(255, 255, 255), # White text
                 anchor=(0.5, 0)        # Anchor text center-bottom relative to the point
-            )
+            ))
+            text_item.setText(bit_label)
 
             # Position the text slightly above the symbol point
             text_item.setPos(symbol.real + label_offset_i, symbol.imag + label_offset_q)
+            text_item.setVisible(True)
 
-            widget.plot_widget.addItem(text_item)
+        # Labels of a larger constellation shown before
+        label_index = len(dict_look_up_table)
+        while f"label_{label_index}" in self._items:
+            self._hide(f"label_{label_index}")
+            label_index += 1
 
         # Ensure the view bounds encompass all symbols and labels
         if len(i_data) > 0:
@@ -171,95 +292,132 @@ class ConstellationPlotStrategy(PlotStrategy):
         widget.plot_widget.showGrid(x = True, y = False)
 
 
-class BasebandPlotStrategy(PlotStrategy):
-    def plot(self, widget: PlotWidget, signal_model: BasebandSignal):
-        widget.plot_widget.clear()
+class TimeSignalPlotStrategy(PlotStrategy):
+    """
+    Time domain view of long signals (Real part + Imaginary part for complex data).
 
-        num_samples = len(signal_model.data)
+    A MinMaxPyramid per component is built once per signal. On every
+    ViewBox x-range change the visible range is queried again, so zooming
+    in shows full detail with a bounded number of points per redraw.
+    Outside the view a coarse envelope is kept, so the curve bounds (and
+    the auto range) still cover the whole signal.
+    """
 
-        timevector = np.arange(num_samples) / signal_model.fs
+    title_prefix = "Signal"
+    max_points = 4000           # Points in the visible range per curve
+    context_points = 200        # Points left / right of the visible range
 
-        real_component = np.real(signal_model.data)
-        img_component = np.imag(signal_model.data)
+    def __init__(self):
+        super().__init__()
+        self.fs = None
+        self.pyramids = []
+        self.curves = []
+        self._view_box = None
+        self._last_range = None
+
+    def plot(self, widget: PlotWidget, signal_model):
+        self.draw(widget, self.compute(signal_model))
+
+    def compute(self, signal_model):
+        data = signal_model.data
+
+        components = [(np.real(data), 'b', signal_model.name)]
+        if np.iscomplexobj(data):
+            components.append((np.imag(data), 'r', signal_model.name + " Imaginary"))
+
+        pyramids = [(MinMaxPyramid(component), color, name) for component, color, name in components]
+        return signal_model.name, signal_model.fs, pyramids
+
+    def draw(self, widget: PlotWidget, prepared):
+        name, fs, pyramids = prepared
+
+        self.fs = fs
+        self._last_range = None
+        self.pyramids = [pyramid for pyramid, _, _ in pyramids]
 
         widget.plot_widget.setLabel('bottom', 'Time', units='s')
         widget.plot_widget.setLabel('left', 'Amplitude', units='V')
+        widget.plot_widget.setTitle(f"{self.title_prefix}: {name}")
 
-        widget.plot_widget.setTitle(f"Baseband Signal: {signal_model.name}")
+        self.curves = []
+        for key, (pyramid, color, name) in zip(("real", "imag"), pyramids):
+            sample_pos, values = pyramid.query(0, len(pyramid), self.max_points)
+            self.curves.append(self._set_curve(widget, key, sample_pos / self.fs, values, color=color, name=name))
 
-        # Downsample for performance
-        time_ds, real_ds = downsample_for_plot(timevector, real_component, max_points=10000)
-        _, imag_ds = downsample_for_plot(timevector, img_component, max_points=10000)
+        if len(pyramids) == 1:
+            self._hide("imag")
 
-        widget.plot_data(time_ds, real_ds, color='b', name=signal_model.name)
-        widget.plot_data(time_ds, imag_ds, color='r', name=signal_model.name + " Imaginary", clear=False)
+        if self._view_box is None:
+            self._view_box = widget.plot_widget.getViewBox()
+            self._view_box.sigXRangeChanged.connect(self._on_x_range_changed)
 
+    def clear(self):
+        self.pyramids = []
+        self.curves = []
+        self._last_range = None
 
-class BandpassPlotStrategy(PlotStrategy):
-    def plot(self, widget: PlotWidget, signal_model):
+    def _on_x_range_changed(self, view_box, x_range):
+        if not self.pyramids or not self.fs:
+            return
 
-        widget.plot_widget.clear()
+        num_samples = len(self.pyramids[0])
+        start = max(int(np.floor(x_range[0] * self.fs)), 0)
+        stop = min(int(np.ceil(x_range[1] * self.fs)) + 1, num_samples)
 
-        num_samples = len(signal_model.data)
+        if (start, stop) == self._last_range:
+            return
+        self._last_range = (start, stop)
 
-        timevector = np.arange(num_samples) / signal_model.fs
+        for pyramid, curve in zip(self.pyramids, self.curves):
+            left = pyramid.query(0, start, self.context_points)
+            visible = pyramid.query(start, stop, self.max_points)
+            right = pyramid.query(stop, num_samples, self.context_points)
 
-        real_component = np.real(signal_model.data)
-        img_component = np.imag(signal_model.data)
+            sample_pos = np.concatenate((left[0], visible[0], right[0]))
+            values = np.concatenate((left[1], visible[1], right[1]))
+            curve.setData(sample_pos / self.fs, values, skipFiniteCheck=True)
 
-        widget.plot_widget.setLabel('bottom', 'Time', units='s')
-        widget.plot_widget.setLabel('left', 'Amplitude', units='V')
 
-        widget.plot_widget.setTitle(f"Bandpass Signal: {signal_model.name}")
+class BasebandPlotStrategy(TimeSignalPlotStrategy):
+    title_prefix = "Baseband Signal"
 
-        # Downsample for performance
-        time_ds, real_ds = downsample_for_plot(timevector, real_component, max_points=10000)
-        _, imag_ds = downsample_for_plot(timevector, img_component, max_points=10000)
 
-        widget.plot_data(time_ds, real_ds, color = 'b', name=signal_model.name)
-        widget.plot_data(time_ds, imag_ds, color = 'r', name=signal_model.name + " Imaginary",clear=False)
+class BandpassPlotStrategy(TimeSignalPlotStrategy):
+    title_prefix = "Bandpass Signal"
 
 
 class FFTPlotStrategy(PlotStrategy):
-    def plot(self, widget, signal_model):
-        data = signal_model.data
-        fs = signal_model.fs
+    """Welch PSD (see src.modules.spectrum), memoized per container."""
 
-        # 1. Performance Guard: Decimate if oversampled (e.g., 48k for 10 Baud)
-        if len(data) > 5000:
-            factor = 100
-            plot_data = signal.decimate(data, factor)
-            plot_fs = fs / factor
-        else:
-            plot_data = data
-            plot_fs = fs
+    def __init__(self, engine: SpectrumEngine = None):
+        super().__init__()
+        self.engine = engine or SpectrumEngine()
 
-        n = 2**12
+    def plot(self, widget, signal_model):
+        self.draw(widget, self.compute(signal_model))
 
-        xk_complex = np.fft.fft(plot_data, n=n)
-        xf = np.fft.fftfreq(n, d=1/plot_fs)
+    def compute(self, signal_model):
+        xf, psd = self.engine.psd(signal_model)
 
-        # xk = (1/(fs*N)) * |fft(xn)|^2
-        psd_raw = (1.0 / (plot_fs * n)) * np.abs(xk_complex)**2
+        # Convert to dB: pow2db(xk)
+        psd_db = 10 * np.log10(psd + 1e-12)
 
-        # Double values except for DC and Nyquist
-        psd_raw[1:-1] *= 2
+        return xf, psd_db
 
-        # Convert to dB: pow2db(xk)
-        psd_db = 10 * np.log10(psd_raw + 1e-12)
+    def draw(self, widget, prepared):
+        xf, psd_db = prepared
 
-        # 4. Final Plotting
-        widget.plot_widget.clear()
+        widget.plot_widget.setLabel('bottom', 'Frequency', units='Hz')
         widget.plot_widget.setLabel('left', 'Power Density', units='dB/Hz')
-        widget.plot_data(xf, psd_db, color='b')
+        self._set_curve(widget, "psd", xf, psd_db, color='b')
+
+    def clear(self):
+        self.engine.clear()
 
 
 class PeriodogrammPlotStrategy(PlotStrategy):
     def plot(self, widget: PlotWidget, signal_model):
 
-        widget.plot_widget.clear()
-
-
         T_pulse = 1.0 / signal_model.sym_rate # Assuming symbol_rate is available
 
         # --- KEY CORRECTION: Use a large nfft for high frequency resolution ---
@@ -298,76 +456,171 @@ class PeriodogrammPlotStrategy(PlotStrategy):
         widget.plot_widget.setTitle(f"High-Resolution Periodogram Spectrum")
 
         # --- Plotting ---
-        widget.plot_data(f_normalized, Pxx_den_dB, color = 'b', name=signal_model.name)
+        self._set_curve(widget, "psd", f_normalized, Pxx_den_dB, color = 'b', name=signal_model.name)
 
 
 class SpectogramPlotStrategy(PlotStrategy):
-    def plot(self, widget: PlotWidget, signal_model):
+    """
+    Spectrogram from cached STFT tiles (see src.modules.spectrum): an update
+    only computes the tiles whose samples changed.
+
+    Attributes:
+        time_window: Shown duration in s, the latest part of the signal (None: whole signal)
+        max_columns: Image width; wider spectrograms are reduced by max-pooling columns
+    """
+
+    NPERSEG = 256
+    OVERLAP = NPERSEG // 2
+    WINDOW_TYPE = 'hann'
 
-        NPERSEG = 256
-        OVERLAP = NPERSEG // 2
-        WINDOW_TYPE = 'hann'
+    def __init__(self, time_window: float = None, max_columns: int = 2000):
+        super().__init__()
+        self.time_window = time_window
+        self.max_columns = max_columns
+        self.tiles = StftTileCache(nperseg=self.NPERSEG, noverlap=self.OVERLAP, window=self.WINDOW_TYPE)
 
-        # 0. Type check/data preparation (Essential for robust code)
-        if signal_model.data is np.iscomplexobj:
-            data = np.real(signal_model.data)
-        else:
-            data = signal_model.data
+    def plot(self, widget: PlotWidget, signal_model):
+        self.draw(widget, self.compute(signal_model))
 
+    def compute(self, signal_model):
+        data = signal_model.data
         fs = signal_model.fs
 
-        if fs <= 0 or len(data) == 0:
-            widget.plot_widget.clear()
-            widget.plot_widget.setTitle("Error: Invalid Sampling Rate or Empty Signal")
+        if fs <= 0 or len(data) < self.NPERSEG:
+            return None
+
+        # 1. Columns of the shown time window, new / changed tiles only
+        stop_col = self.tiles.num_columns(len(data))
+        start_col = 0
+        if self.time_window is not None:
+            start_col = max(stop_col - int(self.time_window * fs / self.tiles.step), 0)
+
+        t, f, spectrogram_db = self.tiles.columns(data, fs, start_col, stop_col)
+
+        # 2. Bounded image width: keep the peak of each group of columns
+        factor = -(-len(spectrogram_db) // self.max_columns)
+        if factor > 1:
+            pad = -len(spectrogram_db) % factor
+            spectrogram_db = np.pad(spectrogram_db, ((0, pad), (0, 0)), mode='edge')
+            spectrogram_db = spectrogram_db.reshape(-1, factor, spectrogram_db.shape[1]).max(axis=1)
+
+        return f, t, spectrogram_db
+
+    def draw(self, widget: PlotWidget, prepared):
+        if prepared is None:
+            self._hide("image")
+            widget.plot_widget.setTitle("Error: Invalid Sampling Rate or Signal shorter than one Segment")
             return
 
-        widget.plot_widget.clear()
-
-        # 1. Compute the Spectrogram (Frequency, Time, Power Spectral Density)
-        # We use the built-in convenience function for simplicity and robustness.
-        f, t, Sxx = signal.spectrogram(
-            data,
-            fs=fs,
-            window=WINDOW_TYPE,
-            nperseg=NPERSEG,
-            noverlap=OVERLAP,
-            scaling='density'  # Use Power Spectral Density
-        )
-
-        # 2. Convert Power Spectral Density (Sxx) to dB scale (10 * log10(Sxx))
-        # Add a small offset (1e-10) to avoid log(0) for truly zero values.
-        # Transpose the array to ensure frequency (vertical) and time (horizontal)
-        # axes match the pyqtgraph ImageItem orientation.
-        spectrogram_db = 10 * np.log10(Sxx.T + 1e-10)
-
-        # 3. Create the ImageItem and load the data
-        img = pg.ImageItem()
-        img.setImage(spectrogram_db)
-
-        # 4. Set the position and scale of the image
-        # This step is critical for aligning the spectrogram data matrix (spectrogram_db)
-        # with the axes coordinates (t and f).
-        time_span = t[-1] - t[0]
-        freq_span = f[-1] - f[0]
-
-        img.setRect(QRectF(
-            t[0],     # x_min (start time)
-            f[0],     # y_min (start frequency)
-            time_span, # x_span (total duration)
-            freq_span * 0.00001  # y_span (total frequency range)
-        ))
+        f, t, spectrogram_db = prepared
+
+        # 3. Load the data into the ImageItem (columns --> x = time, frequencies --> y)
+        img = self._image(widget)
+        img.setImage(spectrogram_db, autoLevels=True)
+        img.setVisible(True)
 
-        # 5. Add the image to the plot
-        widget.plot_widget.addItem(img)
+        # 4. Image covers the time window and the full frequency range
+        img.setRect(QRectF(t[0], f[0], t[-1] - t[0], f[-1] - f[0]))
 
         # 6. Configure Axes and Title
         widget.plot_widget.setLabel('bottom', 'Time ', units='s')
         widget.plot_widget.setLabel('left', 'Frequency', units='Hz')
-        widget.plot_widget.setTitle(f"Spectrogram (Nseg={256}, {WINDOW_TYPE.upper()} Window)")
+        widget.plot_widget.setTitle(f"Spectrogram (Nseg={self.NPERSEG}, {self.WINDOW_TYPE.upper()} Window)")
 
-        # Optional: Auto-range the view to fit the spectrogram
         widget.plot_widget.getViewBox().autoRange()
 
+    def clear(self):
+        self.tiles.clear()
+
+
+class EyeDiagramPlotStrategy(PlotStrategy):
+    """
+    Eye Diagram as persistence image (2-D histogram of all traces).
+
+    The baseband is cut into two-symbol traces with a strided view (no copy),
+    every trace is centered on a symbol instant. Instead of one curve per trace
+    the hits are counted per (time, amplitude) cell and shown as ImageItem.
+    """
+
+    def __init__(self, amplitude_bins=200, max_time_bins=400, traces_per_block=256):
+        super().__init__()
+        self.amplitude_bins = amplitude_bins
+        self.max_time_bins = max_time_bins
+        self.traces_per_block = traces_per_block
+
+    def _eye_traces(self, signal_model: BasebandSignal):
+        """Two-symbol traces as strided view into the In-Phase component."""
+        sps = signal_model.fs // signal_model.sym_rate
+        trace_len = 2 * sps
+
+        # Symbol k peaks at k * sps + pulse_len // 2 --> trace starts one symbol earlier
+        offset = (len(signal_model.pulse.data) // 2) % sps
+
+        in_phase = np.real(signal_model.data)[offset:]
+        if len(in_phase) < trace_len:
+            return sps, np.empty((0, trace_len))
+
+        traces = np.lib.stride_tricks.sliding_window_view(in_phase, trace_len)[::sps]
+        return sps, traces
+
+    def _persistence(self, traces: np.ndarray, amp_min: float, amp_max: float):
+        """Counts the hits per cell. Blocks of traces keep the temporary index arrays small."""
+        trace_len = traces.shape[1]
+        time_bins = min(trace_len, self.max_time_bins)
+
+        time_idx = (np.arange(trace_len) * time_bins) // trace_len
+        scale = (self.amplitude_bins - 1) / (amp_max - amp_min)
+
+        counts = np.zeros(time_bins * self.amplitude_bins, dtype=np.int64)
+
+        for start in range(0, len(traces), self.traces_per_block):
+            block = traces[start:start + self.traces_per_block]
+            amp_idx = ((block - amp_min) * scale).astype(np.int64)
+            cell_idx = time_idx[None, :] * self.amplitude_bins + amp_idx
+            counts += np.bincount(cell_idx.ravel(), minlength=counts.size)
+
+        return counts.reshape(time_bins, self.amplitude_bins)
+
+    def plot(self, widget: PlotWidget, signal_model: BasebandSignal):
+        self.draw(widget, self.compute(signal_model))
+
+    def compute(self, signal_model: BasebandSignal):
+        sps, traces = self._eye_traces(signal_model)
+
+        if len(traces) == 0:
+            return None
+
+        amp_max = np.max(np.abs(traces)) * 1.1
+        amp_min = -amp_max
+        if amp_max == 0:
+            amp_min, amp_max = -1.0, 1.0
+
+        counts = self._persistence(traces, amp_min, amp_max)
+
+        # Log scale: rare transitions stay visible next to the dense rails
+        return np.log1p(counts).astype(np.float32), amp_min, amp_max, len(traces)
+
+    def draw(self, widget: PlotWidget, prepared):
+        if prepared is None:
+            self._hide("image")
+            widget.plot_widget.setTitle("Eye Diagram: Signal shorter than two symbols")
+            return
+
+        image, amp_min, amp_max, num_traces = prepared
+
+        img = self._image(widget, colormap='inferno')
+        img.setImage(image, autoLevels=True)
+        img.setVisible(True)
+
+        # x in symbol periods (-1 ... 1), y in amplitude
+        img.setRect(QRectF(-1.0, amp_min, 2.0, amp_max - amp_min))
+
+        widget.plot_widget.setLabel('bottom', 'Time', units='T')
+        widget.plot_widget.setLabel('left', 'Amplitude (I)', units='V')
+        widget.plot_widget.setTitle(f"Eye Diagram ({num_traces} traces)")
+        widget.plot_widget.getViewBox().autoRange()
+
+
 class FrequencyResponse(PlotStrategy):
     def plot(self, widget, signal_model):
 
@@ -385,26 +638,88 @@ class FrequencyResponse(PlotStrategy):
         widget.plot_widget.setLabel('left', 'Magnitude', units='dB')
         widget.plot_widget.setXRange(0, signal_model.fs / 2)
 
-        widget.plot_data(xf_hz, mag_db)
+        self._set_curve(widget, "magnitude", xf_hz, mag_db)
 
 
 
 
 class PlotManager:
+    """
+    Renders the newest container of a view, at most once per frame and only
+    while the view is visible: updates of a hidden view (e.g. an inactive tab)
+    only mark it dirty, it is rendered when it is shown.
+    """
+
+    FRAME_INTERVAL_MS = 16
+
     def __init__(self, widget: PlotWidget):
         self.widget = widget
         self.strategy = None
+        self.scheduler = None
+
+        self._pending_model = None
+        self._dirty = False
+
+        self._frame_timer = QTimer()
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._render)
+
+        self.widget.sig_shown.connect(self._on_shown)
 
     def set_strategy(self, strategy: PlotStrategy):
         self.strategy = strategy
 
+    def set_scheduler(self, scheduler):
+        """With a JobScheduler `compute` runs on its workers (newest container wins), `draw` on the GUI thread."""
+        self.scheduler = scheduler
+
+    @property
+    def _stage(self) -> str:
+        return f"plot:{id(self)}"
+
     def update_plot(self, signal_model):
-        if self.strategy:
+        if not self.strategy:
+            return
+
+        self._pending_model = signal_model
+        self._dirty = True
+
+        if self.widget.isVisible() and not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _on_shown(self):
+        if self._dirty and not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _render(self):
+        if not self._dirty or not self.strategy:
+            return
+        if not self.widget.isVisible():         # Hidden again before the frame
+            return
+
+        signal_model = self._pending_model
+        self._dirty = False
+        self._pending_model = None
+
+        if self.scheduler is None:
             self.strategy.plot(self.widget, signal_model)
+            return
 
-    def clear_plot(self):
-        self.widget.plot_widget.clear()
+        strategy = self.strategy
 
+        def draw(prepared):
+            if self.strategy is strategy:          # Strategy switched meanwhile
+                strategy.draw(self.widget, prepared)
 
+        self.scheduler.submit(self._stage, lambda job, model: strategy.compute(model), signal_model, on_result=draw)
 
-# TODO Handle Complex Data in Plotstrategies
\ No newline at end of file
+    def clear_plot(self):
+        self._frame_timer.stop()
+        self._dirty = False
+        self._pending_model = None
+        if self.scheduler is not None:
+            self.scheduler.cancel(self._stage)
+        self.widget.plot_widget.clear()
+        if self.strategy:
+            self.strategy.clear()
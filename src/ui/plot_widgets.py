@@ -1,4 +1,5 @@
 import pyqtgraph as pg
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QVBoxLayout, QWidget, QTabWidget)
 
@@ -6,6 +7,9 @@ from src.ui.style.color_pallete import LIGHT_THEME_RGB
 
 
 class PlotWidget(QWidget):
+
+    sig_shown = Signal()            # Became visible (tab selected, window shown)
+
     def __init__(self, title="Signal Plot", parent = None):
 
         super().__init__(parent)
@@ -31,6 +35,10 @@ class PlotWidget(QWidget):
 
         self.current_curve = None
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sig_shown.emit()
+
 
     def plot_data(self, timevector, datavector, color='b', name="Signal", clear=True, stepMode=False):
         if clear:
@@ -48,7 +56,7 @@ class PlotWidget(QWidget):
 
 class SpectrumContainerWidget(QWidget):
 
-    def __init__(self, title_prefix="Spectrum", parent = None):
+    def __init__(self, title_prefix="Spectrum", parent = None, show_eye_diagram=False):
 
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
@@ -61,6 +69,12 @@ class SpectrumContainerWidget(QWidget):
         self.tab_widget.addTab(self.plot_fft, "FFT")
         self.tab_widget.addTab(self.plot_spectrogram, "Spectrogram")
 
+        # Eye Diagram only makes sense for the Baseband
+        self.plot_eye = None
+        if show_eye_diagram:
+            self.plot_eye = PlotWidget(title=f"{title_prefix}: Eye Diagram")
+            self.tab_widget.addTab(self.plot_eye, "Eye Diagram")
+
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
 
 class PulseContainerWidget(QWidget):
@@ -2,13 +2,14 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy,
     QPushButton, QGroupBox, QSlider, QComboBox, QRadioButton,
     QButtonGroup, QGridLayout, QFormLayout, QScrollArea, QFrame, QAbstractButton,
-    QPushButton, QLineEdit,QFileDialog, QStackedLayout, QToolButton, QStyle
+    QPushButton, QLineEdit,QFileDialog, QStackedLayout, QToolButton, QStyle,
+    QCheckBox, QSpinBox, QProgressBar
 )
 
 from PySide6.QtCore import Qt, QTimer, Signal, Slot, QRegularExpression, QFileInfo
 from PySide6.QtGui import QFont, QRegularExpressionValidator
 from src.ui.plot_widgets import PlotWidget, SpectrumContainerWidget, PulseContainerWidget
-from src.constants import PulseShape
+from src.constants import PulseShape, INNER_CODE_MAP
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton
 
 
@@ -34,12 +35,14 @@ class ControlWidget(QWidget):
     sig_bit_stream_changed = Signal(dict)      # Emits {bit_sequence}
     sig_carrier_freq_changed = Signal(dict) # Emits {carrie_freq}
     sig_clear_plots = Signal()              # Emits when clear button is pressed
+    sig_channel_code_changed = Signal(dict) # Emits {inner_code, outer_rs, rs_parity}
 
     sig_save_requested = Signal(int)        # Emits slot_index (0-3) to save to
     sig_slot_selection_changed = Signal(int) # Emits slot_index (0-3) selected for viewing
 
     # Media Player
     sig_play_button_pressed = Signal()
+    sig_queue_button_pressed = Signal()
     sig_stop_button_pressed = Signal()
     sig_export_wav_path = Signal(str)
     sig_export_pulse_path=Signal(str)
@@ -127,7 +130,7 @@ class ControlWidget(QWidget):
         # ---- Export Pulse Metadata ----
         export_vbox = QVBoxLayout()
         file_path_hbox = QHBoxLayout()
-        file_path_hbox.addWidget(QLabel("Export Pulse as JSON"))
+        file_path_hbox.addWidget(QLabel("Export Pulse (.adtc)"))
         self.btn_browse_path = QPushButton("Export")
 
         file_path_hbox.addWidget(self.btn_browse_path)
@@ -196,6 +199,27 @@ class ControlWidget(QWidget):
         # Add the stacked widget to the group box's main layout
         self.main_vbox.addWidget(self.stacked_widget)
 
+        # Channel Coding (FEC) between Bitstream and Symbol Sequencer
+        coding_layout = QHBoxLayout()
+        coding_layout.addWidget(QLabel("Channel Code:"))
+        self.inner_code_combo = QComboBox()
+        for inner_code, label in INNER_CODE_MAP.items():
+            self.inner_code_combo.addItem(label, inner_code)
+        coding_layout.addWidget(self.inner_code_combo)
+        self.main_vbox.addLayout(coding_layout)
+
+        # Outer Reed-Solomon Code (Burst Errors) with configurable redundancy
+        rs_layout = QHBoxLayout()
+        self.chk_reed_solomon = QCheckBox("Reed-Solomon RS(255,k)")
+        rs_layout.addWidget(self.chk_reed_solomon)
+        rs_layout.addWidget(QLabel("Parity Bytes:"))
+        self.spin_rs_parity = QSpinBox()
+        self.spin_rs_parity.setRange(2, 128)
+        self.spin_rs_parity.setSingleStep(2)
+        self.spin_rs_parity.setValue(32)
+        rs_layout.addWidget(self.spin_rs_parity)
+        self.main_vbox.addLayout(rs_layout)
+
         # Add the global 'Clear All Signals' button below the stack
         self.btn_clear_plots = QPushButton("Clear All Signals & Data")
         self.main_vbox.addWidget(self.btn_clear_plots)
@@ -205,6 +229,9 @@ class ControlWidget(QWidget):
 
         # Connect the global button
         self.btn_clear_plots.clicked.connect(self.sig_clear_plots.emit) # Keep this one
+        self.inner_code_combo.currentIndexChanged.connect(self._emit_channel_code)
+        self.chk_reed_solomon.toggled.connect(self._emit_channel_code)
+        self.spin_rs_parity.valueChanged.connect(self._emit_channel_code)
 
         self.vbox.addWidget(self.group_bitstream)
 
@@ -291,6 +318,26 @@ class ControlWidget(QWidget):
             self.freq_bg.buttons()[0].setChecked(True)
             layout.addLayout(h_rad)
 
+            # Framing: CRC-32 protected frames, each with its own Barker Preamble
+            frame_layout = QHBoxLayout()
+            self.chk_packetize = QCheckBox("Packetize (CRC-32 Frames)")
+            frame_layout.addWidget(self.chk_packetize)
+            frame_layout.addWidget(QLabel("Payload Bits / Frame:"))
+            self.spin_frame_bits = QSpinBox()
+            self.spin_frame_bits.setRange(8, 65535)
+            self.spin_frame_bits.setValue(1024)
+            frame_layout.addWidget(self.spin_frame_bits)
+            layout.addLayout(frame_layout)
+
+            # Multichannel: the Bitstream is split over the output channels
+            channels_layout = QHBoxLayout()
+            channels_layout.addWidget(QLabel("Output Channels:"))
+            self.spin_channels = QSpinBox()
+            self.spin_channels.setRange(1, 8)
+            self.spin_channels.setValue(1)
+            channels_layout.addWidget(self.spin_channels)
+            layout.addLayout(channels_layout)
+
             self.btn_modulate = QPushButton("Modulate")
             layout.addWidget(self.btn_modulate)
 
@@ -318,6 +365,9 @@ class ControlWidget(QWidget):
         self.btn_play = QPushButton("Play")
         player_vbox.addWidget(self.btn_play)
 
+        self.btn_queue = QPushButton("Add to Queue")
+        player_vbox.addWidget(self.btn_queue)
+
         self.btn_stop = QPushButton("Stop")
         player_vbox.addWidget(self.btn_stop)
 
@@ -351,6 +401,7 @@ class ControlWidget(QWidget):
     # --- Internal Emitters  ---
 
         self.btn_play.clicked.connect(self.sig_play_button_pressed.emit)
+        self.btn_queue.clicked.connect(self.sig_queue_button_pressed.emit)
         self.btn_stop.clicked.connect(self.sig_stop_button_pressed.emit)
         self.btn_browse_path.clicked.connect(self._open_export_wav_dialog)
         self.btn_export.clicked.connect(self._emit_export_wav_path)
@@ -397,12 +448,21 @@ class ControlWidget(QWidget):
             "bit_seq": self.entry_bitstream.text()
         })
 
+    def _emit_channel_code(self):
+        self.sig_channel_code_changed.emit({
+            "inner_code": self.inner_code_combo.currentData(),
+            "outer_rs": self.chk_reed_solomon.isChecked(),
+            "rs_parity": self.spin_rs_parity.value()
+        })
+
     def _emit_carrier_freq(self):
 
         carrier_freq = self.freq_bg.checkedButton().text()
         carrier_freq = carrier_freq.split(" ")[0]  # Get numeric part
         self.sig_carrier_freq_changed.emit({
-            "carrier_freq": carrier_freq
+            "carrier_freq": carrier_freq,
+            "frame_bits": self.spin_frame_bits.value() if self.chk_packetize.isChecked() else None,
+            "channels": self.spin_channels.value()
         })
 
     def set_pulse_shape_map(self):
@@ -491,7 +551,7 @@ class ControlWidget(QWidget):
         self.entry_bitstream.setEnabled(True)
 
     def _open_export_pulse_dialog(self):
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export Pulse Signal", "", "Json Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Pulse Signal", "", "Container Files (*.adtc)")
 
         if file_path:
             self.sig_export_pulse_path.emit(file_path)
@@ -545,7 +605,7 @@ class MatrixWidget(QWidget):
 
         # 4. Baseband FFT (Placeholder)
         #self.plot_bb_fft = PlotWidget(title="Spectrum - Pending")
-        self.bb_spectrum_container = SpectrumContainerWidget(title_prefix="Baseband Spectrum")
+        self.bb_spectrum_container = SpectrumContainerWidget(title_prefix="Baseband Spectrum", show_eye_diagram=True)
         # 5. Bandpass
         self.plot_bandpass  = PlotWidget(title="Bandpass (Time) - Pending")
 
@@ -608,6 +668,10 @@ class MetaDataWidget(QWidget):
 # +++++ Footer Widget +++++
 #------------------------------------------------------------
 class FooterWidget(QWidget):
+
+    sig_save_session_path = Signal(str)
+    sig_load_session_path = Signal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -615,9 +679,54 @@ class FooterWidget(QWidget):
 
         # Assuming simple footer for layout purposes
         layout = QHBoxLayout(self)
+        self.btn_save_session = QPushButton("Save Session")
+        self.btn_load_session = QPushButton("Load Session")
+        layout.addWidget(self.btn_save_session)
+        layout.addWidget(self.btn_load_session)
         layout.addStretch()
+
+        # Background rendering (JobScheduler), hidden while idle
+        self.lbl_progress = QLabel()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.lbl_progress.hide()
+        self.progress_bar.hide()
+        layout.addWidget(self.lbl_progress)
+        layout.addWidget(self.progress_bar)
+
         self.btn_restart = QPushButton("Restart Application")
         layout.addWidget(self.btn_restart)
 
+        self.btn_save_session.clicked.connect(self._open_save_session_dialog)
+        self.btn_load_session.clicked.connect(self._open_load_session_dialog)
+
+    @Slot(str, float)
+    def on_job_progress(self, stage, fraction):
+        if stage.startswith("plot:"):
+            stage = "plots"
+        self.lbl_progress.setText(f"Rendering {stage} ...")
+        self.progress_bar.setValue(int(fraction * 100))
+
+    @Slot(bool)
+    def on_busy_changed(self, busy):
+        if busy:
+            self.lbl_progress.setText("Rendering ...")
+            self.progress_bar.setValue(0)
+        self.lbl_progress.setVisible(busy)
+        self.progress_bar.setVisible(busy)
+
+    def _open_save_session_dialog(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Session", "", "Container Files (*.adtc)")
+
+        if file_path:
+            self.sig_save_session_path.emit(file_path)
+
+    def _open_load_session_dialog(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Session", "", "Container Files (*.adtc)")
+
+        if file_path:
+            self.sig_load_session_path.emit(file_path)
+
 
 
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Tests import the app modules as `src.…` from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Qt without a display (AppState / GUI tests)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import time
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qt_app():
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def app_state(qt_app):
+    from src.core.AppState import AppState
+    state = AppState({"sym_rate": 100, "audio_backend": "null"})
+    yield state
+    state.scheduler.shutdown()
+    state.audio_handler.shutdown()
+
+
+@pytest.fixture
+def wait_idle(qt_app):
+    """Runs the event loop until all background jobs of an AppState are delivered."""
+    def wait(state, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while state.scheduler.is_busy():
+            assert time.monotonic() < deadline, "Background jobs did not finish"
+            qt_app.processEvents()
+            time.sleep(0.005)
+        qt_app.processEvents()
+    return wait
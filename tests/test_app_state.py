@@ -0,0 +1,119 @@
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.constants import InnerCode
+from src.modules.channel_coding import ConvolutionalCode, ReedSolomonCode
+from src.modules.helper_functions import create_mod_scheme_lut
+
+
+def test_default_mod_scheme_matches_the_lut_factory(app_state):
+    expected = create_mod_scheme_lut("2-ASK", "Binary")
+    assert app_state.current_mod_scheme.name == expected.name
+    assert app_state.current_mod_scheme.look_up_table == expected.look_up_table
+
+
+def test_channel_code_update_is_atomic(app_state):
+    app_state.on_channel_code_update({"inner_code": InnerCode.CONVOLUTIONAL, "outer_rs": True, "rs_parity": 16})
+    inner, outer = app_state.inner_code, app_state.outer_code
+    assert isinstance(inner, ConvolutionalCode) and isinstance(outer, ReedSolomonCode)
+
+    # Invalid RS parameters: neither code changes
+    app_state.on_channel_code_update({"inner_code": InnerCode.NONE, "outer_rs": True, "rs_parity": 1})
+    assert app_state.inner_code is inner
+    assert app_state.outer_code is outer
+
+
+def test_modulate_with_packetizer(app_state, wait_idle):
+    app_state.on_bitseq_update({"bit_seq": "1011" * 100})
+    wait_idle(app_state)
+
+    app_state.on_carrier_freq_update({"carrier_freq": "4400", "frame_bits": 128})
+    wait_idle(app_state)
+
+    bandpass = app_state.current_bandpass_signal
+    assert "4 Frames" in bandpass.name
+    assert bandpass.carrier_freq == 4400
+    # Every frame carries header + CRC on top of its payload
+    assert len(bandpass.baseband_signal.symbol_stream.bit_stream.data) == 400 + 4 * 64
+
+
+def test_play_streams_the_bandpass_container(app_state, wait_idle):
+    from src.modules.audio_backend import LoopbackBackend
+    loopback = LoopbackBackend(speed=50.0)
+    app_state.audio_handler.backend = loopback
+
+    app_state.on_bitseq_update({"bit_seq": "110100111010"})
+    wait_idle(app_state)
+    app_state.on_carrier_freq_update({"carrier_freq": "4400"})
+    wait_idle(app_state)
+    bandpass = np.real(app_state.current_bandpass_signal.data)
+
+    app_state.play_audio()
+    deadline = time.monotonic() + 10.0
+    while loopback.recorded_frames < len(bandpass) + 48000 * 0.2:
+        assert time.monotonic() < deadline, "Playback did not finish"
+        time.sleep(0.01)
+
+    recorded = loopback.recorded[:, 0]
+    start = np.flatnonzero(recorded)[0]
+    played = recorded[start:start + len(bandpass)]
+
+    # Sample for sample the plotted / exported signal, normalized to its own peak
+    expected = bandpass / np.max(np.abs(bandpass))
+    first = np.flatnonzero(expected)[0]
+    np.testing.assert_allclose(played[:len(expected) - first], expected[first:], atol=1e-6)
+
+
+def test_multichannel_modulate_play_and_export(app_state, wait_idle, tmp_path):
+    from src.modules.wav_io import WavReader
+
+    app_state.on_bitseq_update({"bit_seq": "1100101" * 20})
+    wait_idle(app_state)
+    app_state.on_carrier_freq_update({"carrier_freq": "4400", "channels": 2})
+    wait_idle(app_state)
+
+    stacked = app_state.current_channel_signals
+    assert stacked.shape[1] == 2
+    # Plots get the first channel as a regular container
+    np.testing.assert_array_equal(stacked[:len(app_state.current_bandpass_signal.data), 0],
+                                  app_state.current_bandpass_signal.data)
+
+    app_state.play_audio()
+    app_state.queue_audio()
+
+    app_state.on_export_path_changed(str(tmp_path / "stereo.wav"))
+    with WavReader(tmp_path / "stereo.wav") as reader:
+        assert reader.channels == 2
+        assert reader.frames == len(stacked)
+
+    # Back to mono
+    app_state.on_carrier_freq_update({"carrier_freq": "4400"})
+    wait_idle(app_state)
+    assert app_state.current_channel_signals is None
+
+
+def test_render_cache_is_opt_in_and_checked_before_any_job(app_state, wait_idle, tmp_path):
+    from src.modules.render_cache import RenderCache
+    assert app_state.render_cache is None
+
+    app_state.render_cache = RenderCache(tmp_path)
+    app_state.on_bitseq_update({"bit_seq": "0110" * 50})
+    wait_idle(app_state)
+    app_state.on_carrier_freq_update({"carrier_freq": "8800"})
+    wait_idle(app_state)
+    rendered = app_state.current_bandpass_signal
+    assert app_state.render_cache.hits == 0 and len(app_state.render_cache.entries()) == 1
+
+    # Same bits again: the baseband job is still running, the bandpass comes from the cache at once
+    app_state.on_bitseq_update({"bit_seq": "0110" * 50})
+    app_state.on_carrier_freq_update({"carrier_freq": "8800"})
+    assert app_state.render_cache.hits == 1
+    assert not app_state.scheduler.is_busy("bandpass")
+    assert app_state.current_bandpass_signal.data.dtype == np.float32
+    np.testing.assert_allclose(app_state.current_bandpass_signal.data, rendered.data, atol=1e-5)
+    np.testing.assert_allclose(app_state.current_bandpass_signal.baseband_signal.data,
+                               rendered.baseband_signal.data, atol=1e-5)
+    wait_idle(app_state)
@@ -0,0 +1,225 @@
+import threading
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication
+
+from src.modules.audio_backend import LoopbackBackend, NullBackend, CallbackStatus
+from src.modules.audio_player import AudioPlaybackHandler, CallbackInstrumentation, PlaybackSource, \
+    PlaybackWorker, RingBuffer, TransmitQueue
+
+
+def pump_until(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not reached"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def buffered_source(data, fs=8000, **kwargs):
+    """PlaybackSource with the whole signal already in its ring buffer."""
+    source = PlaybackSource(iter([data]), fs, **kwargs).start()
+    deadline = time.monotonic() + 5.0
+    while not source.producer_done:
+        assert time.monotonic() < deadline, "Producer did not finish"
+        time.sleep(0.001)
+    return source
+
+
+def run_callbacks(worker, num_blocks, frames=256):
+    """Calls the stream callback like the driver and returns the mono output."""
+    output = []
+    for _ in range(num_blocks):
+        outdata = np.full((frames, 1), np.nan, dtype=np.float32)
+        worker._callback(outdata, frames, None, None)
+        output.append(outdata[:, 0])
+    return np.concatenate(output)
+
+
+def take_frames(queue, num_frames):
+    """Pulls `num_frames` from the block stream of a queue, then closes it and drains the rest."""
+    blocks = queue.blocks()
+    output = []
+    while sum(map(len, output)) < num_frames:
+        output.append(np.reshape(next(blocks), -1))
+    queue.close()
+    output.extend(np.reshape(block, -1) for block in blocks)
+    return np.concatenate(output)
+
+
+# ---- Ring Buffer ----
+def test_ring_buffer_wraps_around():
+    ring = RingBuffer(10)
+    out = np.zeros((7, 1), dtype=np.float32)
+
+    assert ring.write(np.arange(7.0)) == 7
+    assert ring.read_into(out) == 7
+    assert ring.write(np.arange(7.0, 19.0)) == 10           # Only the free space is written
+
+    out = np.zeros((10, 1), dtype=np.float32)
+    assert ring.read_into(out) == 10
+    np.testing.assert_array_equal(out[:, 0], np.arange(7.0, 17.0))
+
+
+# ---- Playback Worker ----
+def test_start_and_stop_are_sample_accurate():
+    worker = PlaybackWorker(8000, backend=NullBackend())
+    worker.set_source(buffered_source(np.arange(1.0, 1001.0), start_frame=300))
+    worker.stop_at(900)
+
+    output = run_callbacks(worker, 4)
+    np.testing.assert_array_equal(output[:300], 0.0)
+    np.testing.assert_array_equal(output[300:900], np.arange(1.0, 601.0))
+    np.testing.assert_array_equal(output[900:], 0.0)
+    assert not worker.is_active
+
+
+def test_play_replaces_the_running_source():
+    worker = PlaybackWorker(8000, backend=NullBackend())
+    first = buffered_source(np.ones(2000))
+    worker.set_source(first)
+    np.testing.assert_array_equal(run_callbacks(worker, 1), 1.0)
+
+    worker.set_source(buffered_source(np.full(2000, 0.5)))
+    assert first.is_cancelled
+    np.testing.assert_array_equal(run_callbacks(worker, 2), 0.5)
+
+
+def test_stream_stays_open_between_plays(qt_app):
+    backend = LoopbackBackend(speed=50.0)
+    handler = AudioPlaybackHandler(backend=backend)
+    finished = []
+    handler.playback_finished.connect(lambda: finished.append(True))
+
+    try:
+        handler.play(np.ones(2000), 8000)
+        pump_until(lambda: len(finished) == 1)
+        stream = handler.playback_worker.stream
+
+        handler.play(-np.ones(3000), 8000)
+        pump_until(lambda: len(finished) == 2)
+        assert handler.playback_worker.stream is stream
+    finally:
+        handler.shutdown()
+
+    recorded = backend.recorded[:, 0]
+    assert np.count_nonzero(recorded == 1.0) == 2000
+    assert np.count_nonzero(recorded == -1.0) == 3000
+
+
+# ---- Callback Instrumentation ----
+def test_instrumentation_summary():
+    instrumentation = CallbackInstrumentation(capacity=8)
+    block_time = 256 / 8000
+
+    for i in range(10):
+        t_start = i * block_time + (0.001 if i == 5 else 0.0)      # One callback 1 ms late
+        instrumentation.record(t_start, t_start + 0.0005, 256, 8000, CallbackStatus(output_underflow=i == 9),
+                               underrun=i == 7, fill_level=1000 - i)
+    summary = instrumentation.summary()
+
+    assert summary["callbacks"] == 10
+    assert len(instrumentation.values("jitter_ms")) == 8             # Only the last `capacity` callbacks
+    assert summary["jitter_ms"]["max"] == pytest.approx(1.0)
+    assert summary["duration_ms"]["mean"] == pytest.approx(0.5)
+    assert summary["min_fill_level"] == 991
+    assert (summary["underflow"], summary["overflow"], summary["underrun"]) == (1, 0, 1)
+
+
+# ---- Transmit Queue ----
+def test_transmit_queue_inserts_guard_silence():
+    queue = TransmitQueue(1000, guard_time=0.05)
+    queue.put(iter([np.ones(300)]), "a")
+    queue.put(iter([np.full(200, 0.5)]), "b")
+
+    output = take_frames(queue, 550)
+    np.testing.assert_array_equal(output, np.concatenate((np.ones(300), np.zeros(50), np.full(200, 0.5))))
+    assert list(queue.markers) == [(300, "a"), (550, "b")]
+
+
+def test_transmit_queue_crossfades_back_to_back_items():
+    queue = TransmitQueue(1000, crossfade_time=0.1)
+    queue.put(iter([np.ones(1000)]), "a")
+    queue.put(iter([np.full(1000, 0.5)]), "b")
+
+    output = take_frames(queue, 1900)
+    fade_in = np.arange(1, 101) / 101
+    expected = np.concatenate((np.ones(900), (1 - fade_in) + 0.5 * fade_in, np.full(900, 0.5)))
+    np.testing.assert_allclose(output, expected)
+    assert list(queue.markers) == [(1000, "a"), (1900, "b")]
+
+
+def test_enqueued_items_play_without_gaps(qt_app):
+    backend = LoopbackBackend(speed=10.0)
+    handler = AudioPlaybackHandler(backend=backend)
+    finished = []
+    handler.item_finished.connect(finished.append)
+
+    items = [np.full(4000, value) for value in (0.25, 0.5, 0.75)]
+    ids = [handler.enqueue(item, 8000, gain=1.0) for item in items]
+    try:
+        pump_until(lambda: len(finished) == 3)
+    finally:
+        handler.shutdown()
+
+    assert finished == ids
+    recorded = backend.recorded[:, 0]
+    start = np.flatnonzero(recorded)[0]
+    np.testing.assert_array_equal(recorded[start:start + 12000], np.concatenate(items))
+    assert not recorded[start + 12000:].any()
+
+
+# ---- Callback Events ----
+def test_queue_events_are_emitted_on_the_gui_thread(qt_app):
+    handler = AudioPlaybackHandler(backend=LoopbackBackend(speed=50.0))
+    fs = 8000
+    emitted = []
+    handler.item_finished.connect(lambda item_id: emitted.append((item_id, threading.get_ident())))
+
+    tone = np.sin(np.arange(fs // 4))
+    ids = [handler.enqueue(tone, fs) for _ in range(3)]
+    try:
+        pump_until(lambda: len(emitted) == 3)
+    finally:
+        handler.shutdown()
+
+    assert [item_id for item_id, _ in emitted] == ids
+    assert {thread for _, thread in emitted} == {threading.get_ident()}
+
+
+def test_callback_only_counts_status_events(qt_app):
+    worker = PlaybackWorker(8000, backend=LoopbackBackend())
+    errors = []
+    worker.error.connect(errors.append)
+
+    outdata = np.zeros((256, 1), dtype=np.float32)
+    for _ in range(3):
+        worker._callback(outdata, 256, None, CallbackStatus(output_underflow=True))
+    assert errors == []
+
+    worker.dispatch_events()
+    assert len(errors) == 1 and "(3x)" in errors[0]
+
+
+def test_playback_stats_after_play(qt_app):
+    backend = LoopbackBackend(speed=50.0)
+    handler = AudioPlaybackHandler(backend=backend)
+    stats = []
+    handler.playback_stats.connect(stats.append)
+
+    data = np.linspace(-2.0, 2.0, 4000)
+    handler.play(data, 8000)
+    try:
+        pump_until(lambda: stats)
+    finally:
+        handler.shutdown()
+
+    assert stats[0].frames_played == len(data)
+    recorded = backend.recorded[:, 0]
+    start = np.flatnonzero(recorded)[0]
+    # Normalized to the peak of the data
+    np.testing.assert_allclose(recorded[start:start + len(data)], data / 2, atol=1e-6)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from src.constants import PulseShape
+from src.modules.batch_render import RenderJob, build_render_jobs, load_payload_bits, render_job
+from src.modules.helper_functions import create_mod_scheme_lut, create_pulse_signal
+from src.modules.packetizer import code_and_pad_bits, create_bandpass_signal
+from src.modules.render_cache import RenderCache
+from src.modules.wav_io import WavReader
+
+
+
+BITS = "1101001110" * 10            # 100 bits: not a multiple of 3 bits per 8-PSK symbol
+
+
+@pytest.fixture
+def payload(tmp_path):
+    path = tmp_path / "payload.bin"
+    path.write_text(BITS)
+    return path
+
+
+@pytest.fixture
+def job(payload):
+    return RenderJob(payload=str(payload), pulse_shape=str(PulseShape.RAISED_COSINE), span=4, roll_off=0.5,
+                     mod_scheme="8-PSK", mapper="Gray", carrier_freq=4400, sym_rate=100)
+
+
+def render_in_app(app_state, wait_idle, job):
+    app_state.on_pulse_update({"pulse_type": PulseShape.RAISED_COSINE, "span": job.span, "roll_off": job.roll_off})
+    app_state.on_mod_update({"mod_scheme": job.mod_scheme, "bit_mapping": job.mapper})
+    app_state.on_bitseq_update({"bit_seq": BITS})
+    wait_idle(app_state)
+    app_state.on_carrier_freq_update({"carrier_freq": str(job.carrier_freq)})
+    wait_idle(app_state)
+    return app_state.current_bandpass_signal
+
+
+def test_payload_formats(tmp_path):
+    (tmp_path / "bits.bin").write_text("10 11\n01")
+    (tmp_path / "text.txt").write_bytes(b"A")
+    np.testing.assert_array_equal(load_payload_bits(tmp_path / "bits.bin"), [1, 0, 1, 1, 0, 1])
+    np.testing.assert_array_equal(load_payload_bits(tmp_path / "text.txt"), [0, 1, 0, 0, 0, 0, 0, 1])
+
+
+def test_roll_off_only_multiplies_raised_cosine(payload):
+    jobs = build_render_jobs([payload], [PulseShape.RECTANGLE, PulseShape.RAISED_COSINE], [2], [0.25, 0.5],
+                             ["2-ASK"], ["Gray"], [440], [100])
+    assert len(jobs) == 3
+
+
+def test_app_and_batch_pad_partial_symbols_alike(app_state, wait_idle, job):
+    bandpass = render_in_app(app_state, wait_idle, job)
+
+    mod_scheme = create_mod_scheme_lut(job.mod_scheme, job.mapper)
+    pulse = create_pulse_signal(job.pulse_shape, job.sym_rate, job.fs, job.span, job.roll_off)
+    batch = create_bandpass_signal(load_payload_bits(job.payload), mod_scheme, pulse, job.carrier_freq)
+
+    # 100 bits --> 34 symbols (2 padding bits) on both paths
+    np.testing.assert_array_equal(bandpass.baseband_signal.symbol_stream.bit_stream.data,
+                                  code_and_pad_bits(np.array(list(BITS), dtype=np.int8), mod_scheme))
+    assert len(bandpass.baseband_signal.symbol_stream.data) == 34
+    assert len(bandpass.data) == len(batch.data)
+    np.testing.assert_allclose(bandpass.data, batch.data, atol=1e-12)
+
+
+def test_app_and_batch_share_render_cache_keys(app_state, wait_idle, job, tmp_path):
+    cache_dir = tmp_path / "cache"
+    render_job(job, tmp_path, cache_dir=cache_dir)
+
+    app_state.render_cache = RenderCache(cache_dir)
+    render_in_app(app_state, wait_idle, job)
+    assert app_state.render_cache.hits == 1
+
+
+def test_batch_wav_matches_container(job, tmp_path):
+    result = render_job(job, tmp_path, sample_format="float32")
+
+    mod_scheme = create_mod_scheme_lut(job.mod_scheme, job.mapper)
+    pulse = create_pulse_signal(job.pulse_shape, job.sym_rate, job.fs, job.span, job.roll_off)
+    expected = create_bandpass_signal(load_payload_bits(job.payload), mod_scheme, pulse, job.carrier_freq).data
+
+    with WavReader(result.path) as reader:
+        recorded = np.array(reader.raw[:, 0])
+    np.testing.assert_allclose(recorded, expected / np.max(np.abs(expected)), atol=1e-6)
@@ -0,0 +1,60 @@
+import csv
+import json
+import numpy as np
+import pytest
+from scipy.special import erfc
+
+from src.modules.ber_simulation import BERPoint, export_ber_results, run_ber_sweep, simulate_ber_point
+
+
+@pytest.mark.parametrize("mod_scheme", ["2-PSK", "4-PSK"])
+@pytest.mark.parametrize("ebn0_db", [4.0, 6.0])
+def test_gray_psk_matches_theory(mod_scheme, ebn0_db):
+    point = simulate_ber_point(mod_scheme, "Gray", ebn0_db, min_errors=2000, seed=1)
+    theory = 0.5 * erfc(np.sqrt(10 ** (ebn0_db / 10)))
+
+    # 2000 errors: ~2 % standard deviation of the estimate
+    assert point.ber == pytest.approx(theory, rel=0.1)
+    assert point.bit_errors >= 2000 and point.bits < 10_000_000
+
+
+def test_stops_in_the_batch_that_reaches_min_errors():
+    point = simulate_ber_point("4-PSK", "Gray", 3.0, min_errors=300, batch_bits=1000, seed=2)
+    assert point.bit_errors >= 300
+
+    # The same bits and noise one batch earlier: still below min_errors
+    earlier = simulate_ber_point("4-PSK", "Gray", 3.0, min_errors=10 ** 9, max_bits=point.bits - 1000,
+                                 batch_bits=1000, seed=2)
+    assert earlier.bit_errors < 300
+
+
+def test_stops_at_the_bit_budget():
+    point = simulate_ber_point("2-PSK", "Gray", 20.0, min_errors=100, max_bits=10_000, batch_bits=1000, seed=3)
+    assert (point.bits, point.bit_errors, point.ber) == (10_000, 0, 0.0)
+
+
+def test_sweep_is_sorted_and_reports_every_point():
+    finished = []
+    results = run_ber_sweep(["4-PSK", "2-PSK"], ["Gray"], [6.0, 2.0], min_errors=50, workers=1,
+                            progress_callback=finished.append)
+
+    assert [(p.mod_scheme, p.ebn0_db) for p in results] == [("2-PSK", 2.0), ("2-PSK", 6.0),
+                                                           ("4-PSK", 2.0), ("4-PSK", 6.0)]
+    assert sorted(finished, key=lambda p: (p.mod_scheme, p.ebn0_db)) == results
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json"])
+def test_export_round_trip(tmp_path, suffix):
+    results = [simulate_ber_point("4-PSK", mapper, 5.0, min_errors=20, seed=4) for mapper in ("Gray", "Binary")]
+    path = tmp_path / f"ber{suffix}"
+    export_ber_results(results, path)
+
+    if suffix == ".json":
+        rows = json.loads(path.read_text())
+    else:
+        with open(path, newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+
+    types = {name: field.type for name, field in BERPoint.__dataclass_fields__.items()}
+    loaded = [BERPoint(**{name: types[name](value) for name, value in row.items()}) for row in rows]
+    assert loaded == results
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from src.modules.carrier_recovery import CarrierOffsetEstimator
+from src.modules.quadrature_modulator import NCOMixer
+
+
+FS = 1000.0
+
+
+def rotate(symbols, freq_offset, phase_offset, noise=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    n = np.arange(len(symbols))
+    noise = noise * (rng.standard_normal(len(symbols)) + 1j * rng.standard_normal(len(symbols)))
+    return symbols * np.exp(1j * (2 * np.pi * freq_offset * n / FS + phase_offset)) + noise
+
+
+@pytest.fixture
+def bpsk():
+    return np.random.default_rng(3).choice([-1.0, 1.0], 4000).astype(complex)
+
+
+@pytest.mark.parametrize("freq_offset", [-37.3, 2.1, 120.0])
+def test_data_aided_estimate(bpsk, freq_offset):
+    received = rotate(bpsk, freq_offset, 0.8)
+    estimate = CarrierOffsetEstimator(FS).estimate(received, reference=bpsk)
+
+    assert estimate.freq_offset == pytest.approx(freq_offset, abs=0.01)
+    assert estimate.phase_offset == pytest.approx(0.8, abs=0.02)
+
+
+def test_non_data_aided_estimate(bpsk):
+    # Squaring removes BPSK --> frequency unique up to fs / 4, phase up to pi
+    received = rotate(bpsk, 55.5, 0.3)
+    estimate = CarrierOffsetEstimator(FS, modulation_order=2).estimate(received)
+
+    assert estimate.freq_offset == pytest.approx(55.5, abs=0.01)
+    assert estimate.phase_offset == pytest.approx(0.3, abs=0.02)
+
+
+def test_pilot_estimate_from_sparse_samples(bpsk):
+    received = rotate(bpsk, 1.5, -0.4)
+    pilot_idx = np.arange(0, len(bpsk), 16)
+    estimate = CarrierOffsetEstimator(FS).estimate(received[pilot_idx], reference=bpsk[pilot_idx],
+                                                   sample_idx=pilot_idx)
+
+    assert estimate.freq_offset == pytest.approx(1.5, abs=0.05)
+    assert estimate.phase_offset == pytest.approx(-0.4, abs=0.05)
+
+
+def test_correct_removes_the_rotation(bpsk):
+    received = rotate(bpsk, -20.0, 1.1, noise=0.0)
+    estimator = CarrierOffsetEstimator(FS)
+    estimate = estimator.estimate(received[:500], reference=bpsk[:500])
+
+    # Correction of a later segment continues the estimated phase
+    corrected = estimator.correct(received[1000:], estimate, start_idx=1000)
+    np.testing.assert_allclose(corrected, bpsk[1000:], atol=1e-6)
+
+
+def test_nco_mixer_is_phase_continuous_between_blocks():
+    signal = np.exp(2j * np.pi * 123.4 * np.arange(1000) / FS)
+
+    whole = NCOMixer(123.4, FS).mix(signal)
+    mixer = NCOMixer(123.4, FS)
+    blocks = np.concatenate([mixer.mix(signal[start:start + 333]) for start in range(0, 1000, 333)])
+
+    np.testing.assert_allclose(whole, np.ones(1000), atol=1e-9)
+    np.testing.assert_allclose(blocks, whole, atol=1e-9)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from src.modules.channel import (AcousticChannel, AWGNEffect, ClockDriftEffect, DCOffsetEffect,
+                                 GainEffect, MultipathEffect)
+
+
+@pytest.fixture
+def tone():
+    return np.sin(2 * np.pi * 0.01 * np.arange(5000))
+
+
+def test_gain_and_dc_offset(tone):
+    channel = AcousticChannel([GainEffect(6.0), DCOffsetEffect(0.25)])
+    np.testing.assert_allclose(channel.simulate(tone), tone * 10 ** (6 / 20) + 0.25)
+
+
+def test_parameter_ranges_are_drawn_per_realization(tone):
+    received = AcousticChannel([GainEffect((-6.0, 6.0))], seed=1).simulate(tone, num_realizations=50)
+    gains_db = 20 * np.log10(np.max(np.abs(received), axis=1))
+
+    assert received.shape == (50, len(tone))
+    assert np.all((gains_db > -6.01) & (gains_db < 6.01))
+    assert len(np.unique(np.round(gains_db, 6))) == 50
+
+
+@pytest.mark.parametrize("complex_signal", [False, True])
+def test_awgn_snr(tone, complex_signal):
+    signal = tone * np.exp(1j * 0.3) if complex_signal else tone
+    received = AcousticChannel([AWGNEffect(10.0)], seed=2).simulate(signal, num_realizations=20)
+
+    noise = received - signal
+    snr_db = 10 * np.log10(np.mean(np.abs(signal) ** 2) / np.mean(np.abs(noise) ** 2))
+    assert np.iscomplexobj(received) == complex_signal
+    assert snr_db == pytest.approx(10.0, abs=0.1)
+
+
+def test_multipath_is_a_causal_convolution(tone):
+    rirs = np.random.default_rng(3).standard_normal((4, 300))
+    batch = np.stack([tone] * 4)
+
+    received = AcousticChannel([MultipathEffect(rirs)]).simulate(batch)
+    for row, rir in zip(received, rirs):
+        np.testing.assert_allclose(row, np.convolve(tone, rir)[:len(tone)], atol=1e-9)
+
+
+@pytest.mark.parametrize("ppm", [2000, -2000])
+def test_clock_drift_resamples_the_signal(tone, ppm):
+    offset = 3.5
+    received = AcousticChannel([ClockDriftEffect(ppm, start_offset=offset)]).simulate(tone)
+
+    positions = (np.arange(len(tone)) + offset) / (1 + ppm * 1e-6)
+    inside = slice(10, int(positions.searchsorted(len(tone) - 10)))
+    np.testing.assert_allclose(received[inside], np.sin(2 * np.pi * 0.01 * positions[inside]), atol=1e-5)
+
+    # Length is kept, beyond the end of the transmitted signal: silence
+    assert len(received) == len(tone)
+    np.testing.assert_array_equal(received[positions > len(tone) + 2], 0)
+
+
+def test_seed_makes_runs_reproducible(tone):
+    def run(seed):
+        channel = AcousticChannel(seed=seed)
+        channel.add_effect(GainEffect((-3.0, 3.0))).add_effect(AWGNEffect((5.0, 20.0)))
+        return channel.simulate(tone, num_realizations=8)
+
+    np.testing.assert_array_equal(run(7), run(7))
+    assert not np.allclose(run(7), run(8))
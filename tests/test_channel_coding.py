@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.modules.channel_coding import ConvolutionalCode, ReedSolomonCode
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+# ---- Reed-Solomon ----
+@pytest.mark.parametrize("num_bits", [8, 1000, 223 * 8, 223 * 8 * 3 + 5])
+def test_reed_solomon_round_trip_strips_byte_padding(rng, num_bits):
+    code = ReedSolomonCode(nsym=32)
+    bits = rng.integers(0, 2, num_bits).astype(np.int8)
+
+    decoded = code.decode(code.encode(bits), num_bits=num_bits)
+
+    np.testing.assert_array_equal(decoded, bits)
+
+
+def test_reed_solomon_decode_does_not_depend_on_the_last_encode(rng):
+    code = ReedSolomonCode(nsym=16)
+    first = rng.integers(0, 2, 1003).astype(np.int8)
+    coded = code.encode(first)
+    code.encode(rng.integers(0, 2, 77).astype(np.int8))
+
+    # Shared instance: the length comes with the frame, not from the code
+    np.testing.assert_array_equal(code.decode(coded, num_bits=1003), first)
+    np.testing.assert_array_equal(ReedSolomonCode(nsym=16).decode(coded, num_bits=1003), first)
+
+    # Without a length the padding to full bytes stays
+    assert len(code.decode(coded)) == 1008
+    assert not hasattr(code, "payload_bits")
+
+
+def test_reed_solomon_corrects_byte_errors(rng):
+    code = ReedSolomonCode(nsym=32)
+    bits = rng.integers(0, 2, 223 * 8 * 4).astype(np.int8)
+    coded = np.packbits(code.encode(bits.copy()).astype(np.uint8))
+
+    # 16 byte errors per codeword = correction limit
+    for codeword in range(4):
+        positions = rng.choice(255, 16, replace=False) + codeword * 255
+        coded[positions] ^= rng.integers(1, 256, 16).astype(np.uint8)
+
+    decoded = code.decode(np.unpackbits(coded).astype(np.int8), num_bits=len(bits))
+
+    np.testing.assert_array_equal(decoded, bits)
+    assert code.last_decode_failures == 0
+
+
+def test_reed_solomon_rejects_invalid_parity():
+    with pytest.raises(ValueError):
+        ReedSolomonCode(nsym=1)
+
+
+# ---- Convolutional + Viterbi ----
+def test_convolutional_output_length():
+    code = ConvolutionalCode()
+    assert len(code.encode(np.zeros(100, dtype=np.int8))) == 2 * (100 + code.K - 1)
+
+
+def test_viterbi_hard_decision_corrects_spread_errors(rng):
+    code = ConvolutionalCode()
+    bits = rng.integers(0, 2, 2000).astype(np.int8)
+    coded = code.encode(bits)
+
+    # Isolated errors, far apart (free distance 10 --> up to 4 per window)
+    coded[::50] ^= 1
+
+    np.testing.assert_array_equal(code.decode_hard(coded), bits)
+
+
+def test_viterbi_soft_decision_batch(rng):
+    code = ConvolutionalCode()
+    bits = rng.integers(0, 2, (4, 300)).astype(np.int8)
+    soft = np.stack([2.0 * code.encode(row) - 1.0 for row in bits])
+    soft += rng.normal(0, 0.5, soft.shape)
+
+    np.testing.assert_array_equal(code.decode(soft), bits)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from scipy.signal import upfirdn
+
+from src.constants import DEFAULT_FS
+from src.dataclasses.container_io import ALIGNMENT, load_container, load_containers, save_container, save_containers
+from src.dataclasses.dataclass_models import BandpassSignal, BasebandSignal, BitStream, PulseSignal, SymbolStream
+from src.modules.helper_functions import create_mod_scheme_lut
+from src.modules.pulse_shapes import RaisedCosinePulse
+from src.modules.quadrature_modulator import QuadratureModulator
+from src.modules.symbol_sequencer import SymbolSequencer
+
+
+@pytest.fixture
+def bandpass():
+    """Complete chain: bandpass --> baseband --> pulse + symbols --> bits + LUT."""
+    mod_scheme = create_mod_scheme_lut("8-PSK", "Gray")
+    pulse = PulseSignal(name="Raised Cosine Pulse", data=RaisedCosinePulse(100, DEFAULT_FS, 4, 0.35).generate(),
+                        fs=DEFAULT_FS, sym_rate=100, shape="raised_cosine", span=4, roll_off=0.35)
+    bits = np.random.default_rng(6).integers(0, 2, 300).astype(np.int8)
+    symbols = SymbolSequencer(mod_scheme).map_bits_to_symbols(bits)
+
+    baseband = BasebandSignal(
+        name="Baseband Signal",
+        data=upfirdn(pulse.data, symbols, up=DEFAULT_FS // 100),
+        fs=DEFAULT_FS,
+        sym_rate=100,
+        pulse=pulse,
+        symbol_stream=SymbolStream(name="Symbol Stream", data=symbols, mod_scheme=mod_scheme,
+                                   bit_stream=BitStream(name="Bit Stream", data=bits))
+    )
+    return BandpassSignal(name="Bandpass Signal", data=QuadratureModulator(4400).modulate(baseband), fs=DEFAULT_FS,
+                          sym_rate=100, baseband_signal=baseband, carrier_freq=4400)
+
+
+def assert_same_signal(loaded, original):
+    assert type(loaded) is type(original)
+    assert (loaded.name, loaded.fs, loaded.sym_rate, loaded.carrier_freq) == \
+           (original.name, original.fs, original.sym_rate, original.carrier_freq)
+    np.testing.assert_array_equal(loaded.data, original.data)
+
+    baseband, original_baseband = loaded.baseband_signal, original.baseband_signal
+    np.testing.assert_array_equal(baseband.data, original_baseband.data)
+    np.testing.assert_array_equal(baseband.pulse.data, original_baseband.pulse.data)
+    assert baseband.pulse.roll_off == original_baseband.pulse.roll_off
+
+    symbols, original_symbols = baseband.symbol_stream, original_baseband.symbol_stream
+    np.testing.assert_array_equal(symbols.data, original_symbols.data)
+    np.testing.assert_array_equal(symbols.bit_stream.data, original_symbols.bit_stream.data)
+    assert symbols.mod_scheme.look_up_table == original_symbols.mod_scheme.look_up_table
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_container_round_trip(tmp_path, bandpass, mmap):
+    path = save_container(tmp_path / "bandpass.adtc", bandpass)
+    loaded = load_container(path, mmap=mmap)
+
+    assert_same_signal(loaded, bandpass)
+    assert isinstance(loaded.data, np.memmap) == mmap
+    assert loaded.data.dtype == bandpass.data.dtype
+
+
+def test_session_shares_containers(tmp_path, bandpass):
+    baseband = bandpass.baseband_signal
+    session = {"pulse": baseband.pulse, "baseband": baseband, "bandpass": bandpass}
+
+    loaded = load_containers(save_containers(tmp_path / "session.adtc", session))
+
+    assert set(loaded) == set(session)
+    assert_same_signal(loaded["bandpass"], bandpass)
+    # Shared containers are stored once and shared again after loading
+    assert loaded["bandpass"].baseband_signal is loaded["baseband"]
+    assert loaded["baseband"].pulse is loaded["pulse"]
+
+
+def test_buffers_are_aligned(tmp_path, bandpass):
+    loaded = load_container(save_container(tmp_path / "bandpass.adtc", bandpass))
+    assert loaded.data.offset % ALIGNMENT == 0
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.adtc"
+    path.write_bytes(b"RIFF0000WAVE")
+    with pytest.raises(ValueError):
+        load_container(path)
@@ -0,0 +1,91 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("PySide6")
+
+from src.core.job_scheduler import JobScheduler
+
+
+@pytest.fixture
+def scheduler(qt_app):
+    scheduler = JobScheduler(workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def run_until_idle(qt_app, scheduler, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while scheduler.is_busy():
+        assert time.monotonic() < deadline, "Jobs did not finish"
+        qt_app.processEvents()
+        time.sleep(0.002)
+    qt_app.processEvents()
+
+
+def blocking_job(job, gate: threading.Event, value):
+    """Waits for the gate, then checks for cancellation like a long DSP step."""
+    gate.wait(5.0)
+    job.report(1.0)
+    return value
+
+
+def test_newest_request_per_stage_wins(qt_app, scheduler):
+    gate = threading.Event()
+    results = []
+
+    scheduler.submit("baseband", blocking_job, gate, "first", on_result=results.append)
+    time.sleep(0.05)                                # Running
+    scheduler.submit("baseband", blocking_job, gate, "second", on_result=results.append)
+    scheduler.submit("baseband", blocking_job, gate, "third", on_result=results.append)
+    gate.set()
+
+    run_until_idle(qt_app, scheduler)
+    assert results == ["third"]
+
+
+def test_results_are_delivered_on_the_gui_thread(qt_app, scheduler):
+    threads = []
+    scheduler.submit("plot", lambda job: threading.get_ident(), on_result=lambda worker: threads.append(
+        (worker, threading.get_ident())))
+
+    run_until_idle(qt_app, scheduler)
+    (worker_thread, delivery_thread), = threads
+    assert worker_thread != delivery_thread == threading.get_ident()
+
+
+def test_cancels_dependent_stages(qt_app, scheduler):
+    gate = threading.Event()
+    results = []
+
+    scheduler.submit("bandpass", blocking_job, gate, "stale bandpass", on_result=results.append)
+    time.sleep(0.05)
+    scheduler.submit("baseband", lambda job: "baseband", on_result=results.append, cancels=("bandpass",))
+    gate.set()
+
+    run_until_idle(qt_app, scheduler)
+    assert results == ["baseband"]
+
+
+def test_failures_are_reported_and_busy_state_clears(qt_app, scheduler):
+    failures, busy = [], []
+    scheduler.job_failed.connect(lambda stage, message: failures.append((stage, message)))
+    scheduler.busy_changed.connect(busy.append)
+
+    scheduler.submit("baseband", lambda job: 1 / 0, on_result=pytest.fail)
+    run_until_idle(qt_app, scheduler)
+
+    assert failures[0][0] == "baseband" and "ZeroDivisionError" in failures[0][1]
+    assert busy == [True, False]
+    assert not scheduler.is_busy("baseband")
+
+
+def test_stages_run_in_parallel(qt_app, scheduler):
+    gate = threading.Event()
+    results = []
+
+    scheduler.submit("a", blocking_job, gate, "a", on_result=results.append)
+    scheduler.submit("b", lambda job: gate.set() or "b", on_result=results.append)
+
+    run_until_idle(qt_app, scheduler)
+    assert sorted(results) == ["a", "b"]
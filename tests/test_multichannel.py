@@ -0,0 +1,33 @@
+import numpy as np
+
+from src.constants import DEFAULT_FS
+from src.modules.helper_functions import create_mod_scheme_lut, create_pulse_signal
+from src.modules.multichannel import create_channel_signals, split_bits, stack_channels
+from src.modules.packetizer import create_bandpass_signal
+
+
+def test_split_bits_keeps_the_order():
+    bits = np.arange(11) % 2
+    parts = split_bits(bits, 3)
+
+    assert [len(part) for part in parts] == [4, 4, 3]
+    np.testing.assert_array_equal(np.concatenate(parts), bits)
+
+
+def test_stack_channels_zero_pads_shorter_channels():
+    stacked = stack_channels([np.ones(5), 2 * np.ones(3)])
+
+    assert stacked.shape == (5, 2)
+    np.testing.assert_array_equal(stacked[:, 1], [2, 2, 2, 0, 0])
+
+
+def test_channel_signals_equal_single_channel_transmissions():
+    mod_scheme = create_mod_scheme_lut("4-PSK", "Gray")
+    pulse = create_pulse_signal("raised_cosine", 100, DEFAULT_FS, 4, 0.5)
+    parts = split_bits(np.random.default_rng(2).integers(0, 2, 101), 2)
+
+    signals = create_channel_signals(parts, mod_scheme, pulse, 3000)
+
+    assert [bandpass.name.split(":")[0] for bandpass in signals] == ["Channel 1/2", "Channel 2/2"]
+    for bandpass, bits in zip(signals, parts):
+        np.testing.assert_array_equal(bandpass.data, create_bandpass_signal(bits, mod_scheme, pulse, 3000).data)
@@ -0,0 +1,76 @@
+import zlib
+import numpy as np
+import pytest
+
+from src.constants import DEFAULT_FS
+from src.modules.helper_functions import create_mod_scheme_lut, create_pulse_signal
+from src.modules.packetizer import (Packetizer, crc32_bits, crc32_bytes, create_framed_bandpass_signal,
+                                    modulate_frames)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1)
+
+
+@pytest.fixture
+def chain():
+    return (create_mod_scheme_lut("4-PSK", "Gray"),
+            create_pulse_signal("raised_cosine", 100, DEFAULT_FS, 4, 0.5))
+
+
+# ---- CRC-32 ----
+def test_crc32_matches_zlib(rng):
+    for length in (0, 1, 7, 64, 1000):
+        data = rng.integers(0, 256, length).astype(np.uint8)
+        assert int(crc32_bytes(data)) == zlib.crc32(data.tobytes())
+
+
+def test_crc32_vectorized_rows(rng):
+    rows = rng.integers(0, 256, (5, 33)).astype(np.uint8)
+    np.testing.assert_array_equal(crc32_bytes(rows), [zlib.crc32(row.tobytes()) for row in rows])
+
+
+def test_crc32_bits_pads_to_bytes():
+    bits = np.array([1, 0, 1], dtype=np.int8)
+    assert crc32_bits(bits) == zlib.crc32(bytes([0b10100000]))
+
+
+# ---- Packetizer ----
+def test_packetize_round_trip_drops_corrupted_frames(rng):
+    packetizer = Packetizer(payload_bits=100)
+    bits = rng.integers(0, 2, 1050).astype(np.int8)
+
+    frames = packetizer.packetize(bits)
+    assert len(frames) == 11
+    assert len(frames[-1]) == Packetizer.HEADER_BITS + 50 + Packetizer.CRC_BITS
+
+    received = [packetizer.depacketize(frame) for frame in frames]
+    assert all(frame.crc_ok for frame in received)
+    np.testing.assert_array_equal(Packetizer.reassemble(received[::-1]), bits)
+
+    corrupted = frames[3].copy()
+    corrupted[Packetizer.HEADER_BITS + 10] ^= 1
+    assert not packetizer.depacketize(corrupted).crc_ok
+
+
+def test_invalid_payload_length():
+    with pytest.raises(ValueError):
+        Packetizer(payload_bits=0)
+
+
+# ---- Frame Modulation ----
+def test_framed_bandpass_matches_modulate_frames(rng, chain):
+    mod_scheme, pulse = chain
+    bits = rng.integers(0, 2, 500).astype(np.int8)
+
+    bandpass = create_framed_bandpass_signal(bits, mod_scheme, pulse, 4400, payload_bits=200, guard_time=0.01)
+
+    frames = Packetizer(200).packetize(bits)
+    expected, starts = modulate_frames(frames, mod_scheme, pulse, 4400, guard_time=0.01, workers=1)
+
+    np.testing.assert_allclose(bandpass.data, expected)
+    assert len(starts) == 3
+    assert len(bandpass.baseband_signal.data) == len(bandpass.data)
+    # All frame bits incl. header and CRC are mapped (2 bits per 4-PSK symbol)
+    assert len(bandpass.baseband_signal.symbol_stream.bit_stream.data) == sum(len(frame) for frame in frames)
@@ -0,0 +1,174 @@
+import time
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from scipy.signal import upfirdn
+
+pytest.importorskip("pyqtgraph")
+
+from src.dataclasses.dataclass_models import BasebandSignal, PulseSignal
+from src.modules.pulse_shapes import RaisedCosinePulse
+from src.ui.plot_strategies import EyeDiagramPlotStrategy, MinMaxPyramid, PlotManager, PlotStrategy, \
+    TimeSignalPlotStrategy
+
+
+# ---- Eye Diagram ----
+@pytest.fixture
+def bpsk_baseband():
+    pulse = PulseSignal(name="Raised Cosine Pulse", data=RaisedCosinePulse(100, 8000, 6, 0.5).generate(), fs=8000,
+                        sym_rate=100, shape="raised_cosine", span=6, roll_off=0.5)
+    symbols = np.random.default_rng(6).choice([-1.0, 1.0], 300)
+    return BasebandSignal(name="BPSK", data=upfirdn(pulse.data, symbols, up=80).astype(complex), fs=8000,
+                          sym_rate=100, pulse=pulse, symbol_stream=None)
+
+
+def test_eye_traces_are_two_symbol_views(bpsk_baseband):
+    sps, traces = EyeDiagramPlotStrategy()._eye_traces(bpsk_baseband)
+    offset = (len(bpsk_baseband.pulse.data) // 2) % sps
+
+    assert sps == 80 and traces.shape[1] == 2 * sps
+    assert len(traces) == (len(bpsk_baseband.data) - offset - 2 * sps) // sps + 1
+    assert np.shares_memory(traces, traces.base) and not traces.flags.writeable
+
+
+def test_persistence_counts_every_sample(bpsk_baseband):
+    strategy = EyeDiagramPlotStrategy(amplitude_bins=101, max_time_bins=100, traces_per_block=7)
+    _, traces = strategy._eye_traces(bpsk_baseband)
+    counts = strategy._persistence(traces, -1.5, 1.5)
+
+    assert counts.shape == (100, 101)
+    assert counts.sum() == traces.size
+
+
+def test_ideal_eye_is_open_at_the_symbol_instant(bpsk_baseband):
+    strategy = EyeDiagramPlotStrategy(amplitude_bins=101)
+    sps, traces = strategy._eye_traces(bpsk_baseband)
+    counts = strategy._persistence(traces, -1.5, 1.5)
+
+    # Symbol instants at the trace start and center, amplitude bins of 0.03
+    amplitudes = -1.5 + np.arange(101) * 3.0 / 100
+    center = counts[sps * counts.shape[0] // (2 * sps)]
+    peaks = sorted(amplitudes[np.argsort(center)[-2:]])
+    np.testing.assert_allclose(peaks, [-1.0, 1.0], atol=0.03)
+    # Apart from the ramps at both signal ends all traces pass through +-1
+    assert center[np.abs(np.abs(amplitudes) - 1) < 0.05].sum() >= len(traces) - 6
+
+
+# ---- Min / Max Pyramid ----
+@pytest.fixture
+def noise():
+    return np.random.default_rng(7).standard_normal(1_000_003)
+
+
+def test_pyramid_returns_raw_samples_within_the_budget(noise):
+    pyramid = MinMaxPyramid(noise)
+    positions, values = pyramid.query(5000, 8000, max_points=4000)
+
+    np.testing.assert_array_equal(positions, np.arange(5000, 8000))
+    np.testing.assert_array_equal(values, noise[5000:8000].astype(np.float32))
+
+
+@pytest.mark.parametrize("max_points", [512, 1000, 4000])
+def test_pyramid_point_count_is_bounded(noise, max_points):
+    pyramid = MinMaxPyramid(noise)
+    rng = np.random.default_rng(8)
+
+    for start, stop in [(0, len(noise)), (1, len(noise) - 1), *np.sort(rng.integers(0, len(noise), (50, 2)))]:
+        positions, values = pyramid.query(start, stop, max_points)
+        assert len(positions) == len(values) <= max_points
+
+
+def test_pyramid_keeps_single_sample_spikes_at_every_level():
+    data = np.zeros(1_000_000)
+    data[123_457] = 5.0
+    data[876_543] = -4.0
+    pyramid = MinMaxPyramid(data)
+
+    assert len(pyramid.levels) > 5
+    for _, mins, maxs in pyramid.levels:
+        assert maxs.max() == 5.0 and mins.min() == -4.0
+
+    for max_points in (512, 4000, 20000):
+        for start, stop in [(0, len(data)), (100_000, 900_000), (123_000, 124_000)]:
+            _, values = pyramid.query(start, stop, max_points)
+            assert values.max() == 5.0
+            if stop > 876_543:
+                assert values.min() == -4.0
+
+
+# ---- Plot Manager ----
+@pytest.fixture
+def widget(qt_app):
+    from src.ui.plot_widgets import PlotWidget
+    widget = PlotWidget()
+    yield widget
+    widget.close()
+    widget.deleteLater()
+    qt_app.processEvents()
+
+
+class CountingStrategy(PlotStrategy):
+    def __init__(self):
+        super().__init__()
+        self.models = []
+
+    def plot(self, widget, signal_model):
+        self.models.append(signal_model)
+
+
+def process_events(qt_app, duration):
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.005)
+
+
+def test_hidden_views_render_once_when_shown(qt_app, widget):
+    manager = PlotManager(widget)
+    strategy = CountingStrategy()
+    manager.set_strategy(strategy)
+
+    for model in ("first", "second", "third"):
+        manager.update_plot(model)
+    process_events(qt_app, 0.1)
+    assert strategy.models == []
+
+    widget.show()
+    process_events(qt_app, 0.1)
+    assert strategy.models == ["third"]
+
+    # Several updates within one frame: one render with the newest model
+    for model in ("fourth", "fifth"):
+        manager.update_plot(model)
+    process_events(qt_app, 0.1)
+    assert strategy.models == ["third", "fifth"]
+
+
+# ---- Time Signal ----
+def test_plot_items_are_updated_in_place(widget):
+    strategy = TimeSignalPlotStrategy()
+    plot_item = widget.plot_widget.getPlotItem()
+
+    strategy.plot(widget, SimpleNamespace(name="complex", fs=1000, data=np.exp(1j * np.arange(5000) / 50)))
+    curves = list(strategy.curves)
+    num_items = len(plot_item.items)
+
+    strategy.plot(widget, SimpleNamespace(name="real", fs=1000, data=np.ones(3000)))
+    assert len(plot_item.items) == num_items
+    assert strategy.curves[0] is curves[0]
+    assert not strategy._items["imag"].isVisible()
+
+
+def test_zoomed_time_axis_resolves_every_sample(widget):
+    fs = 48000
+    strategy = TimeSignalPlotStrategy()
+    strategy.plot(widget, SimpleNamespace(name="long", fs=fs, data=np.broadcast_to(np.float32(0.5), (20_000_000,))))
+
+    # 50 samples at the end of a 416 s signal: float32 would merge neighbouring time stamps
+    start = 19_999_900
+    strategy._on_x_range_changed(None, (start / fs, (start + 49) / fs))
+    x = strategy.curves[0].xData
+    visible = x[(x >= start / fs) & (x <= (start + 49) / fs)]
+
+    assert x.dtype == np.float64
+    assert len(np.unique(visible)) == len(visible) == 50
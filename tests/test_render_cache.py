@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pytest
+
+from src.constants import DEFAULT_FS
+from src.modules.channel_coding import ConvolutionalCode
+from src.modules.helper_functions import create_mod_scheme_lut, create_pulse_signal
+from src.modules.packetizer import create_bandpass_signal
+from src.modules.render_cache import RenderCache, render_key
+
+
+@pytest.fixture
+def chain():
+    return (create_mod_scheme_lut("4-PSK", "Gray"),
+            create_pulse_signal("raised_cosine", 100, DEFAULT_FS, 4, 0.5))
+
+
+@pytest.fixture
+def bits():
+    return np.random.default_rng(2).integers(0, 2, 200).astype(np.int8)
+
+
+def test_key_covers_all_inputs(chain, bits):
+    mod_scheme, pulse = chain
+    key = render_key(bits, mod_scheme, pulse, 4400)
+
+    assert key == render_key(bits.copy(), mod_scheme, pulse, 4400)
+    flipped = bits.copy()
+    flipped[-1] ^= 1
+    others = [
+        render_key(flipped, mod_scheme, pulse, 4400),
+        render_key(bits[:-1], mod_scheme, pulse, 4400),
+        render_key(bits, mod_scheme, pulse, 8800),
+        render_key(bits, create_mod_scheme_lut("4-PSK", "Binary"), pulse, 4400),
+        render_key(bits, mod_scheme, create_pulse_signal("raised_cosine", 100, DEFAULT_FS, 4, 0.25), 4400),
+        render_key(bits, mod_scheme, pulse, 4400, codes=[ConvolutionalCode()]),
+        render_key(bits, mod_scheme, pulse, 4400, framing={"payload_bits": 64}),
+    ]
+    assert len({key, *others}) == len(others) + 1
+
+
+def test_entries_store_float32_audio_and_baseband(chain, bits, tmp_path):
+    mod_scheme, pulse = chain
+    signal = create_bandpass_signal(bits, mod_scheme, pulse, 4400)
+    cache = RenderCache(tmp_path)
+    key = render_key(bits, mod_scheme, pulse, 4400)
+
+    assert cache.get(key) is None
+    cache.put(key, signal)
+    cached = cache.get(key)
+
+    assert cached.data.dtype == np.float32
+    np.testing.assert_allclose(cached.data, signal.data, atol=1e-5)
+    assert cached.baseband_signal.data.dtype == np.complex64
+    np.testing.assert_allclose(cached.baseband_signal.data, signal.baseband_signal.data, atol=1e-5)
+    np.testing.assert_array_equal(cached.baseband_signal.symbol_stream.data, signal.baseband_signal.symbol_stream.data)
+    # Audio + baseband + small header
+    assert cache.size < signal.data.size * 12 + len(bits) * 16 + 64 * 1024
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(chain, tmp_path):
+    mod_scheme, pulse = chain
+    rng = np.random.default_rng(3)
+    signals = [create_bandpass_signal(rng.integers(0, 2, 100), mod_scheme, pulse, 4400) for _ in range(3)]
+    entry_size = signals[0].data.size * 12
+
+    cache = RenderCache(tmp_path, max_bytes=int(2.5 * entry_size) + 64 * 1024)
+    for index, signal in enumerate(signals[:2]):
+        cache.put(f"key{index}", signal)
+        os.utime(cache._path(f"key{index}"), (index, index))
+
+    cache.get("key0")                       # Now the most recently used
+    cache.put("key2", signals[2])
+
+    assert cache.get("key1") is None
+    assert cache.get("key0") is not None and cache.get("key2") is not None
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from src.dataclasses.dataclass_models import PulseSignal
+from src.modules.spectrum import SpectrumEngine, StftTileCache, WelchEstimator
+
+
+@pytest.fixture
+def real_signal():
+    rng = np.random.default_rng(7)
+    t = np.arange(50000) / 48000
+    return np.sin(2 * np.pi * 4400 * t) + 0.1 * rng.standard_normal(len(t))
+
+
+# ---- Welch ----
+@pytest.mark.parametrize("complex_input", [False, True])
+def test_welch_matches_scipy(real_signal, complex_input):
+    data = signal.hilbert(real_signal) if complex_input else real_signal
+    estimator = WelchEstimator(nperseg=1024, overlap=0.5, block_segments=7)
+
+    freqs, psd = estimator.psd(data, 48000)
+    ref_freqs, ref_psd = signal.welch(data, fs=48000, nperseg=1024, noverlap=512, detrend=False,
+                                      return_onesided=not complex_input)
+    if complex_input:
+        ref_freqs, ref_psd = np.fft.fftshift(ref_freqs), np.fft.fftshift(ref_psd)
+
+    np.testing.assert_allclose(freqs, ref_freqs)
+    np.testing.assert_allclose(psd, ref_psd, rtol=1e-9, atol=1e-15)
+
+
+def test_welch_invalid_overlap():
+    with pytest.raises(ValueError):
+        WelchEstimator(overlap=1.0)
+
+
+def test_engine_memoizes_per_container(real_signal):
+    engine = SpectrumEngine(WelchEstimator(nperseg=256))
+    container = PulseSignal(name="Signal", data=real_signal, fs=48000, sym_rate=100, shape="rectangle")
+
+    first = engine.psd(container)
+    assert engine.psd(container) is first
+
+    container.data = real_signal[:1000]             # New data --> new estimate
+    assert engine.psd(container) is not first
+
+
+# ---- STFT Tiles ----
+@pytest.mark.parametrize("complex_input", [False, True])
+def test_stft_tiles_match_scipy_spectrogram(real_signal, complex_input):
+    data = signal.hilbert(real_signal) if complex_input else real_signal
+    cache = StftTileCache(nperseg=256, noverlap=128, tile_columns=16)
+
+    times, freqs, spectrogram_db = cache.columns(data, 48000)
+    ref_freqs, ref_times, ref_sxx = signal.spectrogram(data, fs=48000, window='hann', nperseg=256, noverlap=128,
+                                                       return_onesided=not complex_input)
+    if complex_input:
+        ref_freqs, ref_sxx = np.fft.fftshift(ref_freqs), np.fft.fftshift(ref_sxx, axes=0)
+
+    np.testing.assert_allclose(times, ref_times)
+    np.testing.assert_allclose(freqs, ref_freqs)
+    assert spectrogram_db.dtype == np.float32
+    # float32 tiles: compare in dB where the power is well above the floor
+    ref_db = 10 * np.log10(ref_sxx.T + 1e-10)
+    strong = ref_db > ref_db.max() - 60
+    np.testing.assert_allclose(spectrogram_db[strong], ref_db[strong], atol=0.05)
+
+
+def test_stft_only_changed_tiles_are_recomputed(real_signal):
+    cache = StftTileCache(nperseg=256, noverlap=128, tile_columns=16)
+    cache.columns(real_signal, 48000)
+    computed = cache.computed
+
+    edited = real_signal.copy()
+    edited[-100:] = 0                               # Touches the last tile(s) only
+    _, _, spectrogram_db = cache.columns(edited, 48000)
+
+    assert 1 <= cache.computed - computed <= 2
+    assert cache.reused >= computed - 2
+    _, _, fresh_db = StftTileCache(nperseg=256, noverlap=128, tile_columns=16).columns(edited, 48000)
+    np.testing.assert_array_equal(spectrogram_db, fresh_db)
+
+
+def test_stft_column_window(real_signal):
+    cache = StftTileCache(nperseg=256, noverlap=128, tile_columns=16)
+    _, _, full_db = cache.columns(real_signal, 48000)
+    times, _, window_db = cache.columns(real_signal, 48000, start_col=20, stop_col=45)
+
+    assert len(times) == 25
+    np.testing.assert_array_equal(window_db, full_db[20:45])
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.modules.timing_recovery import FarrowInterpolator, GardnerTED, MuellerMullerTED, SymbolTimingRecovery
+
+
+def raised_cosine_signal(symbols, sps, ppm=0.0, offset=0.0, beta=0.5, span=8):
+    """Matched filter output (raised cosine pulses), sampled by a receiver clock off by `ppm`."""
+    period = sps * (1 + ppm * 1e-6)
+    t = np.arange(int((len(symbols) + span) * period)) + offset * period
+    signal = np.zeros(len(t))
+    for k, symbol in enumerate(symbols):
+        tau = t / period - k - span / 2
+        window = np.abs(tau) <= span
+        tau = tau[window]
+        denominator = 1 - (2 * beta * tau) ** 2
+        pulse = np.where(np.abs(denominator) < 1e-8, np.pi / 4 * np.sinc(1 / (2 * beta)),
+                         np.cos(np.pi * beta * tau) / np.where(np.abs(denominator) < 1e-8, 1, denominator))
+        signal[window] += symbol * np.sinc(tau) * pulse
+    return signal
+
+
+@pytest.fixture
+def bpsk():
+    return np.random.default_rng(11).choice([-1.0, 1.0], 2000)
+
+
+def test_farrow_is_exact_for_cubic_polynomials():
+    n = np.arange(20, dtype=float)
+    x = 0.1 * n ** 3 - n ** 2 + 3 * n - 2
+    t = np.linspace(1, 17, 101)
+    np.testing.assert_allclose(FarrowInterpolator().interpolate(x, t), 0.1 * t ** 3 - t ** 2 + 3 * t - 2, rtol=1e-10)
+
+    batch = np.stack((x, 2 * x))
+    np.testing.assert_allclose(FarrowInterpolator().interpolate(batch, np.stack((t, t)))[1],
+                               2 * (0.1 * t ** 3 - t ** 2 + 3 * t - 2), rtol=1e-10)
+
+
+@pytest.mark.parametrize("ted", [GardnerTED(), MuellerMullerTED(np.array([-1, 1]))])
+@pytest.mark.parametrize("offset", [0.0, 0.3, 0.7])
+def test_recovers_symbols_with_clock_drift(bpsk, ted, offset):
+    sps = 8
+    recovery = SymbolTimingRecovery(sps, ted=ted)
+    symbols = recovery.process(raised_cosine_signal(bpsk, sps, ppm=300, offset=offset))
+
+    # Settled loop: symbols open the eye, the drift is tracked
+    settled = symbols[500:len(bpsk)]
+    assert np.min(np.abs(settled.real)) > 0.5
+    assert recovery.clock_offset_ppm == pytest.approx(300, abs=100)
+
+    # Decisions match the sent symbols (up to the delay of the pulse span)
+    decisions = np.sign(settled.real)
+    lags = [np.mean(decisions == np.roll(bpsk, shift)[500:len(bpsk)]) for shift in range(-2, 12)]
+    assert max(lags) == 1.0
+
+
+def test_chunked_processing_keeps_the_loop_state(bpsk):
+    signal = raised_cosine_signal(bpsk, 6.5, ppm=-200, offset=0.4)
+
+    whole_recovery = SymbolTimingRecovery(6.5)
+    whole = whole_recovery.process(signal)
+    chunked_recovery = SymbolTimingRecovery(6.5)
+    chunks = np.concatenate([chunked_recovery.process(signal[start:start + 777])
+                             for start in range(0, len(signal), 777)])
+
+    # Loop updates at the chunk ends differ (partial blocks), the symbols do not
+    assert abs(len(chunks) - len(whole)) <= 1
+    np.testing.assert_array_equal(np.sign(chunks[500:1900].real), np.sign(whole[500:1900].real))
+    assert chunked_recovery.clock_offset_ppm == pytest.approx(whole_recovery.clock_offset_ppm, abs=50)
+
+
+def test_needs_two_samples_per_symbol():
+    with pytest.raises(ValueError):
+        SymbolTimingRecovery(1.5)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from scipy.io import wavfile
+from scipy.signal import resample_poly
+
+from src.modules.wav_io import StreamingResampler, WavReader, WavWriter, write_wav_blocks
+
+
+@pytest.fixture
+def stereo():
+    rng = np.random.default_rng(4)
+    return rng.uniform(-1.5, 1.5, (10001, 2))
+
+
+# Tolerance: 2 LSB (written with full scale 2^(n-1) - 1, read back with 2^(n-1))
+@pytest.mark.parametrize("sample_format, tolerance", [("int16", 2 ** -14), ("int24", 2 ** -22), ("float32", 1e-7)])
+def test_block_wise_round_trip(tmp_path, stereo, sample_format, tolerance):
+    path = tmp_path / f"{sample_format}.wav"
+    blocks = (stereo[start:start + 999] for start in range(0, len(stereo), 999))
+    writer = write_wav_blocks(blocks, path, 48000, channels=2, sample_format=sample_format, peak=1.5)
+
+    assert writer.frames_written == len(stereo) and writer.clipped_samples == 0
+    with WavReader(path) as reader:
+        assert (reader.fs, reader.channels, len(reader)) == (48000, 2, len(stereo))
+        np.testing.assert_allclose(reader.read(), stereo / 1.5, atol=tolerance)
+        np.testing.assert_allclose(np.concatenate(list(reader.blocks(block_frames=4096))), stereo / 1.5, atol=tolerance)
+
+
+def test_files_are_readable_by_scipy(tmp_path, stereo):
+    for sample_format in ("int16", "float32"):
+        path = tmp_path / f"{sample_format}.wav"
+        write_wav_blocks([stereo], path, 44100, channels=2, sample_format=sample_format, peak=1.5)
+        fs, data = wavfile.read(path)
+        assert fs == 44100 and data.shape == stereo.shape
+
+
+def test_clipping_is_counted(tmp_path):
+    with WavWriter(tmp_path / "clip.wav", 8000) as writer:
+        writer.write(np.array([0.5, 1.5, -2.0]))
+    assert writer.clipped_samples == 2
+
+
+def test_channel_mismatch(tmp_path):
+    with WavWriter(tmp_path / "mono.wav", 8000) as writer:
+        with pytest.raises(ValueError):
+            writer.write(np.zeros((10, 2)))
+
+
+@pytest.mark.parametrize("fs_in, fs_out", [(44100, 48000), (48000, 16000)])
+def test_streaming_resampler_matches_resample_poly(fs_in, fs_out):
+    x = np.random.default_rng(5).standard_normal(20000)
+    resampler = StreamingResampler(fs_in, fs_out)
+
+    blocks = [resampler.process(x[start:start + 1234]) for start in range(0, len(x), 1234)]
+    y = np.concatenate(blocks + [resampler.flush()])
+
+    up, down = resampler.up, resampler.down
+    expected = resample_poly(x, up, down, window=("kaiser", 5.0))
+    assert len(y) == len(expected)
+    np.testing.assert_allclose(y, expected, atol=1e-5)